@@ -7,19 +7,38 @@ export behavior can be tested without starting the desktop UI.
 
 from __future__ import annotations
 
+import io
 import json
+import math
 import os
 import csv
-from dataclasses import dataclass
+import random
+import re
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from itertools import chain, islice, repeat
+from dataclasses import dataclass, field, fields, replace
 from decimal import Decimal, InvalidOperation
+from functools import cached_property, lru_cache
+from json.decoder import scanstring
 from pathlib import Path
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, Callable, Collection, Iterable, Iterator, List, Optional, Sequence, TextIO, Union
+from xml.sax.saxutils import escape as xml_escape
 
 from openpyxl import Workbook
 
 
 JsonData = Union[dict[str, Any], list[Any]]
+JsonEvent = tuple[str, Any]
 WILDCARD = Ellipsis
+STREAM_CHUNK_SIZE = 1024 * 1024
+STREAM_ROW_BATCH_SIZE = 256
+TRANSFORM_PLAN_CACHE_SIZE = 32
+TRANSFORM_VALIDATION_SAMPLE_SIZE = 1000
+DISCOVERY_SAMPLE_SIZE = 1000
+MAX_INTERNED_ROW_SHAPES = 4096
+CHECKPOINT_INTERVAL = 1000
 
 
 @dataclass(frozen=True)
@@ -40,6 +59,11 @@ class JsonNode:
     has_nested_arrays: bool = False
     exportable: bool = False
     warning: Optional[str] = None
+    estimated: bool = False
+
+    def _array_branches(self) -> Iterable["JsonNode"]:
+        """Children that can contain array candidates."""
+        return self.children
 
 
 @dataclass(frozen=True)
@@ -58,6 +82,7 @@ class ArrayCandidate:
     has_nested_arrays: bool = False
     exportable: bool = False
     warning: Optional[str] = None
+    estimated: bool = False
 
 
 @dataclass(frozen=True)
@@ -90,6 +115,42 @@ class TableData:
     def __len__(self) -> int:
         return len(self.rows)
 
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        """Yield cell values in column order, with ``None`` for missing keys."""
+        columns = self.columns
+        for row in self.rows:
+            yield tuple(row.get(column) for column in columns)
+
+
+@dataclass(frozen=True)
+class ExportedTable:
+    """Header and row count of a table written by ``write_array_to_file``."""
+
+    columns: tuple[str, ...]
+    row_count: int
+
+    def __len__(self) -> int:
+        return self.row_count
+
+
+@dataclass(frozen=True)
+class ArrayPathIndex:
+    """Displayed array paths mapped to structured paths and, for parsed data, the arrays."""
+
+    paths: dict[str, tuple[Any, ...]] = field(default_factory=dict)
+    arrays: dict[str, list[Any]] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class JsonAnalysis:
+    """Array keys, aggregate tree and export candidates collected in one pass."""
+
+    array_keys: list[str]
+    json_tree: JsonNode
+    array_candidates: list[ArrayCandidate]
+    array_paths: list[tuple[Any, ...]] = field(default_factory=list)
+    array_index: ArrayPathIndex = field(default_factory=ArrayPathIndex)
+
 
 @dataclass(frozen=True)
 class TableTransformOptions:
@@ -100,6 +161,16 @@ class TableTransformOptions:
     column_transforms: tuple["ColumnTransform", ...] = ()
 
 
+@dataclass(frozen=True)
+class TransformIssue:
+    """First value a column transform cannot convert."""
+
+    row_index: int
+    column: str
+    value: Any
+    message: str
+
+
 @dataclass(frozen=True)
 class ColumnTransform:
     """User-selected transformation for one output column."""
@@ -134,52 +205,68 @@ OUTPUT_FORMATS = {
 }
 
 
+EXCEL_WRITERS = ("openpyxl", "native")
+JSON_STYLES = ("pretty", "compact", "lines")
+EXPORT_BUFFER_SIZE = 1024 * 1024
+EXPORT_ROW_BATCH_SIZE = 1000
+XLSX_ROW_BATCH_SIZE = 1000
+
+
 class ArrayMateCoreError(ValueError):
     """Raised when data cannot be converted safely."""
 
 
+_MISSING = object()
+_SCALAR_TYPES = frozenset((int, float, bool, Decimal, type(None)))
+_LEAF_TYPES = _SCALAR_TYPES | {str}
+_NUMBER_TYPE = 1
+_INTEGER_TYPE = 2
+_BOOLEAN_TYPE = 4
+_ALL_VALUE_TYPES = _NUMBER_TYPE | _INTEGER_TYPE | _BOOLEAN_TYPE
+_TRUE_TEXT = frozenset(("true", "yes", "y", "1"))
+_FALSE_TEXT = frozenset(("false", "no", "n", "0"))
+_BOOLEAN_TEXT = _TRUE_TEXT | _FALSE_TEXT
+# Text accepted by Decimal() once underscores are removed, as Decimal() does.
+_INTEGER_TEXT_RE = re.compile(r"[+-]?\d+")
+_DECIMAL_TEXT_RE = re.compile(r"[+-]?(?:(?:\d+(?:\.\d*)?|\.\d+)(?:e[+-]?\d+)?|inf(?:inity)?|s?nan\d*)", re.IGNORECASE)
+# Leading whitespace then a formula prefix; text already quoted with "'" never matches.
+_FORMULA_TEXT_RE = re.compile(r"[ \t\r\n]*[=+\-@]")
+
+
 def find_arrays(data: JsonData, path: tuple[Any, ...] = ()) -> list[str]:
     """
-    Recursively find all arrays in JSON data.
+    Find all arrays in JSON data.
 
     Paths are displayed in the existing ArrayMate notation, such as
     ``orders[0].items``. The displayed path is kept for UI compatibility, while
     lookup uses the original object structure and does not parse the string.
     """
-    arrays: list[str] = []
-
-    if isinstance(data, dict):
-        for key, value in data.items():
-            current_path = path + (key,)
-            if isinstance(value, list):
-                arrays.append(format_path(current_path))
-                for index, item in enumerate(value):
-                    if isinstance(item, (dict, list)):
-                        arrays.extend(find_arrays(item, current_path + (index,)))
-            elif isinstance(value, dict):
-                arrays.extend(find_arrays(value, current_path))
-
-    elif isinstance(data, list):
-        if not path:
-            arrays.append("root")
-        for index, item in enumerate(data):
-            if isinstance(item, (dict, list)):
-                arrays.extend(find_arrays(item, path + (index,)))
+    return [format_path(array_path) for array_path in _collect_path_arrays(data, path).paths]
 
-    return arrays
 
-
-def get_array_data(data: JsonData, array_path: str) -> Optional[list[Any]]:
+def get_array_data(data: JsonData, array_path: str, index: Optional[ArrayPathIndex] = None) -> Optional[list[Any]]:
     """
     Return array data for a displayed path.
 
-    The resolver first rediscovers arrays and matches by formatted path. This
-    preserves support for keys containing spaces, hyphens, dots, and other
-    characters that cannot be represented safely by a regex split.
+    With an ``index`` from ``build_array_path_index`` or ``analyze_json`` the
+    lookup is a dictionary access. Without one, the resolver rediscovers arrays
+    and matches by formatted path. Both preserve support for keys containing
+    spaces, hyphens, dots, and other characters that cannot be represented
+    safely by a regex split.
     """
     if array_path == "root":
         return data if isinstance(data, list) else None
 
+    if index is not None:
+        array_data = index.arrays.get(array_path)
+        if array_data is not None:
+            return array_data
+        path = index.paths.get(array_path)
+        if path is None:
+            return None
+        values = _resolve_path_values(data, path)
+        return values[0] if len(values) == 1 and isinstance(values[0], list) else None
+
     for path in iter_array_paths(data):
         if format_path(path) == array_path:
             current: Any = data
@@ -202,106 +289,178 @@ def get_array_data_by_path(data: JsonData, path: tuple[Any, ...]) -> Optional[li
     return None
 
 
+def iter_array_data_by_path(data: JsonData, path: tuple[Any, ...]) -> Optional[Iterator[Any]]:
+    """Lazily yield the rows ``get_array_data_by_path`` would return, without flattening them into a list."""
+    values = _resolve_path_values(data, path)
+    if values and all(isinstance(value, list) for value in values):
+        return (item for value in values for item in value)
+    return None
+
+
 def get_array_data_with_parent_metadata(data: JsonData, path: tuple[Any, ...]) -> Optional[list[Any]]:
     """Return wildcard array rows with scalar parent fields attached as metadata columns."""
     if WILDCARD not in path:
         return get_array_data_by_path(data, path)
 
-    rows: list[Any] = []
-    _collect_rows_with_parent_metadata(data, path, rows, (), parent_columns_first=False)
+    rows = list(iter_array_data_with_parent_metadata(data, path))
     return rows if rows else None
 
 
+def iter_array_data_with_parent_metadata(data: JsonData, path: tuple[Any, ...]) -> Iterator[Any]:
+    """Lazily yield wildcard array rows with scalar parent fields attached as metadata columns."""
+    if WILDCARD not in path:
+        yield from iter_array_data_by_path(data, path) or ()
+        return
+    yield from _iter_rows_with_parent_metadata(data, path, (), parent_columns_first=False)
+
+
 def get_unfolded_array_data(data: JsonData, parent_path: tuple[Any, ...], nested_path: tuple[Any, ...]) -> Optional[list[Any]]:
     """Return nested array rows expanded into their parent row context."""
     if not _is_nested_path(parent_path, nested_path):
         return None
 
-    rows: list[Any] = []
-    _collect_rows_with_parent_metadata(data, nested_path, rows, (), parent_columns_first=True)
+    rows = list(_iter_rows_with_parent_metadata(data, nested_path, (), parent_columns_first=True))
     return rows if rows else None
 
 
-def iter_array_paths(data: JsonData, path: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
-    """Return structured paths for every array in the JSON data."""
-    paths: list[tuple[Any, ...]] = []
+def iter_unfolded_array_data(
+    data: JsonData,
+    parent_path: tuple[Any, ...],
+    nested_path: tuple[Any, ...],
+) -> Optional[Iterator[Any]]:
+    """Lazily yield nested array rows expanded into their parent row context."""
+    if not _is_nested_path(parent_path, nested_path):
+        return None
+    return _iter_rows_with_parent_metadata(data, nested_path, (), parent_columns_first=True)
 
-    if isinstance(data, dict):
-        for key, value in data.items():
-            current_path = path + (key,)
-            if isinstance(value, list):
-                paths.append(current_path)
-                for index, item in enumerate(value):
-                    if isinstance(item, (dict, list)):
-                        paths.extend(iter_array_paths(item, current_path + (index,)))
-            elif isinstance(value, dict):
-                paths.extend(iter_array_paths(value, current_path))
-
-    elif isinstance(data, list):
-        if not path:
-            paths.append(())
-        for index, item in enumerate(data):
-            if isinstance(item, (dict, list)):
-                paths.extend(iter_array_paths(item, path + (index,)))
 
-    return paths
+def build_array_path_index(data: JsonData) -> ArrayPathIndex:
+    """Index every concrete array in the JSON data by its displayed path."""
+    collector = _ArrayPathCollector(keep_arrays=True)
+    _collect_array_paths(data, collector)
+    return _array_path_index(collector)
 
 
-def _resolve_path_values(value: Any, path: tuple[Any, ...]) -> list[Any]:
-    if not path:
-        return [value]
+def iter_array_paths(data: JsonData, path: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    """Return structured paths for every array in the JSON data."""
+    return _collect_path_arrays(data, path).paths
 
-    segment = path[0]
-    remaining_path = path[1:]
-    if segment is WILDCARD:
-        if not isinstance(value, list):
-            return []
-        resolved_values: list[Any] = []
-        for item in value:
-            resolved_values.extend(_resolve_path_values(item, remaining_path))
-        return resolved_values
 
+def _collect_path_arrays(data: JsonData, path: tuple[Any, ...]) -> "_ArrayPathCollector":
+    collector = _ArrayPathCollector(keep_arrays=False)
+    if not path:
+        _collect_array_paths(data, collector)
+    else:
+        _collect_value_array_paths(data, path, path, collector)
+    return collector
+
+
+# One JSON path segment as ``(parent link, segment, is_index)``. Links share
+# their prefix with the parent, so traversals extend paths without copying
+# them and build tuples only for the paths they report.
+_PathLink = tuple[Any, Any, bool]
+# A stack frame of the array path scan: the child iterator of one container,
+# the container's path link, and whether the container is an array.
+_ScanFrame = tuple[Iterator[tuple[Any, Any]], Optional[_PathLink], bool]
+# Tree-path segments below a branch, each mapped to the trie of its own
+# branches. Shared prefixes are stored once, however deep the document is.
+_BranchTrie = dict[Any, "_BranchTrie"]
+
+
+def _link_path(link: Optional[_PathLink], prefix: tuple[Any, ...] = ()) -> tuple[Any, ...]:
+    """Return ``prefix`` followed by the segments up to ``link``."""
+    segments: list[Any] = []
+    while link is not None:
+        segments.append(link[1])
+        link = link[0]
+    segments.reverse()
+    return prefix + tuple(segments)
+
+
+def _step_path(value: Any, segment: Any) -> Any:
+    """Return the child of ``value`` at a concrete path segment, or ``_MISSING``."""
     if isinstance(segment, int):
         if isinstance(value, list) and 0 <= segment < len(value):
-            return _resolve_path_values(value[segment], remaining_path)
-        return []
-
+            return value[segment]
+        return _MISSING
     if isinstance(value, dict) and segment in value:
-        return _resolve_path_values(value[segment], remaining_path)
+        return value[segment]
+    return _MISSING
 
-    return []
 
-
-def _collect_rows_with_parent_metadata(
+def _iter_path_values(
     value: Any,
     path: tuple[Any, ...],
-    rows: list[Any],
-    parent_metadata: tuple[tuple[str, Any], ...],
-    parent_columns_first: bool,
-) -> None:
-    if not path:
-        if isinstance(value, list):
-            for item in value:
-                rows.append(_merge_parent_metadata(item, parent_metadata, parent_columns_first))
-        return
+    parent_metadata: Optional[tuple[tuple[str, Any], ...]] = None,
+) -> Iterator[tuple[Any, Optional[tuple[tuple[str, Any], ...]]]]:
+    """
+    Yield every value reached by a structured path, in document order.
 
-    segment = path[0]
-    remaining_path = path[1:]
-    if segment is WILDCARD:
-        if not isinstance(value, list):
+    ``WILDCARD`` segments fan out over array items with an explicit stack of
+    item iterators. When ``parent_metadata`` is given, the scalar fields of
+    each wildcard item are appended to it and yielded with the values below.
+    """
+    stack: list[tuple[Iterator[tuple[int, Any]], int, Optional[tuple[tuple[str, Any], ...]]]] = []
+    position = 0
+    metadata = parent_metadata
+    while True:
+        while position < len(path) and path[position] is not WILDCARD and value is not _MISSING:
+            value = _step_path(value, path[position])
+            position += 1
+        if value is not _MISSING:
+            if position == len(path):
+                yield value, metadata
+            elif isinstance(value, list):
+                stack.append((enumerate(value), position + 1, metadata))
+
+        while stack:
+            items, position, stack_metadata = stack[-1]
+            next_item = next(items, None)
+            if next_item is None:
+                stack.pop()
+                continue
+            index, value = next_item
+            metadata = None if stack_metadata is None else stack_metadata + _parent_metadata(value, index)
+            break
+        else:
             return
-        for index, item in enumerate(value):
-            metadata = parent_metadata + _parent_metadata(item, index)
-            _collect_rows_with_parent_metadata(item, remaining_path, rows, metadata, parent_columns_first)
-        return
 
-    if isinstance(segment, int):
-        if isinstance(value, list) and 0 <= segment < len(value):
-            _collect_rows_with_parent_metadata(value[segment], remaining_path, rows, parent_metadata, parent_columns_first)
-        return
 
-    if isinstance(value, dict) and segment in value:
-        _collect_rows_with_parent_metadata(value[segment], remaining_path, rows, parent_metadata, parent_columns_first)
+def _resolve_path_values(value: Any, path: tuple[Any, ...]) -> list[Any]:
+    return [resolved for resolved, _ in _iter_path_values(value, path)]
+
+
+def _iter_rows_with_parent_metadata(
+    value: Any,
+    path: tuple[Any, ...],
+    parent_metadata: tuple[tuple[str, Any], ...],
+    parent_columns_first: bool,
+) -> Iterator[Any]:
+    for array_data, metadata in _iter_path_values(value, path, parent_metadata):
+        if isinstance(array_data, list):
+            for item in array_data:
+                yield _merge_parent_metadata(item, metadata or (), parent_columns_first)
+
+
+def _map_json_leaves(value: Any, convert: Callable[[Any], Any]) -> Any:
+    """Copy nested objects and arrays with ``convert`` applied to every other value, without recursion."""
+    if not isinstance(value, (dict, list)):
+        return convert(value)
+    root: Any = {} if isinstance(value, dict) else []
+    stack: list[tuple[Any, Any]] = [(value, root)]
+    while stack:
+        source, target = stack.pop()
+        for key, item in source.items() if isinstance(source, dict) else enumerate(source):
+            if isinstance(item, (dict, list)):
+                copied: Any = {} if isinstance(item, dict) else []
+                stack.append((item, copied))
+            else:
+                copied = convert(item)
+            if isinstance(target, dict):
+                target[key] = copied
+            else:
+                target.append(copied)
+    return root
 
 
 def _parent_metadata(value: Any, index: int) -> tuple[tuple[str, Any], ...]:
@@ -350,185 +509,642 @@ def format_path(path: Sequence[Any]) -> str:
     if not path:
         return "root"
 
-    display = ""
+    parts: list[str] = []
     for segment in path:
         if isinstance(segment, int):
-            display += f"[{segment}]"
+            parts.append(f"[{segment}]")
         elif segment is WILDCARD:
-            display += "[*]"
+            parts.append("[*]")
         elif str(segment).isidentifier():
-            if display:
-                display += f".{segment}"
-            else:
-                display = str(segment)
-        elif display:
-            display += f"[{json.dumps(str(segment))}]"
+            parts.append(f".{segment}" if parts else str(segment))
         else:
-            display = f"[{json.dumps(str(segment))}]"
+            parts.append(f"[{json.dumps(str(segment))}]")
+
+    return "".join(parts)
 
-    return display
 
+def build_json_tree(data: JsonData, sample_size: Optional[int] = None) -> JsonNode:
+    """
+    Return an aggregate JSON tree suitable for an explorer-style UI.
 
-def build_json_tree(data: JsonData) -> JsonNode:
-    """Build an aggregate JSON tree suitable for an explorer-style UI."""
-    return _build_node(data, (), "root")
+    The tree is a ``LazyJsonNode``: children and statistics are computed from
+    ``data`` when first accessed. ``sample_size`` bounds the items read per
+    array, see ``analyze_json``.
+    """
+    return LazyJsonNode((data,), (), "root", sample_size=sample_size)
 
 
-def discover_array_candidates(data: JsonData) -> list[ArrayCandidate]:
+def discover_array_candidates(data: JsonData, sample_size: Optional[int] = None) -> list[ArrayCandidate]:
     """Return aggregate array candidates, avoiding repeated per-row duplicates."""
     candidates: list[ArrayCandidate] = []
-    _collect_array_candidates(_build_node(data, (), "root"), candidates)
+    _collect_array_candidates(build_json_tree(data, sample_size), candidates)
     return candidates
 
 
-def build_table_preview(array_data: Optional[list[Any]], display_path: str, max_rows: int = 50) -> TablePreview:
-    """Build preview metadata for an array of objects."""
+def analyze_json(
+    data: JsonData, sample_size: Optional[int] = None, checkpoint: Optional[Callable[[], None]] = None
+) -> JsonAnalysis:
+    """
+    Collect array keys, the aggregate tree and array candidates together.
+
+    This is equivalent to calling ``find_arrays``, ``build_json_tree`` and
+    ``discover_array_candidates``. The tree is lazy: candidates are read from
+    it without creating nodes for scalar values or for branches without
+    arrays, and the rest is built only if the tree is explored.
+
+    ``sample_size`` bounds the work per array for quick discovery on huge
+    documents: statistics are read from the first half of that many items
+    plus a random sample of the rest (``DISCOVERY_SAMPLE_SIZE`` is a sensible
+    value). Counts below a sampled array are scaled up, nodes and candidates
+    read from a sample are marked ``estimated``, and array keys only cover
+    sampled rows. Samples are seeded by array length, so they are repeatable.
+
+    ``checkpoint`` is called every ``CHECKPOINT_INTERVAL`` items of each array
+    and for every candidate; an exception raised from it aborts the analysis.
+    """
+    _check_sample_size(sample_size)
+    collector = _ArrayPathCollector(keep_arrays=True, sample_size=sample_size, checkpoint=checkpoint)
+    branches = collector.branches if _collect_array_paths(data, collector) else None
+    return _json_analysis(LazyJsonNode((data,), (), "root", branches=branches, sample_size=sample_size), collector)
+
+
+def parse_json_text(json_text: str) -> Any:
+    """
+    Parse JSON text like ``json.loads(json_text, parse_float=Decimal)``, at any nesting depth.
+
+    The C parser is tried first. Documents nested deeper than it can recurse
+    are parsed again from ``iter_json_events``, which keeps an explicit stack.
+    """
+    try:
+        return json.loads(json_text, parse_float=Decimal)
+    except RecursionError:
+        events = iter_json_events(io.StringIO(json_text))
+        event, value = _next_event(events)
+        data = _build_event_value(event, value, events)
+        _expect_end_of_events(events)
+        return data
+
+
+def check_json_syntax(json_text: str) -> None:
+    """
+    Raise ``json.JSONDecodeError`` if ``json_text`` is not valid JSON.
+
+    The C scanner still reads the whole text, but every object is dropped as
+    soon as it is parsed and numbers stay floats, so no document is kept and
+    nothing is analyzed. This is several times cheaper than ``load_text``.
+    Text nested too deep for the scanner is read through ``iter_json_events``.
+    """
+    try:
+        json.loads(json_text, object_pairs_hook=_discard_json_object)
+    except RecursionError:
+        _expect_end_of_events(iter_json_events(io.StringIO(json_text)))
+
+
+def _discard_json_object(pairs: list[tuple[str, Any]]) -> None:
+    return None
+
+
+def iter_json_events(file: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[JsonEvent]:
+    """
+    Yield parse events for a JSON document read from ``file`` in chunks.
+
+    Events are ``(name, value)`` pairs where name is one of ``start_map``,
+    ``map_key``, ``end_map``, ``start_array``, ``end_array`` or ``value``.
+    Numbers follow ``json.load(..., parse_float=Decimal)``: integers become
+    ``int`` and numbers with a fraction or exponent become ``Decimal``. Only the
+    current chunk and the token being read are held in memory.
+    """
+    return _JsonEventReader(file, chunk_size).events()
+
+
+def analyze_json_file(
+    file_path: str, chunk_size: int = STREAM_CHUNK_SIZE, checkpoint: Optional[Callable[[], None]] = None
+) -> JsonAnalysis:
+    """
+    Analyze a JSON file without loading the whole document.
+
+    Array rows are materialized in small batches of ``STREAM_ROW_BATCH_SIZE``
+    and their aggregate nodes merged, so memory is bounded by the largest rows
+    instead of the file size. The result matches ``analyze_json`` on the
+    parsed document. ``checkpoint`` is called every ``CHECKPOINT_INTERVAL``
+    parse events; an exception raised from it aborts the analysis.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        events = iter_json_events(file, chunk_size)
+        if checkpoint is not None:
+            events = iter_with_checkpoints(events, checkpoint)
+        collector = _ArrayPathCollector(keep_arrays=False, checkpoint=checkpoint)
+        event, value = _next_event(events)
+        json_tree = _analyze_event_value(event, value, events, (), "root", collector)
+        _expect_end_of_events(events)
+    return _json_analysis(json_tree, collector)
+
+
+def iter_with_checkpoints(
+    items: Iterable[Any], checkpoint: Callable[[], None], interval: int = CHECKPOINT_INTERVAL
+) -> Iterator[Any]:
+    """
+    Yield ``items``, calling ``checkpoint`` before the first and every ``interval``-th item.
+
+    Long loops over rows use it for cooperative cancellation: an exception
+    raised from ``checkpoint`` ends the iteration.
+    """
+    for count, item in enumerate(items):
+        if count % interval == 0:
+            checkpoint()
+        yield item
+
+
+def iter_json_file_array_items(file_path: str, path: tuple[Any, ...], chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield rows of the array at a structured path straight from a JSON file.
+
+    Wildcard paths are flattened like ``get_array_data_by_path``. Only one row
+    of the outermost array is materialized at a time.
+    """
+    if WILDCARD not in path:
+        yield from _iter_file_array_items(file_path, path, chunk_size)
+        return
+
+    wildcard_index = path.index(WILDCARD)
+    remaining_path = path[wildcard_index + 1 :]
+    for item in _iter_file_array_items(file_path, path[:wildcard_index], chunk_size):
+        for value in _resolve_path_values(item, remaining_path):
+            if isinstance(value, list):
+                yield from value
+
+
+def iter_json_file_rows_with_parent_metadata(
+    file_path: str,
+    path: tuple[Any, ...],
+    parent_columns_first: bool = False,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Yield wildcard array rows with parent metadata, reading one outer row at a time."""
+    if WILDCARD not in path:
+        yield from _iter_file_array_items(file_path, path, chunk_size)
+        return
+
+    wildcard_index = path.index(WILDCARD)
+    remaining_path = path[wildcard_index + 1 :]
+    for index, item in enumerate(_iter_file_array_items(file_path, path[:wildcard_index], chunk_size)):
+        yield from _iter_rows_with_parent_metadata(item, remaining_path, _parent_metadata(item, index), parent_columns_first)
+
+
+def build_table_preview(
+    array_data: Optional[Iterable[Any]],
+    display_path: str,
+    max_rows: int = 50,
+) -> TablePreview:
+    """
+    Build preview metadata for an array of objects.
+
+    Rows are read in one pass that keeps only the first ``max_rows``, so a
+    lazy row iterator is previewed without materializing the table.
+    """
     if array_data is None:
         raise ArrayMateCoreError("Selected array is invalid")
-    if not array_data:
+
+    value_types: dict[str, set[type]] = {}
+    preview_rows = []
+    row_count = 0
+    for row in array_data:
+        if not isinstance(row, dict):
+            raise ArrayMateCoreError("Array must contain objects with key-value pairs")
+        for column_name, value in row.items():
+            types = value_types.get(column_name)
+            if types is None:
+                value_types[column_name] = {type(value)}
+            else:
+                types.add(type(value))
+        if row_count < max_rows:
+            preview_rows.append(dict(row))
+        row_count += 1
+    if not row_count:
         return TablePreview(display_path=display_path, rows=0, columns=(), preview_rows=(), warnings=("Empty array",))
-    if not all(isinstance(item, dict) for item in array_data):
-        raise ArrayMateCoreError("Array must contain objects with key-value pairs")
 
-    column_names = _column_names(array_data)
-    columns = tuple(
-        ColumnPreview(
-            name=column_name,
-            inferred_type=_infer_column_type([row.get(column_name) for row in array_data]),
-            contains_nested_values=any(isinstance(row.get(column_name), (dict, list)) for row in array_data),
-        )
-        for column_name in column_names
-    )
+    columns = tuple(_column_preview(str(column_name), types) for column_name, types in value_types.items())
     warnings = []
     if any(column.contains_nested_values for column in columns):
         warnings.append("Some columns contain nested records or arrays")
 
-    preview_rows = tuple(dict(row) for row in array_data[:max_rows])
     return TablePreview(
         display_path=display_path,
-        rows=len(array_data),
+        rows=row_count,
         columns=columns,
-        preview_rows=preview_rows,
+        preview_rows=tuple(preview_rows),
         warnings=tuple(warnings),
     )
 
 
+def _column_preview(column_name: str, value_types: set[type]) -> ColumnPreview:
+    """Summarize a column from the set of value types seen in it, like ``_infer_column_type``."""
+    kinds = {_type_kind(value_type) for value_type in value_types if value_type is not type(None)}
+    if not kinds:
+        inferred_type = "empty"
+    elif len(kinds) == 1:
+        inferred_type = next(iter(kinds))
+    else:
+        inferred_type = "mixed"
+    return ColumnPreview(
+        name=column_name,
+        inferred_type=inferred_type,
+        contains_nested_values=bool(kinds & {"object", "array"}),
+    )
+
+
+def _type_kind(value_type: type) -> str:
+    if issubclass(value_type, dict):
+        return "object"
+    if issubclass(value_type, list):
+        return "array"
+    if issubclass(value_type, bool):
+        return "boolean"
+    if issubclass(value_type, (int, float, Decimal)):
+        return "number"
+    return "text"
+
+
 def apply_table_transform_options(
     array_data: Optional[list[Any]],
     options: Optional[TableTransformOptions] = None,
+    checkpoint: Optional[Callable[[], None]] = None,
 ) -> Optional[list[Any]]:
-    """Return table data with user-selected quick transformations applied."""
+    """
+    Return table data with user-selected quick transformations applied.
+
+    ``checkpoint`` is called every ``CHECKPOINT_INTERVAL`` rows while they are
+    transformed; an exception raised from it aborts the transform.
+    """
     if array_data is None or options is None:
         return array_data
 
     if not options.stringify_all and not options.stringify_formulas and not options.column_transforms:
         return array_data
 
-    return [_transform_table_row(item, options) for item in array_data]
+    transform_row = _compile_transform_plan(options).transform_row
+    rows = array_data if checkpoint is None else iter_with_checkpoints(array_data, checkpoint)
+    return [transform_row(item) for item in rows]
+
+
+def iter_table_transform_options(rows: Iterable[Any], options: Optional[TableTransformOptions] = None) -> Iterator[Any]:
+    """Lazily yield rows with user-selected quick transformations applied."""
+    if options is None or (not options.stringify_all and not options.stringify_formulas and not options.column_transforms):
+        yield from rows
+        return
+    transform_row = _compile_transform_plan(options).transform_row
+    for row in rows:
+        yield transform_row(row)
+
+
+def reapply_column_transforms(
+    base_rows: list[Any],
+    transformed_rows: list[Any],
+    options: Optional[TableTransformOptions],
+    columns: Iterable[str],
+    checkpoint: Optional[Callable[[], None]] = None,
+) -> list[Any]:
+    """
+    Return ``transformed_rows`` with only ``columns`` re-derived from ``base_rows`` under ``options``.
+
+    ``transformed_rows`` must come from the same base rows with the same
+    stringify options, so every other column is already up to date. The
+    result equals ``apply_table_transform_options(base_rows, options)``.
+    ``checkpoint`` is called like in ``apply_table_transform_options``.
+    """
+    plan = _compile_transform_plan(options or TableTransformOptions())
+    converters = [(column, plan.column_cells.get(column, plan.default_cell)) for column in columns]
+    rows = []
+    row_pairs = zip(base_rows, transformed_rows)
+    if checkpoint is not None:
+        row_pairs = iter_with_checkpoints(row_pairs, checkpoint)
+    for base_row, transformed_row in row_pairs:
+        if not isinstance(base_row, dict):
+            rows.append(transformed_row)
+            continue
+        row = dict(transformed_row)
+        for column, convert in converters:
+            if column in base_row:
+                row[column] = base_row[column] if convert is None else convert(base_row[column])
+        rows.append(row)
+    return rows
+
+
+def validate_column_transforms(
+    array_data: Optional[Iterable[Any]],
+    options: Optional[TableTransformOptions],
+    columns: Optional[Iterable[str]] = None,
+    sample_size: Optional[int] = None,
+) -> Optional[TransformIssue]:
+    """
+    Return the first value a column transform fails on, or ``None`` when all convert.
+
+    Only transformed columns (or the given subset) are checked, and checking
+    stops at the first failure. ``sample_size`` limits the check to that many
+    evenly spaced rows of a list, or the leading rows of any other iterable,
+    as a quick pre-check before a full validation.
+    """
+    if not array_data or options is None or not options.column_transforms:
+        return None
+
+    plan = _compile_transform_plan(options)
+    selected_columns = plan.column_cells.keys() if columns is None else set(columns) & plan.column_cells.keys()
+    converters = [(column, plan.column_cells[column]) for column in selected_columns]
+    if not converters:
+        return None
+
+    indexed_rows: Iterable[tuple[int, Any]]
+    if not isinstance(array_data, list):
+        indexed_rows = islice(enumerate(array_data), sample_size)
+    elif sample_size is None or sample_size >= len(array_data):
+        indexed_rows = enumerate(array_data)
+    else:
+        step = -(-len(array_data) // max(1, sample_size))
+        indexed_rows = ((row_index, array_data[row_index]) for row_index in range(0, len(array_data), step))
+    for row_index, row in indexed_rows:
+        if not isinstance(row, dict):
+            continue
+        for column, convert in converters:
+            if column not in row:
+                continue
+            try:
+                convert(row[column])
+            except ArrayMateCoreError as exc:
+                return TransformIssue(
+                    row_index=row_index,
+                    column=column,
+                    value=row[column],
+                    message=f"Row {row_index + 1}, column '{column}': {exc}",
+                )
+    return None
+
+
+def changed_transform_columns(previous: Optional[TableTransformOptions], current: Optional[TableTransformOptions]) -> Optional[set[str]]:
+    """
+    Return the columns whose column transform differs between two option sets.
+
+    ``None`` means the stringify options differ too, so every column changes.
+    """
+    previous = previous or TableTransformOptions()
+    current = current or TableTransformOptions()
+    if (previous.stringify_all, previous.stringify_formulas) != (current.stringify_all, current.stringify_formulas):
+        return None
+    previous_transforms = {transform.column: transform for transform in previous.column_transforms}
+    current_transforms = {transform.column: transform for transform in current.column_transforms}
+    return {
+        column
+        for column in previous_transforms.keys() | current_transforms.keys()
+        if previous_transforms.get(column) != current_transforms.get(column)
+    }
 
 
 def infer_column_transform_types(array_data: Optional[list[Any]], column: str) -> tuple[str, ...]:
     """Return data type actions that can be applied to all current values in a column."""
-    base_types = ["Keep", "Text"]
     if not array_data:
-        return tuple(base_types)
-
-    values = [row.get(column) for row in array_data if isinstance(row, dict) and column in row]
-    meaningful_values = [value for value in values if value not in (None, "")]
-    if not meaningful_values:
-        return tuple(base_types + ["Number", "Integer", "Boolean"])
-
-    if all(_can_coerce_number(value) for value in meaningful_values):
-        base_types.append("Number")
-        if all(_can_coerce_integer(value) for value in meaningful_values):
-            base_types.append("Integer")
-    if all(_can_coerce_boolean(value) for value in meaningful_values):
-        base_types.append("Boolean")
+        return ("Keep", "Text")
+
+    possible_types: Optional[int] = None
+    for row in array_data:
+        if not isinstance(row, dict) or column not in row:
+            continue
+        value = row[column]
+        if value is None or value == "":
+            continue
+        possible_types = _probe_value_types(value, _ALL_VALUE_TYPES if possible_types is None else possible_types)
+        if not possible_types:
+            break
+    return _transform_type_names(possible_types)
+
+
+def infer_table_transform_types(
+    array_data: Optional[Iterable[Any]],
+    columns: Optional[Sequence[str]] = None,
+) -> dict[str, tuple[str, ...]]:
+    """
+    Return data type actions for every column in one sweep over the rows.
 
-    return tuple(base_types)
+    Columns stop being probed once every conversion is ruled out, and the
+    sweep ends early when that is true for all columns. ``columns`` gives
+    the header when the caller already knows it, so a lazy row iterator is
+    swept without collecting it.
+    """
+    if not array_data:
+        return {}
+
+    if columns is None:
+        array_data = array_data if isinstance(array_data, list) else list(array_data)
+        columns = table_column_names(array_data)
+    possible_types: dict[str, Optional[int]] = dict.fromkeys(columns)
+    open_columns = list(columns)
+    for row in array_data:
+        if not isinstance(row, dict):
+            continue
+        closed_column = False
+        for column in open_columns:
+            value = row.get(column)
+            if value is None or value == "":
+                continue
+            current_types = possible_types[column]
+            updated_types = _probe_value_types(value, _ALL_VALUE_TYPES if current_types is None else current_types)
+            possible_types[column] = updated_types
+            closed_column = closed_column or not updated_types
+        if closed_column:
+            open_columns = [column for column in open_columns if possible_types[column] != 0]
+            if not open_columns:
+                break
+    return {column: _transform_type_names(possible_types[column]) for column in columns}
 
 
 def is_spreadsheet_formula_text(value: str) -> bool:
     """Return whether a string can be interpreted as a spreadsheet formula."""
-    if value.startswith("'"):
-        return False
+    return _FORMULA_TEXT_RE.match(value) is not None
 
-    stripped_value = value.lstrip(" \t\r\n")
-    return bool(stripped_value) and stripped_value[0] in ("=", "+", "-", "@")
 
+@dataclass(frozen=True)
+class _TransformPlan:
+    """
+    Table transform options compiled into one converter per cell.
 
-def _transform_table_row(row: Any, options: TableTransformOptions) -> Any:
-    if isinstance(row, dict):
-        column_transforms = {transform.column: transform for transform in options.column_transforms}
-        return {
-            key: _transform_table_cell(value, options, column_transforms.get(str(key)))
-            for key, value in row.items()
+    ``default_cell`` converts columns without a column transform; ``None``
+    means they are copied unchanged.
+    """
+
+    value: Callable[[Any], Any]
+    default_cell: Optional[Callable[[Any], Any]]
+    column_cells: dict[str, Callable[[Any], Any]]
+    default_passthrough_types: frozenset[type] = frozenset()
+
+    def transform_row(self, row: Any) -> Any:
+        if not isinstance(row, dict):
+            return self.value(row)
+        column_cells = self.column_cells
+        default_cell = self.default_cell
+        if default_cell is None:
+            transformed = dict(row)
+            for column, convert in column_cells.items():
+                if column in transformed:
+                    transformed[column] = convert(transformed[column])
+            return transformed
+        passthrough_types = self.default_passthrough_types
+        transformed = {
+            key: value if type(value) in passthrough_types else default_cell(value) for key, value in row.items()
         }
-    return _transform_value(row, options)
+        for column, convert in column_cells.items():
+            if column in row:
+                transformed[column] = convert(row[column])
+        return transformed
+
 
+@lru_cache(maxsize=TRANSFORM_PLAN_CACHE_SIZE)
+def _compile_transform_plan(options: TableTransformOptions) -> _TransformPlan:
+    if options.stringify_all:
+        convert_value: Optional[Callable[[Any], Any]] = _stringify_cell
+    elif options.stringify_formulas:
+        convert_value = _escape_formula_values
+    else:
+        convert_value = None
+    escape_text = options.stringify_all or options.stringify_formulas
+
+    column_cells = {
+        transform.column: _compile_column_cell(convert_value, _compile_column_transform(transform), escape_text)
+        for transform in options.column_transforms
+    }
+    return _TransformPlan(
+        value=convert_value or _keep_value,
+        default_cell=convert_value,
+        column_cells=column_cells,
+        # Formula escaping leaves numbers, booleans and nulls untouched, so
+        # those cells skip the converter call.
+        default_passthrough_types=_SCALAR_TYPES if convert_value is _escape_formula_values else frozenset(),
+    )
 
-def _transform_table_cell(value: Any, options: TableTransformOptions, column_transform: Optional[ColumnTransform]) -> Any:
-    transformed_value = _transform_value(value, options)
-    if column_transform is not None:
-        transformed_value = _apply_column_transform(transformed_value, column_transform)
-    if isinstance(transformed_value, str) and (options.stringify_all or options.stringify_formulas):
-        return _escape_formula_text(transformed_value)
-    return transformed_value
 
+def _compile_column_cell(
+    convert_value: Optional[Callable[[Any], Any]],
+    convert_column: Callable[[Any], Any],
+    escape_text: bool,
+) -> Callable[[Any], Any]:
+    if convert_value is None and not escape_text:
+        return convert_column
+    if convert_value is None:
+        return lambda value: _escape_text_value(convert_column(value))
+    if not escape_text:
+        return lambda value: convert_column(convert_value(value))
+    return lambda value: _escape_text_value(convert_column(convert_value(value)))
 
-def _transform_value(value: Any, options: TableTransformOptions) -> Any:
-    if options.stringify_all:
-        return _escape_formula_text(_stringify_value(value))
 
-    if isinstance(value, dict):
-        return {key: _transform_value(item, options) for key, item in value.items()}
-    if isinstance(value, list):
-        return [_transform_value(item, options) for item in value]
-    if options.stringify_formulas and isinstance(value, str):
-        return _escape_formula_text(value)
+def _compile_column_transform(transform: ColumnTransform) -> Callable[[Any], Any]:
+    data_type = transform.data_type.lower()
+    convert_type = _COLUMN_TYPE_CONVERTERS.get(data_type, _keep_value)
+    if not transform.find_text:
+        return convert_type
 
+    find_text = transform.find_text
+    replace_text = transform.replace_text
+    if convert_type is _keep_value:
+        return lambda value: _stringify_value(value).replace(find_text, replace_text)
+    return lambda value: convert_type(_stringify_value(value).replace(find_text, replace_text))
+
+
+def _keep_value(value: Any) -> Any:
+    return value
+
+
+def _stringify_cell(value: Any) -> str:
+    return _escape_formula_text(_stringify_value(value))
+
+
+def _escape_text_value(value: Any) -> Any:
+    if isinstance(value, str):
+        return _escape_formula_text(value)
     return value
 
 
+def _escape_formula_values(value: Any) -> Any:
+    return _map_json_leaves(value, _escape_text_value)
+
+
+def _coerce_integer(value: Any) -> Optional[int]:
+    number_value = _coerce_number(value)
+    if number_value is None:
+        return None
+    if not _is_integral_decimal(number_value):
+        raise ArrayMateCoreError(f"Cannot convert '{value}' to integer")
+    return int(number_value)
+
+
+_STRINGIFY_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
 def _stringify_value(value: Any) -> str:
     if value is None:
         return ""
     if isinstance(value, str):
         return value
     if isinstance(value, (dict, list)):
-        return json.dumps(value, ensure_ascii=False, default=str)
+        return _encode_json(value, _STRINGIFY_JSON_ENCODER)
     return str(value)
 
 
-def _escape_formula_text(value: str) -> str:
-    if is_spreadsheet_formula_text(value):
-        return f"'{value}"
-    return value
+def _encode_json(value: Any, encoder: json.JSONEncoder) -> str:
+    """Encode ``value`` like ``encoder.encode``, at any nesting depth."""
+    try:
+        return encoder.encode(value)
+    except RecursionError:
+        return "".join(_iter_deep_json_chunks(value, encoder))
 
 
-def _apply_column_transform(value: Any, transform: ColumnTransform) -> Any:
-    transformed_value = value
-    if transform.find_text:
-        transformed_value = _stringify_value(transformed_value).replace(transform.find_text, transform.replace_text)
+def _iter_deep_json_chunks(value: Any, encoder: json.JSONEncoder) -> Iterator[str]:
+    """
+    Yield the text ``encoder.encode(value)`` returns in chunks, keeping an explicit stack.
 
-    data_type = transform.data_type.lower()
-    if data_type == "keep":
-        return transformed_value
-    if data_type == "text":
-        return _escape_formula_text(_stringify_value(transformed_value))
-    if data_type == "number":
-        return _coerce_number(transformed_value)
-    if data_type == "integer":
-        number_value = _coerce_number(transformed_value)
-        if number_value is None:
-            return None
-        if not _is_integral_decimal(number_value):
-            raise ArrayMateCoreError(f"Cannot convert '{transformed_value}' to integer")
-        return int(number_value)
-    if data_type == "boolean":
-        return _coerce_boolean(transformed_value)
+    Scalars and keys are still encoded by ``encoder``, so escaping, number
+    formatting and its ``default`` hook are unchanged. ``sort_keys`` and
+    ``skipkeys`` are not supported, and circular references are not detected.
+    """
+    indent = " " * encoder.indent if isinstance(encoder.indent, int) else encoder.indent
+    item_separator, key_separator = encoder.item_separator, encoder.key_separator
+    # Per open container: its (key, item) pairs, whether it is an object,
+    # the line break before each item and the text that closes it.
+    stack: list[tuple[Iterator[tuple[Any, Any]], bool, str, str]] = []
+    while True:
+        if isinstance(value, (dict, list, tuple)) and value:
+            is_object = isinstance(value, dict)
+            items = iter(value.items()) if is_object else zip(repeat(None), value)
+            if indent is None:
+                newline = closing = ""
+            else:
+                newline = "\n" + indent * (len(stack) + 1)
+                closing = "\n" + indent * len(stack)
+            stack.append((items, is_object, newline, closing + ("}" if is_object else "]")))
+            yield "{" if is_object else "["
+            first = True
+        else:
+            yield encoder.encode(value)
+            first = False
+
+        while stack:
+            items, is_object, newline, closing = stack[-1]
+            key, value = next(items, (None, _MISSING))
+            if value is not _MISSING:
+                break
+            stack.pop()
+            yield closing
+        else:
+            return
+        yield newline if first else item_separator + newline
+        if is_object:
+            if not isinstance(key, str):
+                if key is not None and not isinstance(key, (int, float)):
+                    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+                key = encoder.encode(key)
+            yield encoder.encode(key) + key_separator
 
-    return transformed_value
+
+def _escape_formula_text(value: str) -> str:
+    if _FORMULA_TEXT_RE.match(value):
+        return f"'{value}"
+    return value
 
 
 def _coerce_number(value: Any) -> Optional[Decimal]:
@@ -552,22 +1168,6 @@ def _coerce_number(value: Any) -> Optional[Decimal]:
         raise ArrayMateCoreError(f"Cannot convert '{value}' to number") from exc
 
 
-def _can_coerce_number(value: Any) -> bool:
-    try:
-        _coerce_number(value)
-        return True
-    except ArrayMateCoreError:
-        return False
-
-
-def _can_coerce_integer(value: Any) -> bool:
-    try:
-        number_value = _coerce_number(value)
-    except ArrayMateCoreError:
-        return False
-    return number_value is None or _is_integral_decimal(number_value)
-
-
 def _coerce_boolean(value: Any) -> Optional[bool]:
     if value is None or value == "":
         return None
@@ -577,155 +1177,503 @@ def _coerce_boolean(value: Any) -> Optional[bool]:
         return value != 0
 
     text = str(value).strip().lower()
-    if text in ("true", "yes", "y", "1"):
+    if text in _TRUE_TEXT:
         return True
-    if text in ("false", "no", "n", "0"):
+    if text in _FALSE_TEXT:
         return False
     raise ArrayMateCoreError(f"Cannot convert '{value}' to boolean")
 
 
-def _can_coerce_boolean(value: Any) -> bool:
-    try:
-        _coerce_boolean(value)
-        return True
-    except ArrayMateCoreError:
-        return False
+def _probe_value_types(value: Any, wanted_types: int = _ALL_VALUE_TYPES) -> int:
+    """
+    Return which of ``wanted_types`` accept a non-empty value, without raising.
+
+    Conversions already ruled out for a column are not probed again; a
+    ``Decimal`` is only built for text when the integer check is still open.
+    """
+    if type(value) is str:
+        return _probe_text_types(value, wanted_types)
+    if isinstance(value, int):
+        return wanted_types
+    if isinstance(value, Decimal):
+        if wanted_types & _INTEGER_TYPE and not value.is_nan() and _is_integral_decimal(value):
+            return wanted_types
+        return wanted_types & ~_INTEGER_TYPE
+    if isinstance(value, float):
+        return wanted_types if value.is_integer() or math.isinf(value) else wanted_types & ~_INTEGER_TYPE
+    return _probe_text_types(str(value), wanted_types)
+
+
+def _probe_text_types(value: str, wanted_types: int) -> int:
+    text = value.strip()
+    if not text:
+        return wanted_types & ~_BOOLEAN_TYPE
+    value_types = 0
+    if wanted_types & _BOOLEAN_TYPE and text.lower() in _BOOLEAN_TEXT:
+        value_types = _BOOLEAN_TYPE
+    if not wanted_types & _NUMBER_TYPE:
+        return value_types
+    if "," in text and "." not in text:
+        text = text.replace(",", ".")
+    if "_" in text:
+        text = text.replace("_", "")
+    if _INTEGER_TEXT_RE.fullmatch(text):
+        return value_types | (wanted_types & (_NUMBER_TYPE | _INTEGER_TYPE))
+    if _DECIMAL_TEXT_RE.fullmatch(text):
+        value_types |= _NUMBER_TYPE
+        if wanted_types & _INTEGER_TYPE:
+            number_value = Decimal(text)
+            if not number_value.is_nan() and _is_integral_decimal(number_value):
+                value_types |= _INTEGER_TYPE
+    return value_types
+
+
+def _transform_type_names(possible_types: Optional[int]) -> tuple[str, ...]:
+    """Map probed conversions to type actions; ``None`` means the column had no meaningful values."""
+    if possible_types is None:
+        return ("Keep", "Text", "Number", "Integer", "Boolean")
+    type_names = ["Keep", "Text"]
+    if possible_types & _NUMBER_TYPE:
+        type_names.append("Number")
+        if possible_types & _INTEGER_TYPE:
+            type_names.append("Integer")
+    if possible_types & _BOOLEAN_TYPE:
+        type_names.append("Boolean")
+    return tuple(type_names)
 
 
 def _is_integral_decimal(value: Decimal) -> bool:
     return value == value.to_integral_value()
 
 
-def _build_node(value: Any, path: tuple[Any, ...], label: str) -> JsonNode:
-    kind = _value_kind(value)
-    if isinstance(value, dict):
-        children = tuple(_build_node(child_value, path + (key,), str(key)) for key, child_value in value.items())
-        return JsonNode(
-            path=path,
-            display_path=format_path(path),
-            label=label,
-            kind=kind,
-            depth=len(path),
-            children=children,
-        )
+_COLUMN_TYPE_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "keep": _keep_value,
+    "text": _stringify_cell,
+    "number": _coerce_number,
+    "integer": _coerce_integer,
+    "boolean": _coerce_boolean,
+}
 
-    if isinstance(value, list):
-        return _build_array_node(value, path, label, source_count=1)
-
-    return JsonNode(
-        path=path,
-        display_path=format_path(path),
-        label=label,
-        kind=kind,
-        depth=len(path),
-    )
 
+class LazyJsonNode(JsonNode):
+    """
+    JsonNode over parsed data whose children and statistics are computed on first access.
 
-def _build_array_node(values: list[Any], path: tuple[Any, ...], label: str, source_count: int) -> JsonNode:
-    is_empty = not values
-    is_object_array = bool(values) and all(isinstance(item, dict) for item in values)
-    is_primitive_array = bool(values) and all(not isinstance(item, (dict, list)) for item in values)
-    has_nested_arrays = any(_contains_array(item) for item in values)
-    column_count = len(_column_names(values)) if is_object_array else 0
-    exportable = is_object_array and not is_empty
-    warning = _array_warning(is_empty, is_object_array, is_primitive_array, has_nested_arrays)
-
-    children: tuple[JsonNode, ...] = ()
-    if is_object_array:
-        children = tuple(
-            _build_aggregate_node([item[key] for item in values if key in item], path + (WILDCARD, key), str(key))
-            for key in _column_names(values)
-        )
+    A node holds the value at a concrete path, or every value reached through
+    a wildcard path when ``aggregate`` is set. Each field is computed once and
+    memoized, so only the branches that are explored allocate nodes. Nodes
+    compare equal to plain ``JsonNode`` trees with the same fields.
 
-    return JsonNode(
-        path=path,
-        display_path=format_path(path),
-        label=label,
-        kind="array",
-        depth=len(path),
-        children=children,
-        item_count=len(values),
-        source_count=source_count,
-        is_empty=is_empty,
-        is_object_array=is_object_array,
-        is_primitive_array=is_primitive_array,
-        has_nested_arrays=has_nested_arrays,
-        exportable=exportable,
-        warning=warning,
-    )
+    ``branches`` is the trie of tree paths below the node that are or contain
+    arrays, as found by the array path scan, or ``None`` when there are none.
+    Nested-array checks are trie lookups; without it, the node scans its own
+    values on first use. Children take their sub-trie and link to their
+    parent instead of copying its path, so deep chains stay linear in size.
 
+    Aggregate values are views that re-read the source lists on each pass, so
+    wildcard levels never copy rows or per-column values.
 
-def _build_aggregate_node(values: list[Any], path: tuple[Any, ...], label: str) -> JsonNode:
-    if not values:
-        return JsonNode(path=path, display_path=format_path(path), label=label, kind="unknown", depth=len(path))
-
-    if all(isinstance(value, list) for value in values):
-        merged_items = [item for value in values for item in value]
-        node = _build_array_node(merged_items, path, label, source_count=len(values))
-        return JsonNode(
-            path=node.path,
-            display_path=node.display_path,
-            label=node.label,
-            kind=node.kind,
-            depth=node.depth,
-            children=node.children,
-            item_count=node.item_count,
-            source_count=node.source_count,
-            is_empty=node.is_empty,
-            is_object_array=node.is_object_array,
-            is_primitive_array=node.is_primitive_array,
-            has_nested_arrays=node.has_nested_arrays,
-            exportable=node.exportable,
-            warning=node.warning,
-        )
+    With ``sample_size``, array nodes read their statistics and children from
+    a sample of at most that many items. Counts below a sampled array are
+    scaled by the share of items it skipped, and the node is ``estimated``.
+    """
 
-    if all(isinstance(value, dict) for value in values):
-        keys = _object_keys(values)
-        children = tuple(
-            _build_aggregate_node([value[key] for value in values if key in value], path + (key,), str(key))
-            for key in keys
-        )
-        return JsonNode(
+    def __init__(
+        self,
+        values: Collection[Any],
+        path: tuple[Any, ...],
+        label: str,
+        aggregate: bool = False,
+        branches: Optional[_BranchTrie] = _MISSING,  # type: ignore[assignment]
+        sample_size: Optional[int] = None,
+    ) -> None:
+        _check_sample_size(sample_size)
+        self.__dict__.update(
+            _values=values,
+            _aggregate=aggregate,
+            _child_nodes={},
+            _parent=None,
+            _sample_size=sample_size,
+            _scale=1.0,
             path=path,
-            display_path=format_path(path),
-            label=label,
-            kind="object",
             depth=len(path),
-            children=children,
+            label=label,
+        )
+        if branches is not _MISSING:
+            self.__dict__["_branch_trie"] = branches
+
+    @classmethod
+    def _linked(
+        cls,
+        parent: "LazyJsonNode",
+        values: Collection[Any],
+        segments: tuple[Any, ...],
+        label: str,
+        aggregate: bool,
+        branches: Optional[_BranchTrie],
+        scale: float,
+    ) -> "LazyJsonNode":
+        """Create a child node whose path is derived from its parent's on demand."""
+        node = cls.__new__(cls)
+        node.__dict__.update(
+            _values=values,
+            _aggregate=aggregate,
+            _child_nodes={},
+            _parent=parent,
+            _segments=segments,
+            _branch_trie=branches,
+            _sample_size=parent._sample_size,
+            _scale=scale,
+            depth=parent.depth + len(segments),
+            label=label,
         )
+        return node
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, JsonNode):
+            return NotImplemented
+        return _node_fields(self) == _node_fields(other)
+
+    def __hash__(self) -> int:
+        return hash(_node_fields(self))
+
+    @cached_property
+    def display_path(self) -> str:
+        return format_path(self.path)
+
+    @cached_property
+    def path(self) -> tuple[Any, ...]:  # type: ignore[override]
+        segments: list[tuple[Any, ...]] = []
+        node = self
+        while "path" not in node.__dict__:
+            segments.append(node._segments)
+            node = node._parent
+        return node.path + tuple(segment for step in reversed(segments) for segment in step)
+
+    @cached_property
+    def kind(self) -> str:
+        kind = self._kind()
+        if kind not in ("array", "object", "mixed"):
+            # Scalar leaves never read their values again.
+            self.__dict__["_values"] = ()
+        return kind
+
+    def _kind(self) -> str:
+        values = self._values
+        if not self._aggregate:
+            return _value_kind(values[0])
+        if not values:
+            return "unknown"
+        kinds = {_TYPE_KINDS.get(value_type) for value_type in self._value_summary[0]}
+        if None in kinds:
+            kinds = {_value_kind(value) for value in values}
+        return kinds.pop() if len(kinds) == 1 else "mixed"
+
+    @cached_property
+    def children(self) -> tuple[JsonNode, ...]:
+        if self.kind == "object" or self.is_object_array:
+            return tuple(self._child(key) for key in self._keys)
+        return ()
 
-    kinds = {_value_kind(value) for value in values}
-    kind = kinds.pop() if len(kinds) == 1 else "mixed"
-    return JsonNode(
-        path=path,
-        display_path=format_path(path),
-        label=label,
-        kind=kind,
-        depth=len(path),
-    )
+    @cached_property
+    def item_count(self) -> Optional[int]:  # type: ignore[override]
+        return self._scaled(len(self._all_items)) if self.kind == "array" else None
 
+    @cached_property
+    def source_count(self) -> int:  # type: ignore[override]
+        return self._scaled(len(self._values)) if self._aggregate and self.kind == "array" else 1
 
-def _collect_array_candidates(node: JsonNode, candidates: list[ArrayCandidate]) -> None:
-    if node.kind == "array":
-        candidates.append(
-            ArrayCandidate(
-                path=node.path,
-                display_path=node.display_path,
-                item_count=node.item_count or 0,
-                source_count=node.source_count,
-                depth=node.depth,
-                column_count=len(_table_column_nodes(node)),
-                is_empty=node.is_empty,
-                is_object_array=node.is_object_array,
-                is_primitive_array=node.is_primitive_array,
-                has_nested_arrays=node.has_nested_arrays,
-                exportable=node.exportable,
-                warning=node.warning,
-            )
-        )
+    @cached_property
+    def is_empty(self) -> bool:  # type: ignore[override]
+        return self.kind == "array" and not self._items
+
+    @cached_property
+    def is_object_array(self) -> bool:  # type: ignore[override]
+        return bool(self._items) and self._item_kinds[0]
+
+    @cached_property
+    def is_primitive_array(self) -> bool:  # type: ignore[override]
+        return bool(self._items) and self._item_kinds[1]
+
+    @cached_property
+    def has_nested_arrays(self) -> bool:  # type: ignore[override]
+        return self.kind == "array" and self._branch_trie is not None and WILDCARD in self._branch_trie
+
+    @cached_property
+    def exportable(self) -> bool:  # type: ignore[override]
+        return self.is_object_array and not self.is_empty
+
+    @cached_property
+    def warning(self) -> Optional[str]:  # type: ignore[override]
+        if self.kind != "array":
+            return None
+        return _array_warning(self.is_empty, self.is_object_array, self.is_primitive_array, self.has_nested_arrays)
+
+    @cached_property
+    def estimated(self) -> bool:  # type: ignore[override]
+        return self._scale != 1 or self._is_sampled
+
+    @cached_property
+    def _all_items(self) -> Collection[Any]:
+        """Array items of an array node; the rows of every source array for aggregates."""
+        if self.kind != "array":
+            return ()
+        if not self._aggregate:
+            return self._values[0]
+        return _FlattenedValues(self._values)
+
+    @cached_property
+    def _items(self) -> Collection[Any]:
+        """The items statistics and children are read from: all of them, or a sample."""
+        return _sample_items(self._all_items, self._sample_size)
+
+    @cached_property
+    def _is_sampled(self) -> bool:
+        """Whether ``_items`` holds a sample rather than every item."""
+        return self._sample_size is not None and len(self._all_items) > self._sample_size
+
+    def _scaled(self, count: int) -> int:
+        return count if self._scale == 1 else round(count * self._scale)
+
+    @cached_property
+    def _item_kinds(self) -> tuple[bool, bool]:
+        """Whether all items are objects and whether none is a container."""
+        all_objects = True
+        no_containers = True
+        for item in self._items:
+            if isinstance(item, dict):
+                no_containers = False
+            elif isinstance(item, list):
+                all_objects = no_containers = False
+            else:
+                all_objects = False
+        return all_objects, no_containers
+
+    @cached_property
+    def _keys(self) -> Sequence[str]:
+        """Object keys of the values, or of the items for array nodes, in first-seen order."""
+        if self.kind == "array":
+            return _column_names(self._items)
+        if not self._aggregate:
+            return list(self._values[0]) if self.kind == "object" else []
+        return self._value_summary[1]
+
+    @cached_property
+    def _value_summary(self) -> tuple[set[type], list[str]]:
+        """Types of the aggregate values and their object keys in first-seen order, from one pass."""
+        value_types: set[type] = set()
+        names: dict[str, None] = {}
+        shapes: set[tuple[str, ...]] = set()
+        for value in self._values:
+            value_types.add(type(value))
+            if isinstance(value, dict):
+                shape = tuple(value)
+                if shape in shapes:
+                    continue
+                if len(shapes) < MAX_INTERNED_ROW_SHAPES:
+                    shapes.add(shape)
+                names.update(dict.fromkeys(shape))
+        return value_types, [str(name) for name in names]
+
+    @cached_property
+    def _branch_trie(self) -> Optional[_BranchTrie]:
+        """Branches below this node from a scan of its values, unless handed over by the analyzer or parent."""
+        collector = _ArrayPathCollector(keep_arrays=False, sample_size=self._sample_size)
+        contains_array = False
+        for value in self._values:
+            contains_array = _collect_value_array_paths(value, (), (), collector) or contains_array
+        return collector.branches if contains_array else None
+
+    def _child(self, key: str) -> "LazyJsonNode":
+        child = self._child_nodes.get(key)
+        if child is None:
+            trie = self._branch_trie
+            scale = self._scale
+            if self.kind == "array":
+                if trie is not None:
+                    trie = trie.get(WILDCARD)
+                if self._is_sampled:
+                    scale *= len(self._all_items) / len(self._items)
+                values: Collection[Any] = _KeyValues(self._items, key)
+                segments: tuple[Any, ...] = (WILDCARD, key)
+            elif self._aggregate:
+                values = _KeyValues(self._values, key)
+                segments = (key,)
+            else:
+                values = (self._values[0][key],)
+                segments = (key,)
+            if trie is not None:
+                trie = trie.get(key)
+            aggregate = self._aggregate or self.kind == "array"
+            child = self._linked(self, values, segments, str(key), aggregate, trie, scale)
+            self._child_nodes[key] = child
+        return child
+
+    def _array_branches(self) -> Iterable[JsonNode]:
+        trie = self._branch_trie
+        if trie is None or not (self.kind == "object" or self.is_object_array):
+            return []
+        if self.kind == "array":
+            trie = trie.get(WILDCARD, {})
+        return [self._child(key) for key in self._keys if key in trie]
 
-    for child in node.children:
-        _collect_array_candidates(child, candidates)
+
+class _ValuesView(ABC):
+    """Re-iterable view over source JSON values whose length is counted once on demand."""
+
+    __slots__ = ("_length",)
+
+    def __init__(self) -> None:
+        self._length: Optional[int] = None
+
+    @abstractmethod
+    def __iter__(self) -> Iterator[Any]:
+        """Yield the viewed values from the source lists."""
+
+    def __len__(self) -> int:
+        if self._length is None:
+            self._length = self._count()
+        return self._length
+
+    def __bool__(self) -> bool:
+        if self._length is not None:
+            return self._length > 0
+        for _ in self:
+            return True
+        return False
+
+    def __contains__(self, value: object) -> bool:
+        return any(item == value for item in self)
+
+    def _count(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _FlattenedValues(_ValuesView):
+    """The items of every list in ``lists``, in order."""
+
+    __slots__ = ("_lists",)
+
+    def __init__(self, lists: Iterable[list[Any]]) -> None:
+        super().__init__()
+        self._lists = lists
+
+    def __iter__(self) -> Iterator[Any]:
+        return chain.from_iterable(self._lists)
+
+    def _count(self) -> int:
+        return sum(map(len, self._lists))
+
+    def pick(self, positions: Sequence[int]) -> list[Any]:
+        """Return the items at sorted ``positions``, indexing into each source list."""
+        picked: list[Any] = []
+        position_index = 0
+        offset = 0
+        for values in self._lists:
+            end = offset + len(values)
+            while position_index < len(positions) and positions[position_index] < end:
+                picked.append(values[positions[position_index] - offset])
+                position_index += 1
+            if position_index == len(positions):
+                break
+            offset = end
+        return picked
+
+
+class _KeyValues(_ValuesView):
+    """
+    The value at ``keys`` inside every object in ``values`` that has the whole key path.
+
+    Views over views collapse into one key path, so a deep object chain is read
+    in a single loop per value instead of through one generator per level.
+    """
+
+    __slots__ = ("_values", "_keys")
+
+    def __init__(self, values: Iterable[Any], key: str) -> None:
+        super().__init__()
+        if isinstance(values, _KeyValues):
+            self._values: Iterable[Any] = values._values
+            self._keys: tuple[str, ...] = values._keys + (key,)
+        else:
+            self._values = values
+            self._keys = (key,)
+
+    def __iter__(self) -> Iterator[Any]:
+        if len(self._keys) == 1:
+            key = self._keys[0]
+            return (value[key] for value in self._values if isinstance(value, dict) and key in value)
+        return self._iter_key_path()
+
+    def _iter_key_path(self) -> Iterator[Any]:
+        keys = self._keys
+        for value in self._values:
+            for key in keys:
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                yield value
+
+
+def _node_fields(node: JsonNode) -> tuple[Any, ...]:
+    return tuple(getattr(node, node_field.name) for node_field in fields(JsonNode))
+
+
+def _static_node(value: Any, path: tuple[Any, ...], label: str) -> JsonNode:
+    """Build a plain ``JsonNode`` tree for ``value`` with every field evaluated."""
+    return _freeze_node(LazyJsonNode((value,), path, label))
+
+
+def _freeze_node(node: JsonNode) -> JsonNode:
+    """Copy a node tree into plain ``JsonNode`` objects, children before parents, without recursion."""
+    frozen: dict[int, JsonNode] = {}
+    stack: list[tuple[JsonNode, bool]] = [(node, False)]
+    while stack:
+        current, children_frozen = stack.pop()
+        if type(current) is JsonNode:
+            frozen[id(current)] = current
+        elif not children_frozen:
+            stack.append((current, True))
+            stack.extend((child, False) for child in current.children)
+        else:
+            node_fields = {node_field.name: getattr(current, node_field.name) for node_field in fields(JsonNode)}
+            node_fields["children"] = tuple(frozen[id(child)] for child in current.children)
+            frozen[id(current)] = JsonNode(**node_fields)
+    return frozen[id(node)]
+
+
+def _collect_array_candidates(
+    node: JsonNode, candidates: list[ArrayCandidate], checkpoint: Optional[Callable[[], None]] = None
+) -> None:
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if node.kind == "array":
+            if checkpoint is not None:
+                checkpoint()
+            candidates.append(_array_candidate(node))
+        branches = list(node._array_branches())
+        branches.reverse()
+        stack.extend(branches)
+
+
+def _array_candidate(node: JsonNode) -> ArrayCandidate:
+    return ArrayCandidate(
+        path=node.path,
+        display_path=node.display_path,
+        item_count=node.item_count or 0,
+        source_count=node.source_count,
+        depth=node.depth,
+        column_count=len(_table_column_nodes(node)),
+        is_empty=node.is_empty,
+        is_object_array=node.is_object_array,
+        is_primitive_array=node.is_primitive_array,
+        has_nested_arrays=node.has_nested_arrays,
+        exportable=node.exportable,
+        warning=node.warning,
+        estimated=node.estimated,
+    )
 
 
 def _table_column_nodes(node: JsonNode) -> tuple[JsonNode, ...]:
@@ -734,6 +1682,18 @@ def _table_column_nodes(node: JsonNode) -> tuple[JsonNode, ...]:
     return tuple(child for child in node.children if child.path and child.path[-1] is not WILDCARD)
 
 
+_TYPE_KINDS: dict[type, str] = {
+    dict: "object",
+    list: "array",
+    type(None): "null",
+    bool: "boolean",
+    int: "number",
+    float: "number",
+    Decimal: "number",
+    str: "text",
+}
+
+
 def _value_kind(value: Any) -> str:
     if isinstance(value, dict):
         return "object"
@@ -748,12 +1708,544 @@ def _value_kind(value: Any) -> str:
     return "text"
 
 
-def _contains_array(value: Any) -> bool:
+class _ArrayPathCollector:
+    """
+    Concrete array paths in document order, optionally with the arrays themselves.
+
+    ``branches`` is a trie of the tree paths, with indexes replaced by
+    ``WILDCARD``, of every array and of every value that contains one, below
+    the scanned value. With ``sample_size``, only a sample of the items of
+    longer arrays is scanned. ``checkpoint`` is called during the scan, as
+    described in ``analyze_json``.
+    """
+
+    def __init__(
+        self, keep_arrays: bool, sample_size: Optional[int] = None, checkpoint: Optional[Callable[[], None]] = None
+    ) -> None:
+        self.keep_arrays = keep_arrays
+        self.sample_size = sample_size
+        self.checkpoint = checkpoint
+        self.paths: list[tuple[Any, ...]] = []
+        self.arrays: list[list[Any]] = []
+        self.branches: _BranchTrie = {}
+
+    def add(self, path: tuple[Any, ...], array_data: list[Any]) -> None:
+        self.paths.append(path)
+        if self.keep_arrays:
+            self.arrays.append(array_data)
+
+
+def _collect_array_paths(data: JsonData, array_paths: _ArrayPathCollector) -> bool:
+    """Collect every array in ``data`` and return whether it is or contains an array."""
+    if isinstance(data, list):
+        array_paths.add((), data)
+    return _collect_value_array_paths(data, (), (), array_paths)
+
+
+def _collect_value_array_paths(
+    value: Any, path: tuple[Any, ...], tree_path: tuple[Any, ...], array_paths: _ArrayPathCollector
+) -> bool:
+    """
+    Collect the object-held arrays inside ``value`` and the tree paths that are or contain arrays.
+
+    ``value`` sits at ``path``, or ``tree_path`` in the aggregate tree. Returns
+    whether ``value`` is or contains an array. The walk keeps an explicit stack
+    of child iterators, each with the path link of its container, so nesting
+    depth is not limited by the recursion limit and concrete paths are only
+    built for the arrays found. Branch trie nodes are opened for a stack frame
+    when the first array below it is found.
+    """
+    sample_size = array_paths.sample_size
+    checkpoint = array_paths.checkpoint
     if isinstance(value, list):
+        items: Iterator[tuple[int, Any]] = _enumerate_sample(value, sample_size)
+        if checkpoint is not None:
+            items = iter_with_checkpoints(items, checkpoint)
+        frames: list[_ScanFrame] = [(items, None, True)]
+        tries: list[Optional[_BranchTrie]] = [_branch_trie_node(array_paths.branches, tree_path)]
+    elif isinstance(value, dict):
+        frames = [(iter(value.items()), None, False)]
+        tries = [None]
+    else:
+        return False
+    contains_array = tries[0] is not None
+    while frames:
+        children, parent, is_index = frames[-1]
+        for segment, child in children:
+            if isinstance(child, dict):
+                # Objects of only scalars hold no arrays and need no frame.
+                if not _LEAF_TYPES.issuperset(map(type, child.values())):
+                    frames.append((iter(child.items()), (parent, segment, is_index), False))
+                    tries.append(None)
+                    break
+            elif isinstance(child, list):
+                trie = tries[-1]
+                if trie is None:
+                    trie = _open_frame_tries(frames, tries, array_paths.branches, tree_path)
+                    contains_array = True
+                link = (parent, segment, is_index)
+                if not is_index:
+                    array_paths.add(_link_path(link, path), child)
+                child_trie = trie.setdefault(WILDCARD if is_index else segment, {})
+                positions = None
+                if sample_size is not None and len(child) > sample_size:
+                    positions = _sample_positions(len(child), sample_size)
+                    child = [child[position] for position in positions]
+                if not _LEAF_TYPES.issuperset(map(type, child)):
+                    items = enumerate(child) if positions is None else zip(positions, child)
+                    if checkpoint is not None:
+                        items = iter_with_checkpoints(items, checkpoint)
+                    frames.append((items, link, True))
+                    tries.append(child_trie)
+                    break
+        else:
+            frames.pop()
+            tries.pop()
+    return contains_array
+
+
+def _open_frame_tries(
+    frames: list[_ScanFrame], tries: list[Optional[_BranchTrie]], branches: _BranchTrie, tree_path: tuple[Any, ...]
+) -> _BranchTrie:
+    """Open the branch trie nodes of the stack frames above the last open one."""
+    position = len(tries) - 1
+    while position > 0 and tries[position - 1] is None:
+        position -= 1
+    if position == 0:
+        tries[0] = _branch_trie_node(branches, tree_path)
+        position = 1
+    for frame_position in range(position, len(tries)):
+        _, segment, is_index = frames[frame_position][1]
+        tries[frame_position] = tries[frame_position - 1].setdefault(  # type: ignore[union-attr]
+            WILDCARD if is_index else segment, {}
+        )
+    return tries[-1]  # type: ignore[return-value]
+
+
+def _check_sample_size(sample_size: Optional[int]) -> None:
+    if sample_size is not None and sample_size < 1:
+        raise ArrayMateCoreError("Sample size must be at least 1")
+
+
+def _sample_positions(count: int, sample_size: int) -> list[int]:
+    """
+    Return the sorted positions of a sample of ``sample_size`` out of ``count`` items.
+
+    The sample is the first half of ``sample_size`` items and a uniform random
+    sample of the rest, which is what a reservoir would keep; the length is
+    known, so positions are drawn directly. Seeding with ``count`` makes the
+    sample of an array the same on every pass.
+    """
+    head = max(1, sample_size // 2)
+    rest = random.Random(count).sample(range(head, count), sample_size - head)
+    return list(range(head)) + sorted(rest)
+
+
+def _enumerate_sample(items: list[Any], sample_size: Optional[int]) -> Iterator[tuple[int, Any]]:
+    if sample_size is None or len(items) <= sample_size:
+        return enumerate(items)
+    positions = _sample_positions(len(items), sample_size)
+    return zip(positions, [items[position] for position in positions])
+
+
+def _sample_items(items: Collection[Any], sample_size: Optional[int]) -> Collection[Any]:
+    """Return ``items``, or a list of the sampled ones when there are more than ``sample_size``."""
+    if sample_size is None or len(items) <= sample_size:
+        return items
+    positions = _sample_positions(len(items), sample_size)
+    if isinstance(items, _FlattenedValues):
+        return items.pick(positions)
+    return [items[position] for position in positions]  # type: ignore[index]
+
+
+def _branch_trie_node(trie: _BranchTrie, tree_path: tuple[Any, ...]) -> _BranchTrie:
+    for segment in tree_path:
+        trie = trie.setdefault(segment, {})
+    return trie
+
+
+def _array_path_index(array_paths: _ArrayPathCollector, array_keys: Optional[list[str]] = None) -> ArrayPathIndex:
+    if array_keys is None:
+        array_keys = [format_path(path) for path in array_paths.paths]
+    paths: dict[str, tuple[Any, ...]] = {}
+    arrays: dict[str, list[Any]] = {}
+    for position, (array_key, path) in enumerate(zip(array_keys, array_paths.paths)):
+        if array_key in paths:
+            continue
+        paths[array_key] = path
+        if array_paths.keep_arrays:
+            arrays[array_key] = array_paths.arrays[position]
+    return ArrayPathIndex(paths=paths, arrays=arrays)
+
+
+def _json_analysis(json_tree: JsonNode, array_paths: _ArrayPathCollector) -> JsonAnalysis:
+    candidates: list[ArrayCandidate] = []
+    _collect_array_candidates(json_tree, candidates, array_paths.checkpoint)
+    array_keys = [format_path(path) for path in array_paths.paths]
+    return JsonAnalysis(
+        array_keys=array_keys,
+        json_tree=json_tree,
+        array_candidates=candidates,
+        array_paths=array_paths.paths,
+        array_index=_array_path_index(array_paths, array_keys),
+    )
+
+
+_JSON_WHITESPACE = " \t\n\r"
+_JSON_WHITESPACE_RE = re.compile(r"[ \t\n\r]*")
+_JSON_NUMBER_RE = re.compile(r"(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?")
+_JSON_CONSTANTS = (
+    ("true", True),
+    ("false", False),
+    ("null", None),
+    ("NaN", float("nan")),
+    ("Infinity", float("inf")),
+    ("-Infinity", float("-inf")),
+)
+_JSON_SCALAR_LOOKAHEAD = 32
+
+
+class _JsonEventReader:
+    """Incremental JSON tokenizer that turns a text stream into parse events."""
+
+    def __init__(self, file: TextIO, chunk_size: int) -> None:
+        self.file = file
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def events(self) -> Iterator[JsonEvent]:
+        containers: list[str] = []
+        state = "value"
+        allow_close = False
+        while True:
+            char = self._peek()
+            if state == "after":
+                if not containers:
+                    if char:
+                        self._error("Extra data")
+                    return
+                closing = "}" if containers[-1] == "map" else "]"
+                if char == ",":
+                    self.pos += 1
+                    state = "key" if containers[-1] == "map" else "value"
+                    allow_close = False
+                elif char == closing:
+                    self.pos += 1
+                    yield ("end_map" if containers.pop() == "map" else "end_array", None)
+                else:
+                    self._error("Expecting ',' delimiter")
+                continue
+
+            if state == "key":
+                if char == "}" and allow_close:
+                    self.pos += 1
+                    containers.pop()
+                    yield ("end_map", None)
+                    state = "after"
+                    continue
+                if char != '"':
+                    self._error("Expecting property name enclosed in double quotes")
+                yield ("map_key", self._read_string())
+                if self._peek() != ":":
+                    self._error("Expecting ':' delimiter")
+                self.pos += 1
+                state = "value"
+                allow_close = False
+                continue
+
+            if char == "]" and allow_close:
+                self.pos += 1
+                containers.pop()
+                yield ("end_array", None)
+                state = "after"
+            elif char == "{":
+                self.pos += 1
+                containers.append("map")
+                yield ("start_map", None)
+                state = "key"
+                allow_close = True
+            elif char == "[":
+                self.pos += 1
+                containers.append("array")
+                yield ("start_array", None)
+                allow_close = True
+            elif char == '"':
+                yield ("value", self._read_string())
+                state = "after"
+            else:
+                yield ("value", self._read_scalar())
+                state = "after"
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        if self.pos > self.chunk_size:
+            self.buffer = self.buffer[self.pos :] + chunk
+            self.pos = 0
+        else:
+            self.buffer += chunk
         return True
-    if isinstance(value, dict):
-        return any(_contains_array(child_value) for child_value in value.values())
-    return False
+
+    def _peek(self) -> str:
+        while True:
+            if self.pos < len(self.buffer) and self.buffer[self.pos] not in _JSON_WHITESPACE:
+                return self.buffer[self.pos]
+            self.pos = _JSON_WHITESPACE_RE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def _read_string(self) -> str:
+        while True:
+            try:
+                value, end = scanstring(self.buffer, self.pos + 1, True)
+            except json.JSONDecodeError as exc:
+                may_be_truncated = exc.msg.startswith("Unterminated string") or exc.pos + 6 >= len(self.buffer)
+                if may_be_truncated and self._fill():
+                    continue
+                raise
+            self.pos = end
+            return value
+
+    def _read_scalar(self) -> Any:
+        while len(self.buffer) - self.pos < _JSON_SCALAR_LOOKAHEAD and self._fill():
+            pass
+        match = _JSON_NUMBER_RE.match(self.buffer, self.pos)
+        while match is not None and match.end() == len(self.buffer) and self._fill():
+            match = _JSON_NUMBER_RE.match(self.buffer, self.pos)
+        if match is not None:
+            integer, fraction, exponent = match.groups()
+            self.pos = match.end()
+            if fraction or exponent:
+                return Decimal(integer + (fraction or "") + (exponent or ""))
+            return int(integer)
+
+        for name, value in _JSON_CONSTANTS:
+            if self.buffer.startswith(name, self.pos):
+                self.pos += len(name)
+                return value
+        self._error("Expecting value")
+
+    def _error(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self.buffer, self.pos)
+
+
+def _next_event(events: Iterator[JsonEvent]) -> JsonEvent:
+    try:
+        return next(events)
+    except StopIteration:
+        raise json.JSONDecodeError("Expecting value", "", 0) from None
+
+
+def _expect_end_of_events(events: Iterator[JsonEvent]) -> None:
+    for _ in events:
+        pass
+
+
+def _build_event_value(event: str, value: Any, events: Iterator[JsonEvent]) -> Any:
+    """Materialize the JSON value that starts with ``event``."""
+    if event == "value":
+        return value
+
+    root: Any = {} if event == "start_map" else []
+    containers: list[Any] = [root]
+    keys: list[Any] = [None]
+    for event, value in events:
+        if event == "map_key":
+            keys[-1] = value
+            continue
+        if event in ("end_map", "end_array"):
+            containers.pop()
+            keys.pop()
+            if not containers:
+                return root
+            continue
+
+        if event == "start_map":
+            child: Any = {}
+        elif event == "start_array":
+            child = []
+        else:
+            child = value
+        parent = containers[-1]
+        if isinstance(parent, dict):
+            parent[keys[-1]] = child
+        else:
+            parent.append(child)
+        if event in ("start_map", "start_array"):
+            containers.append(child)
+            keys.append(None)
+    raise json.JSONDecodeError("Unexpected end of JSON input", "", 0)
+
+
+def _skip_event_value(event: str, events: Iterator[JsonEvent]) -> None:
+    if event == "value":
+        return
+    depth = 1
+    for event, _ in events:
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+            if depth == 0:
+                return
+
+
+def _iter_file_array_items(file_path: str, path: tuple[Any, ...], chunk_size: int) -> Iterator[Any]:
+    with open(file_path, "r", encoding="utf-8") as file:
+        events = iter_json_events(file, chunk_size)
+        event, value = _next_event(events)
+        yield from _iter_event_array_items(event, value, events, path)
+        _expect_end_of_events(events)
+
+
+def _iter_event_array_items(event: str, value: Any, events: Iterator[JsonEvent], path: tuple[Any, ...]) -> Iterator[Any]:
+    if not path:
+        if event != "start_array":
+            _skip_event_value(event, events)
+            return
+        for item_event, item_value in events:
+            if item_event == "end_array":
+                return
+            yield _build_event_value(item_event, item_value, events)
+        return
+
+    segment = path[0]
+    remaining_path = path[1:]
+    if isinstance(segment, int):
+        if event != "start_array":
+            _skip_event_value(event, events)
+            return
+        for index, (item_event, item_value) in enumerate(events):
+            if item_event == "end_array":
+                return
+            if index == segment:
+                yield from _iter_event_array_items(item_event, item_value, events, remaining_path)
+            else:
+                _skip_event_value(item_event, events)
+        return
+
+    if event != "start_map":
+        _skip_event_value(event, events)
+        return
+    for key_event, key in events:
+        if key_event == "end_map":
+            return
+        child_event, child_value = next(events)
+        if key == segment:
+            yield from _iter_event_array_items(child_event, child_value, events, remaining_path)
+        else:
+            _skip_event_value(child_event, events)
+
+
+def _analyze_event_value(
+    event: str,
+    value: Any,
+    events: Iterator[JsonEvent],
+    path: tuple[Any, ...],
+    label: str,
+    array_paths: _ArrayPathCollector,
+) -> JsonNode:
+    # (path, label, children by key) of the objects being read, innermost last.
+    open_objects: list[tuple[tuple[Any, ...], str, dict[str, JsonNode]]] = []
+    while True:
+        if event == "start_map":
+            open_objects.append((path, label, {}))
+            node: Optional[JsonNode] = None
+        elif event == "start_array":
+            node = _analyze_event_array(events, path, label, array_paths)
+        else:
+            node = _static_node(value, path, label)
+
+        while open_objects:
+            object_path, object_label, children = open_objects[-1]
+            if node is not None:
+                children[node.label] = node
+            key_event, key = next(events, ("end_map", None))
+            if key_event != "end_map":
+                event, value = next(events)
+                path = object_path + (key,)
+                label = str(key)
+                break
+            open_objects.pop()
+            node = JsonNode(
+                path=object_path,
+                display_path=format_path(object_path),
+                label=object_label,
+                kind="object",
+                depth=len(object_path),
+                children=tuple(children.values()),
+            )
+        else:
+            return node  # type: ignore[return-value]
+
+
+def _analyze_event_array(
+    events: Iterator[JsonEvent], path: tuple[Any, ...], label: str, array_paths: _ArrayPathCollector
+) -> JsonNode:
+    array_paths.add(path, [])
+    node = _static_node([], path, label)
+    batch: list[Any] = []
+    for index, (item_event, item_value) in enumerate(events):
+        if item_event == "end_array":
+            break
+        item = _build_event_value(item_event, item_value, events)
+        if isinstance(item, (dict, list)):
+            _collect_value_array_paths(item, path + (index,), path + (WILDCARD,), array_paths)
+        batch.append(item)
+        if len(batch) >= STREAM_ROW_BATCH_SIZE:
+            node = _merge_aggregate_nodes(node, _static_node(batch, path, label), source_count=1)
+            batch = []
+    if batch:
+        node = _merge_aggregate_nodes(node, _static_node(batch, path, label), source_count=1)
+    return node
+
+
+def _merge_aggregate_nodes(left: JsonNode, right: JsonNode, source_count: Optional[int] = None) -> JsonNode:
+    """Combine two nodes for the same path as if they had been built from all of their values."""
+    if left.kind == "array" and right.kind == "array":
+        if left.is_empty or right.is_empty:
+            filled = right if left.is_empty else left
+            is_object_array = filled.is_object_array
+            is_primitive_array = filled.is_primitive_array
+        else:
+            is_object_array = left.is_object_array and right.is_object_array
+            is_primitive_array = left.is_primitive_array and right.is_primitive_array
+        is_empty = left.is_empty and right.is_empty
+        has_nested_arrays = left.has_nested_arrays or right.has_nested_arrays
+        return replace(
+            left,
+            children=_merge_child_nodes(left.children, right.children) if is_object_array else (),
+            item_count=(left.item_count or 0) + (right.item_count or 0),
+            source_count=left.source_count + right.source_count if source_count is None else source_count,
+            is_empty=is_empty,
+            is_object_array=is_object_array,
+            is_primitive_array=is_primitive_array,
+            has_nested_arrays=has_nested_arrays,
+            exportable=is_object_array and not is_empty,
+            warning=_array_warning(is_empty, is_object_array, is_primitive_array, has_nested_arrays),
+        )
+
+    if left.kind == "object" and right.kind == "object":
+        return replace(left, children=_merge_child_nodes(left.children, right.children))
+
+    kind = left.kind if left.kind == right.kind else "mixed"
+    return JsonNode(path=left.path, display_path=left.display_path, label=left.label, kind=kind, depth=left.depth)
+
+
+def _merge_child_nodes(left: tuple[JsonNode, ...], right: tuple[JsonNode, ...]) -> tuple[JsonNode, ...]:
+    merged = {child.path: child for child in left}
+    for child in right:
+        existing = merged.get(child.path)
+        merged[child.path] = child if existing is None else _merge_aggregate_nodes(existing, child)
+    return tuple(merged.values())
 
 
 def _array_warning(is_empty: bool, is_object_array: bool, is_primitive_array: bool, has_nested_arrays: bool) -> Optional[str]:
@@ -768,23 +2260,35 @@ def _array_warning(is_empty: bool, is_object_array: bool, is_primitive_array: bo
     return None
 
 
-def _column_names(rows: list[Any]) -> list[str]:
-    dict_rows = [row for row in rows if isinstance(row, dict)]
-    names: list[str] = []
-    for row in dict_rows:
-        for key in row.keys():
-            if key not in names:
-                names.append(str(key))
-    return names
+def _column_names(rows: Iterable[Any]) -> list[str]:
+    """
+    Return object keys in first-seen order across rows.
+
+    Rows are grouped by their key tuple so each distinct shape is merged into
+    the header once; regular tables cost one tuple hash per row.
+    """
+    names: dict[str, None] = {}
+    shapes: set[tuple[str, ...]] = set()
+    for row in rows:
+        if not isinstance(row, dict):
+            continue
+        shape = tuple(row)
+        if shape in shapes:
+            continue
+        if len(shapes) < MAX_INTERNED_ROW_SHAPES:
+            shapes.add(shape)
+        names.update(dict.fromkeys(shape))
+    return [str(name) for name in names]
+
+
+def discover_column_names(rows: Iterable[Any]) -> tuple[str, ...]:
+    """Return column names for rows in one pass, without keeping the rows."""
+    return tuple(_column_names(rows))
 
 
-def _object_keys(objects: list[dict[str, Any]]) -> list[str]:
-    keys: list[str] = []
-    for obj in objects:
-        for key in obj.keys():
-            if key not in keys:
-                keys.append(str(key))
-    return keys
+def table_column_names(rows: list[Any]) -> tuple[str, ...]:
+    """Return table column names for rows in first-seen order."""
+    return tuple(_column_names(rows))
 
 
 def _infer_column_type(values: list[Any]) -> str:
@@ -839,7 +2343,12 @@ def build_output_path(output_folder: str, filename: str, extension: str) -> str:
 
 
 def records_to_dataframe(array_data: Optional[list[Any]]) -> TableData:
-    """Convert a JSON array of objects to exportable table data."""
+    """
+    Convert a JSON array of objects to exportable table data.
+
+    The rows are shared with ``array_data`` rather than copied, so the table
+    is not held in memory twice; cells are read through ``TableData.iter_rows``.
+    """
     if array_data is None:
         raise ArrayMateCoreError("Selected array is invalid")
 
@@ -849,51 +2358,301 @@ def records_to_dataframe(array_data: Optional[list[Any]]) -> TableData:
     if not isinstance(array_data[0], dict):
         raise ArrayMateCoreError("Array must contain objects with key-value pairs")
 
-    rows = tuple(dict(row) for row in array_data)
-    return TableData(rows=rows, columns=tuple(_column_names(rows)))
+    return TableData(rows=tuple(array_data), columns=table_column_names(array_data))
 
 
-def write_array_to_file(array_data: Optional[list[Any]], file_path: str, output_format: OutputFormat) -> TableData:
+def write_array_to_file(
+    array_data: Optional[Iterable[Any]],
+    file_path: str,
+    output_format: OutputFormat,
+    excel_writer: str = "openpyxl",
+    json_style: str = "pretty",
+    columns: Optional[Sequence[str]] = None,
+) -> ExportedTable:
     """
-    Write array data to disk and return the table data that was written.
+    Write array data to disk and return the header and row count that were written.
 
     Returning table metadata keeps the UI able to report rows and columns without
     duplicating conversion logic or depending on pandas at runtime.
+    ``excel_writer`` selects openpyxl or the built-in ``"native"`` XLSX writer;
+    ``json_style`` selects indented, compact or JSON Lines output.
+
+    Rows may be a list or any iterable. Iterables are written one row at a
+    time when ``columns`` gives the header up front; otherwise they are
+    collected into a list to discover it.
+
+    The file is written next to ``file_path`` under a temporary name and
+    moved into place when complete, so a failed export leaves any existing
+    file untouched.
     """
-    table = records_to_dataframe(array_data)
+    if excel_writer not in EXCEL_WRITERS:
+        raise ArrayMateCoreError(f"Unsupported Excel writer: {excel_writer}")
+    if json_style not in JSON_STYLES:
+        raise ArrayMateCoreError(f"Unsupported JSON style: {json_style}")
+    if output_format.label not in OUTPUT_FORMATS:
+        raise ArrayMateCoreError(f"Unsupported output format: {output_format.label}")
+    if array_data is None:
+        raise ArrayMateCoreError("Selected array is invalid")
+
+    if columns is None and not isinstance(array_data, list):
+        array_data = list(array_data)
+    records = _iter_export_records(array_data)
+    header = tuple(columns) if columns is not None else table_column_names(array_data)
+    value_rows = _iter_record_values(records, header)
+
     output_path = Path(file_path)
+    temp_path = output_path.with_name(f".{output_path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+    try:
+        if output_format.label == "Excel" and excel_writer == "native":
+            row_count = _write_native_xlsx(header, value_rows, temp_path)
+        elif output_format.label == "Excel":
+            row_count = _write_excel(header, value_rows, temp_path)
+        elif output_format.label == "CSV":
+            row_count = _write_csv(header, value_rows, temp_path)
+        else:
+            row_count = _write_json(records, temp_path, json_style)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+    return ExportedTable(columns=header, row_count=row_count)
+
+
+def _iter_export_records(rows: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Yield export rows, failing on the first non-object row or when there are none."""
+    wrote_rows = False
+    for row in rows:
+        if not isinstance(row, dict):
+            raise ArrayMateCoreError("Array must contain objects with key-value pairs")
+        wrote_rows = True
+        yield row
+    if not wrote_rows:
+        raise ArrayMateCoreError("Selected array is empty")
 
-    if output_format.label == "Excel":
-        _write_excel(table, output_path)
-    elif output_format.label == "CSV":
-        _write_csv(table, output_path)
-    elif output_format.label == "JSON":
-        output_path.write_text(
-            json.dumps(_json_export_value(array_data), ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
-    else:
-        raise ArrayMateCoreError(f"Unsupported output format: {output_format.label}")
 
-    return table
+def _iter_record_values(records: Iterable[dict[str, Any]], columns: Sequence[str]) -> Iterator[tuple[Any, ...]]:
+    for record in records:
+        yield tuple(record.get(column) for column in columns)
 
 
-def _write_excel(table: TableData, output_path: Path) -> None:
-    workbook = Workbook()
-    worksheet = workbook.active
-    worksheet.title = "Data"
-    worksheet.append(list(table.columns))
-    for row in table.rows:
-        worksheet.append([_spreadsheet_export_value(row.get(column)) for column in table.columns])
+def _write_excel(columns: Sequence[str], rows: Iterable[Sequence[Any]], output_path: Path) -> int:
+    # Write-only workbooks stream rows to a temporary file instead of keeping
+    # a cell object per value until save.
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Data")
+    worksheet.append(list(columns))
+    row_count = 0
+    for row in rows:
+        worksheet.append([_spreadsheet_export_value(value) for value in row])
+        row_count += 1
     workbook.save(output_path)
+    return row_count
 
 
-def _write_csv(table: TableData, output_path: Path) -> None:
-    with output_path.open("w", encoding="utf-8", newline="") as file:
+def _write_csv(columns: Sequence[str], rows: Iterable[Sequence[Any]], output_path: Path) -> int:
+    row_count = 0
+    with output_path.open("w", encoding="utf-8", newline="", buffering=EXPORT_BUFFER_SIZE) as file:
         writer = csv.writer(file)
-        writer.writerow(table.columns)
-        for row in table.rows:
-            writer.writerow([_csv_export_value(row.get(column)) for column in table.columns])
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow([_csv_export_value(value) for value in row])
+            row_count += 1
+    return row_count
+
+
+def _write_json(rows: Iterable[Any], output_path: Path, json_style: str) -> int:
+    """
+    Encode rows in small batches to a buffered file.
+
+    Decimals are written as strings through the encoder's ``default`` hook, so
+    no converted copy of the data is built. Pretty output matches
+    ``json.dumps(rows, indent=2)``.
+    """
+    if json_style == "lines":
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_json_default)
+        row_count = 0
+        with output_path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as file:
+            for row in rows:
+                file.write(_encode_json(row, encoder))
+                file.write("\n")
+                row_count += 1
+        return row_count
+
+    if json_style == "pretty":
+        # An indented list encodes as "[\n" + rows + "\n]", so batches are
+        # trimmed to their rows and joined with the list separator.
+        encoder = json.JSONEncoder(ensure_ascii=False, indent=2, default=_json_default)
+        opening, separator, closing, trim = "[\n", ",\n", "\n]", 2
+    else:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=_json_default)
+        opening, separator, closing, trim = "[", ",", "]", 1
+
+    row_count = 0
+    with output_path.open("w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as file:
+        for batch in _iter_batches(rows, EXPORT_ROW_BATCH_SIZE):
+            file.write(separator if row_count else opening)
+            file.write(_encode_json(batch, encoder)[trim:-trim])
+            row_count += len(batch)
+        file.write(closing if row_count else "[]")
+    return row_count
+
+
+def _iter_batches(items: Iterable[Any], batch_size: int) -> Iterator[list[Any]]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Nested cells are written as JSON text, with decimals as strings.
+_SPREADSHEET_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, default=_json_default)
+
+
+def _write_native_xlsx(columns: Sequence[str], rows: Iterable[Sequence[Any]], output_path: Path) -> int:
+    """
+    Write a single-sheet workbook by streaming sheet XML into the zip archive.
+
+    Strings go through a shared-strings table so repeated values are stored
+    once; the table is written after the sheet, when all strings are known.
+    """
+    column_refs = [_excel_column_name(index) for index in range(len(columns))]
+    shared_strings: dict[str, int] = {}
+    row_count = 0
+    with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            archive.writestr(name, content)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_XLSX_SHEET_HEADER.encode("utf-8"))
+            batch = [_xlsx_row(1, column_refs, columns, shared_strings)]
+            for row_number, row in enumerate(rows, start=2):
+                row_count += 1
+                batch.append(
+                    _xlsx_row(row_number, column_refs, [_spreadsheet_export_value(value) for value in row], shared_strings)
+                )
+                if len(batch) >= XLSX_ROW_BATCH_SIZE:
+                    sheet.write("".join(batch).encode("utf-8"))
+                    batch = []
+            batch.append("</sheetData></worksheet>")
+            sheet.write("".join(batch).encode("utf-8"))
+
+        with archive.open("xl/sharedStrings.xml", "w", force_zip64=True) as strings:
+            strings.write(
+                f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<sst xmlns="{_XLSX_MAIN_NS}" '
+                f'uniqueCount="{len(shared_strings)}">'.encode("utf-8")
+            )
+            batch = []
+            for text in shared_strings:
+                space = ' xml:space="preserve"' if text != text.strip() else ""
+                batch.append(f"<si><t{space}>{xml_escape(text)}</t></si>")
+                if len(batch) >= XLSX_ROW_BATCH_SIZE:
+                    strings.write("".join(batch).encode("utf-8"))
+                    batch = []
+            batch.append("</sst>")
+            strings.write("".join(batch).encode("utf-8"))
+    return row_count
+
+
+def _xlsx_row(row_number: int, column_refs: list[str], values: Sequence[Any], shared_strings: dict[str, int]) -> str:
+    cells = []
+    for column_ref, value in zip(column_refs, values):
+        if value is None:
+            continue
+        if value is True or value is False:
+            cells.append(f'<c r="{column_ref}{row_number}" t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, float):
+            # Like openpyxl, which writes non-finite floats as empty number cells.
+            if math.isfinite(value):
+                cells.append(f'<c r="{column_ref}{row_number}"><v>{value!r}</v></c>')
+        elif isinstance(value, int):
+            cells.append(f'<c r="{column_ref}{row_number}"><v>{value!r}</v></c>')
+        else:
+            text = str(value)
+            index = shared_strings.get(text)
+            if index is None:
+                if _XLSX_ILLEGAL_CHARACTERS_RE.search(text):
+                    raise ArrayMateCoreError(f"Cannot write control characters to Excel in row {row_number - 1}")
+                index = shared_strings[text] = len(shared_strings)
+            cells.append(f'<c r="{column_ref}{row_number}" t="s"><v>{index}</v></c>')
+    return f'<row r="{row_number}">{"".join(cells)}</row>'
+
+
+def _excel_column_name(index: int) -> str:
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = chr(ord("A") + remainder) + name
+    return name
+
+
+_XLSX_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_XLSX_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_XLSX_PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_XLSX_ILLEGAL_CHARACTERS_RE = re.compile(r"[\000-\010\013\014\016-\037]")
+_XLSX_SHEET_HEADER = (
+    f'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="{_XLSX_MAIN_NS}"><sheetData>'
+)
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/sharedStrings.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        "</Types>"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{_XLSX_PACKAGE_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<workbook xmlns="{_XLSX_MAIN_NS}" xmlns:r="{_XLSX_REL_NS}">'
+        '<sheets><sheet name="Data" sheetId="1" r:id="rId1"/></sheets>'
+        "</workbook>"
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{_XLSX_PACKAGE_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{_XLSX_REL_NS}/worksheet" Target="worksheets/sheet1.xml"/>'
+        f'<Relationship Id="rId2" Type="{_XLSX_REL_NS}/sharedStrings" Target="sharedStrings.xml"/>'
+        f'<Relationship Id="rId3" Type="{_XLSX_REL_NS}/styles" Target="styles.xml"/>'
+        "</Relationships>"
+    ),
+    "xl/styles.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<styleSheet xmlns="{_XLSX_MAIN_NS}">'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+        '<fill><patternFill patternType="gray125"/></fill></fills>'
+        '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+        '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+        "</styleSheet>"
+    ),
+}
 
 
 def _spreadsheet_export_value(value: Any) -> Any:
@@ -902,7 +2661,7 @@ def _spreadsheet_export_value(value: Any) -> Any:
     if isinstance(value, Decimal):
         return str(value)
     if isinstance(value, (dict, list)):
-        return json.dumps(_json_export_value(value), ensure_ascii=False)
+        return _encode_json(value, _SPREADSHEET_JSON_ENCODER)
     return value
 
 
@@ -910,13 +2669,3 @@ def _csv_export_value(value: Any) -> Any:
     if value is None:
         return ""
     return _spreadsheet_export_value(value)
-
-
-def _json_export_value(value: Any) -> Any:
-    if isinstance(value, Decimal):
-        return str(value)
-    if isinstance(value, dict):
-        return {key: _json_export_value(item) for key, item in value.items()}
-    if isinstance(value, list):
-        return [_json_export_value(item) for item in value]
-    return value
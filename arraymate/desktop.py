@@ -7,20 +7,20 @@ import json
 import os
 import platform
 import subprocess
+import threading
 import tkinter as tk
 import webbrowser
 from tkinter import filedialog, messagebox, ttk
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from arraymate.core import (
+    TRANSFORM_VALIDATION_SAMPLE_SIZE,
     ArrayCandidate,
     ArrayMateCoreError,
     ColumnTransform,
     TablePreview,
     TableTransformOptions,
-    build_table_preview,
     get_output_format,
-    infer_column_transform_types,
 )
 from arraymate.service import ArrayMateService, LoadResult
 
@@ -63,6 +63,7 @@ class ArrayMate:
         self.effective_candidate_key = ""
         self.auto_filename = True
         self.column_transforms: dict[str, ColumnTransform] = {}
+        self.column_check_cancel: Optional[threading.Event] = None
         self.current_preview_columns: list[str] = []
         self.advanced_column_combo: Optional[ttk.Combobox] = None
         self.advanced_type_combo: Optional[ttk.Combobox] = None
@@ -438,6 +439,7 @@ class ArrayMate:
         self.candidate_by_path = {}
         self.effective_candidate_key = ""
         self.column_transforms = {}
+        self._cancel_column_action_check()
         self.current_preview_columns = []
         self.service.clear()
         self.array_tree.delete(*self.array_tree.get_children())
@@ -527,6 +529,7 @@ class ArrayMate:
         self.array_keys = load_result.array_keys
         self.candidate_by_path = {candidate.display_path: candidate for candidate in load_result.array_candidates}
         self.column_transforms = {}
+        self._cancel_column_action_check()
         self._reset_column_action_form()
         self.array_tree.delete(*self.array_tree.get_children())
         self._clear_preview()
@@ -598,6 +601,7 @@ class ArrayMate:
         previous_key = self.selected_array_key.get()
         if previous_key and previous_key != candidate.display_path:
             self.column_transforms = {}
+            self._cancel_column_action_check()
             self._reset_column_action_form()
         self.selected_array_key.set(candidate.display_path)
         self._update_nested_candidate_action(candidate, reset_unfold=reset_unfold or previous_key != candidate.display_path)
@@ -618,15 +622,14 @@ class ArrayMate:
 
         if effective_candidate.exportable:
             try:
-                array_data = self.service.get_table_data(
+                preview = self.service.get_table_preview(
                     candidate.display_path,
                     unfold_key=unfold_key,
                     include_parent_metadata=self._include_parent_metadata_for(candidate),
                     transform_options=self._table_transform_options(),
                 )
-                if array_data is None:
+                if preview is None:
                     raise ArrayMateCoreError("Selected array is invalid")
-                preview = build_table_preview(array_data, effective_candidate.display_path)
                 self.array_info_label["text"] = self._candidate_detail_text(candidate, effective_candidate, preview)
                 self.warning_label["text"] = self._warning_text(effective_candidate, preview)
                 self._render_preview(preview)
@@ -864,19 +867,89 @@ class ArrayMate:
         else:
             next_transforms[column] = transform
 
+        validate = self._column_transform_validator(next_transforms, column)
         try:
-            self._validate_column_transforms(next_transforms)
+            validate(TRANSFORM_VALIDATION_SAMPLE_SIZE)
         except ArrayMateCoreError as e:
-            self.advanced_status.set(f"Cannot apply: {e}")
-            self.status_label["text"] = str(e)
-            self.status_label["foreground"] = "red"
+            self._reject_column_action(e)
             return
 
+        previous_transforms = self.column_transforms
         self.column_transforms = next_transforms
-        self.advanced_status.set(
-            f"No action set for {column}" if transform.data_type == "Keep" and not transform.find_text else self._column_action_status_text(transform)
-        )
+        self.advanced_status.set(f"{self._column_action_applied_text(transform)} | checking all rows...")
         self.refresh_selected_candidate()
+        self._start_column_action_check(validate, previous_transforms, next_transforms, transform)
+
+    def _start_column_action_check(
+        self,
+        validate: Callable[[Optional[int], Optional[Callable[[], None]]], None],
+        previous_transforms: dict[str, ColumnTransform],
+        applied_transforms: dict[str, ColumnTransform],
+        transform: ColumnTransform,
+    ) -> None:
+        """
+        Check every row on a worker thread after the sampled result is shown.
+
+        The thread touches no widgets: its outcome is handed to
+        ``_finish_column_action_check`` through ``root.after``. A newer action
+        or load cancels the check.
+        """
+        self._cancel_column_action_check()
+        cancel_event = threading.Event()
+        self.column_check_cancel = cancel_event
+
+        def checkpoint() -> None:
+            if cancel_event.is_set():
+                raise ArrayMateCoreError("Column check cancelled")
+
+        def check_all_rows() -> None:
+            error: Optional[Exception] = None
+            try:
+                validate(None, checkpoint)
+            except Exception as e:
+                error = e
+            if cancel_event.is_set():
+                return
+            try:
+                self.root.after(0, self._finish_column_action_check, error, previous_transforms, applied_transforms, transform)
+            except (RuntimeError, tk.TclError):
+                # The window was closed while the check ran.
+                pass
+
+        threading.Thread(target=check_all_rows, name="arraymate-column-check", daemon=True).start()
+
+    def _cancel_column_action_check(self) -> None:
+        if self.column_check_cancel is not None:
+            self.column_check_cancel.set()
+            self.column_check_cancel = None
+
+    def _finish_column_action_check(
+        self,
+        error: Optional[Exception],
+        previous_transforms: dict[str, ColumnTransform],
+        applied_transforms: dict[str, ColumnTransform],
+        transform: ColumnTransform,
+    ) -> None:
+        """Show the result of the full check; undo the action if a value failed."""
+        if self.column_transforms is not applied_transforms:
+            return
+        self.column_check_cancel = None
+        if error is not None:
+            self.column_transforms = previous_transforms
+            self._reject_column_action(error)
+            self.refresh_selected_candidate()
+            return
+        self.advanced_status.set(self._column_action_applied_text(transform))
+
+    def _reject_column_action(self, error: Exception) -> None:
+        self.advanced_status.set(f"Cannot apply: {error}")
+        self.status_label["text"] = str(error)
+        self.status_label["foreground"] = "red"
+
+    def _column_action_applied_text(self, transform: ColumnTransform) -> str:
+        if transform.data_type == "Keep" and not transform.find_text:
+            return f"No action set for {transform.column}"
+        return self._column_action_status_text(transform)
 
     def _clear_column_action(self) -> None:
         column = self.advanced_column.get()
@@ -902,23 +975,11 @@ class ArrayMate:
         return " | ".join(parts)
 
     def _possible_types_for_column(self, column: str) -> tuple[str, ...]:
-        if not column:
-            return ("Keep", "Text")
-
-        array_data = self._current_table_data_without_column_transforms()
-        return infer_column_transform_types(array_data, column)
-
-    def _column_type_hint(self, column: str, possible_types: tuple[str, ...]) -> str:
-        if not column:
-            return "No column selected"
-        return f"Possible types for {column}: {', '.join(possible_types)}"
-
-    def _current_table_data_without_column_transforms(self) -> Optional[list[Any]]:
         candidate = self.candidate_by_path.get(self.selected_array_key.get())
-        if candidate is None:
-            return None
+        if not column or candidate is None:
+            return ("Keep", "Text")
 
-        return self.service.get_table_data(
+        column_types = self.service.get_column_transform_types(
             candidate.display_path,
             unfold_key=self._unfold_key(),
             include_parent_metadata=self._include_parent_metadata_for(candidate),
@@ -927,25 +988,52 @@ class ArrayMate:
                 stringify_formulas=self.stringify_formulas.get(),
             ),
         )
+        return column_types.get(column, ("Keep", "Text"))
 
-    def _validate_column_transforms(self, column_transforms: dict[str, ColumnTransform]) -> None:
-        candidate = self.candidate_by_path.get(self.selected_array_key.get())
-        if candidate is None:
-            return
+    def _column_type_hint(self, column: str, possible_types: tuple[str, ...]) -> str:
+        if not column:
+            return "No column selected"
+        return f"Possible types for {column}: {', '.join(possible_types)}"
 
-        array_data = self.service.get_table_data(
-            candidate.display_path,
-            unfold_key=self._unfold_key(),
-            include_parent_metadata=self._include_parent_metadata_for(candidate),
-            transform_options=TableTransformOptions(
-                stringify_all=self.stringify_all.get(),
-                stringify_formulas=self.stringify_formulas.get(),
-                column_transforms=tuple(column_transforms.values()),
-            ),
+    def _column_transform_validator(
+        self,
+        column_transforms: dict[str, ColumnTransform],
+        column: Optional[str] = None,
+    ) -> Callable[[Optional[int], Optional[Callable[[], None]]], None]:
+        """
+        Capture the selected table and options for validating column transforms.
+
+        The returned function raises ``ArrayMateCoreError`` for the first value
+        that cannot be converted, checking at most ``sample_size`` rows when
+        one is given. It reads no widgets, so it can run on a worker thread.
+        """
+        service = self.service
+        candidate = self.candidate_by_path.get(self.selected_array_key.get())
+        unfold_key = self._unfold_key()
+        include_parent_metadata = bool(candidate and self._include_parent_metadata_for(candidate))
+        options = TableTransformOptions(
+            stringify_all=self.stringify_all.get(),
+            stringify_formulas=self.stringify_formulas.get(),
+            column_transforms=tuple(column_transforms.values()),
         )
-        if array_data is None:
-            raise ArrayMateCoreError("Selected array is invalid")
-        build_table_preview(array_data, self.effective_candidate_key or candidate.display_path)
+        columns = (column,) if column else None
+
+        def validate(sample_size: Optional[int], checkpoint: Optional[Callable[[], None]] = None) -> None:
+            if candidate is None:
+                return
+            issue = service.check_column_transforms(
+                candidate.display_path,
+                options,
+                unfold_key=unfold_key,
+                include_parent_metadata=include_parent_metadata,
+                columns=columns,
+                sample_size=sample_size,
+                checkpoint=checkpoint,
+            )
+            if issue is not None:
+                raise ArrayMateCoreError(issue.message)
+
+        return validate
 
     def _format_preview_value(self, value: Any) -> str:
         if isinstance(value, dict):
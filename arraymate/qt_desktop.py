@@ -7,13 +7,25 @@ import os
 import platform
 import subprocess
 import sys
+import threading
+import time
 import webbrowser
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional
-
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QAction, QIcon
+from typing import Any, Callable, Iterator, Optional, Sequence, Union
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
+from PySide6.QtGui import QAction, QCloseEvent, QIcon
 from PySide6.QtWidgets import (
     QApplication,
     QAbstractScrollArea,
@@ -31,11 +43,11 @@ from PySide6.QtWidgets import (
     QMainWindow,
     QMenu,
     QMessageBox,
+    QProgressBar,
     QPushButton,
     QSizePolicy,
     QSystemTrayIcon,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QTreeWidget,
     QTreeWidgetItem,
@@ -44,16 +56,199 @@ from PySide6.QtWidgets import (
 )
 
 from arraymate.core import (
+    TRANSFORM_VALIDATION_SAMPLE_SIZE,
     ArrayCandidate,
     ArrayMateCoreError,
     ColumnTransform,
     TablePreview,
     TableTransformOptions,
     build_table_preview,
+    check_json_syntax,
     get_output_format,
-    infer_column_transform_types,
+    iter_with_checkpoints,
 )
-from arraymate.service import ArrayMateService, LoadResult
+from arraymate.service import ArrayMateService, ExportResult, LoadResult
+
+
+class TaskCancelled(Exception):
+    """Raised inside a background task after its cancellation was requested."""
+
+
+class _TaskSignals(QObject):
+    progress = Signal(object, str)
+    finished = Signal(object, object)
+    failed = Signal(object, object)
+    cancelled = Signal(object)
+
+
+class _BackgroundTask(QRunnable):
+    """
+    One unit of work for one of the window's worker pools.
+
+    ``work`` receives the task so it can report progress and check for
+    cancellation; results and errors come back to the UI thread as signals.
+    Cancellation is cooperative: ``check_cancelled`` raises ``TaskCancelled``,
+    and the result of a task cancelled while running is discarded. Long
+    loops pass ``check_cancelled`` to the service as their ``checkpoint``.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        message: str,
+        work: Callable[["_BackgroundTask"], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[BaseException], None],
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.kind = kind
+        self.message = message
+        self.work = work
+        self.on_finished = on_finished
+        self.on_failed = on_failed
+        self.signals = _TaskSignals()
+        self.cancel_event = threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+
+    def check_cancelled(self) -> None:
+        if self.cancel_event.is_set():
+            raise TaskCancelled()
+
+    def report(self, message: str) -> None:
+        self.check_cancelled()
+        self.signals.progress.emit(self, message)
+
+    def run(self) -> None:
+        try:
+            self.check_cancelled()
+            result = self.work(self)
+            self.check_cancelled()
+        except TaskCancelled:
+            self.signals.cancelled.emit(self)
+        except Exception as e:
+            self.signals.failed.emit(self, e)
+        else:
+            self.signals.finished.emit(self, result)
+
+
+class TablePreviewModel(QAbstractTableModel):
+    """
+    Read-only view of a table's rows that formats cells only when they are shown.
+
+    Parsed tables are shown from the service's cached rows without copying
+    them, so any table can be scrolled at the cost of the visible cells.
+    Streamed tables start with the preview's first rows. When the view
+    reaches the end, ``request_rows`` is asked to read the next ``FETCH_ROWS``
+    from a lazy row iterator off the UI thread and hand them to
+    ``append_rows``. At most ``MAX_STREAMED_ROWS`` streamed rows are kept.
+    """
+
+    FETCH_ROWS = 200
+    MAX_STREAMED_ROWS = 100_000
+
+    def __init__(self, request_rows: Callable[[Iterator[Any], int], None], parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.request_rows = request_rows
+        self.rows: Sequence[dict[str, Any]] = ()
+        self.columns: tuple[str, ...] = ()
+        self.more_rows: Optional[Iterator[Any]] = None
+        self.fetching = False
+
+    def set_table(
+        self,
+        rows: Sequence[dict[str, Any]],
+        columns: Sequence[str],
+        more_rows: Optional[Iterator[Any]] = None,
+    ) -> None:
+        self.beginResetModel()
+        self.rows = list(rows) if more_rows is not None else rows
+        self.columns = tuple(columns)
+        self.more_rows = more_rows
+        self.fetching = False
+        self.endResetModel()
+
+    def clear(self) -> None:
+        self.set_table((), ())
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self.more_rows is not None and not self.fetching
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self.fetching = True
+        self.request_rows(self.more_rows, min(self.FETCH_ROWS, self.MAX_STREAMED_ROWS - len(self.rows)))
+
+    def append_rows(self, more_rows: Iterator[Any], batch: list[Any], exhausted: bool) -> None:
+        """Add a batch read from ``more_rows``, unless the table was replaced meanwhile."""
+        if more_rows is not self.more_rows:
+            return
+        self.fetching = False
+        if exhausted or len(self.rows) + len(batch) >= self.MAX_STREAMED_ROWS:
+            self.more_rows = None
+        if not batch:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(batch) - 1)
+        self.rows.extend(batch)
+        self.endInsertRows()
+
+    def stop_fetching(self) -> None:
+        self.more_rows = None
+        self.fetching = False
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self.cell_text(index.row(), index.column())
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.columns[section] if section < len(self.columns) else None
+        return str(section + 1)
+
+    def cell_text(self, row: int, column: int) -> str:
+        value = self.rows[row].get(self.columns[column])
+        if isinstance(value, dict):
+            return "[record]"
+        if isinstance(value, list):
+            return "[table]"
+        if value is None:
+            return ""
+        return str(value)
+
+
+def _read_editor_text(file_path: str, file_size: int, max_bytes: int, preview_bytes: int) -> str:
+    """Return a file's text for the JSON editor: whole up to ``max_bytes``, else its first ``preview_bytes``."""
+    if file_size <= max_bytes:
+        with open(file_path, "r", encoding="utf-8") as file:
+            return file.read()
+    with open(file_path, "rb") as file:
+        head = file.read(preview_bytes)
+    return head.decode("utf-8", errors="ignore")
+
+
+def _format_byte_size(size: int) -> str:
+    value = float(size)
+    for unit in ("bytes", "KB", "MB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "bytes" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GB"
 
 
 def resource_path(*parts: str) -> Path:
@@ -69,7 +264,12 @@ class ArrayMateWindow(QMainWindow):
 
     NO_UNFOLD_LABEL = "Keep selected table"
     REPOSITORY_URL = "https://github.com/MichaelD889872398743/ArrayMate"
-    MAX_PREVIEW_COLUMNS = 10
+    EDITOR_FULL_TEXT_BYTES = 1024 * 1024
+    EDITOR_PREVIEW_BYTES = 64 * 1024
+    AUTO_PARSE_FULL_TEXT_CHARS = 1024 * 1024
+    AUTO_PARSE_SETTLE_MS = 3000
+    CLOSE_TASK_WAIT_MS = 3000
+    DATA_TASK_KINDS = ("load", "parse", "preview", "fetch", "validate", "types")
 
     def __init__(self) -> None:
         super().__init__()
@@ -85,6 +285,14 @@ class ArrayMateWindow(QMainWindow):
         self.current_preview_columns: list[str] = []
         self.auto_filename = True
         self.suppress_text_auto_parse = False
+        self.task_pool = QThreadPool(self)
+        self.task_pool.setMaxThreadCount(1)
+        # Exports get their own thread, so previews and checks do not queue
+        # behind a long write.
+        self.export_pool = QThreadPool(self)
+        self.export_pool.setMaxThreadCount(1)
+        self.tasks: dict[str, _BackgroundTask] = {}
+        self.running_tasks: set[_BackgroundTask] = set()
 
         self._build_ui()
         self._apply_app_icons()
@@ -92,6 +300,10 @@ class ArrayMateWindow(QMainWindow):
         self.json_parse_timer.setSingleShot(True)
         self.json_parse_timer.setInterval(700)
         self.json_parse_timer.timeout.connect(self._auto_load_json_from_text)
+        self.json_settle_timer = QTimer(self)
+        self.json_settle_timer.setSingleShot(True)
+        self.json_settle_timer.setInterval(self.AUTO_PARSE_SETTLE_MS)
+        self.json_settle_timer.timeout.connect(self._settled_load_json_from_text)
         self.json_text.textChanged.connect(self._schedule_json_auto_parse)
         self._apply_styles()
 
@@ -160,10 +372,33 @@ class ArrayMateWindow(QMainWindow):
         workspace_layout.addWidget(self._preview_pane(), 1)
         workspace_layout.addWidget(self._right_pane(), 0)
 
+        root_layout.addWidget(self._status_bar())
+
+    def _status_bar(self) -> QWidget:
+        bar = QFrame()
+        bar.setObjectName("statusBar")
+        bar.setMinimumHeight(26)
+        layout = QHBoxLayout(bar)
+        layout.setContentsMargins(10, 0, 4, 0)
+        layout.setSpacing(8)
+
         self.status_label = QLabel("Ready to convert JSON arrays")
-        self.status_label.setObjectName("statusBar")
-        self.status_label.setMinimumHeight(26)
-        root_layout.addWidget(self.status_label)
+        layout.addWidget(self.status_label, 1)
+        self.task_label = QLabel("")
+        self.task_label.setVisible(False)
+        layout.addWidget(self.task_label)
+        self.task_progress_bar = QProgressBar()
+        self.task_progress_bar.setRange(0, 0)
+        self.task_progress_bar.setTextVisible(False)
+        self.task_progress_bar.setFixedSize(120, 10)
+        self.task_progress_bar.setVisible(False)
+        layout.addWidget(self.task_progress_bar)
+        self.cancel_task_button = QPushButton("Cancel")
+        self.cancel_task_button.setObjectName("statusButton")
+        self.cancel_task_button.setVisible(False)
+        self.cancel_task_button.clicked.connect(self.cancel_tasks)
+        layout.addWidget(self.cancel_task_button)
+        return bar
 
     def _source_bar(self) -> QWidget:
         header = QFrame()
@@ -262,9 +497,11 @@ class ArrayMateWindow(QMainWindow):
         self.cell_preview.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Fixed)
         preview_layout.addWidget(self.cell_preview)
 
-        self.preview_table = QTableWidget()
-        self.preview_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
-        self.preview_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.preview_model = TablePreviewModel(self._fetch_preview_rows, self)
+        self.preview_table = QTableView()
+        self.preview_table.setModel(self.preview_model)
+        self.preview_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
+        self.preview_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.preview_table.setAlternatingRowColors(False)
         self.preview_table.setWordWrap(False)
         self.preview_table.setCornerButtonEnabled(False)
@@ -280,7 +517,9 @@ class ArrayMateWindow(QMainWindow):
         self.preview_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
         self.preview_table.horizontalHeader().setDefaultSectionSize(150)
         self.preview_table.horizontalHeader().setMinimumSectionSize(80)
-        self.preview_table.itemSelectionChanged.connect(self._update_cell_preview)
+        self.preview_table.verticalHeader().setDefaultSectionSize(self.preview_table.fontMetrics().height() + 10)
+        self.preview_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.preview_table.selectionModel().currentChanged.connect(self._update_cell_preview)
         preview_layout.addWidget(self.preview_table, 1)
 
         layout.addWidget(preview_card, 1)
@@ -297,7 +536,13 @@ class ArrayMateWindow(QMainWindow):
         header.setObjectName("cardHeader")
         header_layout = QHBoxLayout(header)
         header_layout.setContentsMargins(12, 9, 12, 9)
-        header_layout.addWidget(QLabel("JSON Input"), 1)
+        header_layout.addWidget(QLabel("JSON Input"))
+        self.json_input_note = QLabel("")
+        self.json_input_note.setObjectName("mutedOnPanel")
+        header_layout.addWidget(self.json_input_note, 1)
+        load_button = QPushButton("Load")
+        load_button.clicked.connect(self.load_json_from_text)
+        header_layout.addWidget(load_button)
         clear_button = QPushButton("Clear")
         clear_button.clicked.connect(self.clear_json_text)
         header_layout.addWidget(clear_button)
@@ -486,15 +731,15 @@ class ArrayMateWindow(QMainWindow):
             #cardHeader { border-bottom: 1px solid #3c3c3c; }
             QGroupBox { border: 1px solid #3c3c3c; border-radius: 6px; margin-top: 8px; padding-top: 8px; }
             QGroupBox::title { subcontrol-origin: margin; left: 10px; padding: 0 4px; color: #d4d4d4; }
-            QLineEdit, QComboBox, QTextEdit, QTableWidget, QTreeWidget {
+            QLineEdit, QComboBox, QTextEdit, QTableView, QTreeWidget {
                 background: #1b1b1b; color: #d4d4d4; border: 1px solid #3c3c3c; border-radius: 4px;
                 selection-background-color: #094771;
             }
-            QTableWidget, QTreeWidget {
+            QTableView, QTreeWidget {
                 gridline-color: #3c3c3c;
                 alternate-background-color: #1b1b1b;
             }
-            QTableWidget::viewport, QTreeWidget::viewport {
+            QTableView::viewport, QTreeWidget::viewport {
                 background: #1b1b1b;
             }
             #cellInspector {
@@ -505,7 +750,7 @@ class ArrayMateWindow(QMainWindow):
                 font-family: Consolas;
                 padding: 6px;
             }
-            QTableWidget QTableCornerButton::section, QTreeWidget QTableCornerButton::section {
+            QTableView QTableCornerButton::section, QTreeWidget QTableCornerButton::section {
                 background: #202020;
                 border: 0;
                 border-right: 1px solid #3c3c3c;
@@ -524,13 +769,104 @@ class ArrayMateWindow(QMainWindow):
             #primaryButton:hover { background: #1688d1; }
             QCheckBox { color: #d4d4d4; spacing: 8px; }
             #jsonEditor { font-family: Consolas; }
-            #statusBar { background: #007acc; color: white; padding-left: 10px; }
+            #statusBar { background: #007acc; }
+            #statusBar QLabel { color: white; }
+            #statusBar QProgressBar { background: #1688d1; border: 0; border-radius: 4px; }
+            #statusBar QProgressBar::chunk { background: white; border-radius: 4px; }
+            #statusButton { background: transparent; color: white; border: 1px solid white; padding: 1px 8px; }
+            #statusButton:hover { background: #1688d1; }
             QMessageBox { background: #252526; color: #d4d4d4; }
             QMessageBox QLabel { color: #d4d4d4; }
             QMessageBox QPushButton { min-width: 72px; }
             """
         )
 
+    def closeEvent(self, event: QCloseEvent) -> None:
+        self.cancel_tasks()
+        pools = (self.task_pool, self.export_pool)
+        for pool in pools:
+            pool.clear()
+        deadline = time.monotonic() + self.CLOSE_TASK_WAIT_MS / 1000
+        for pool in pools:
+            pool.waitForDone(max(0, int((deadline - time.monotonic()) * 1000)))
+        super().closeEvent(event)
+
+    def _start_task(
+        self,
+        kind: str,
+        message: str,
+        work: Callable[[_BackgroundTask], Any],
+        on_finished: Callable[[Any], None],
+        on_failed: Callable[[BaseException], None],
+    ) -> None:
+        """Run ``work`` on a worker thread, replacing any running task of the same kind."""
+        self._cancel_task(kind)
+        task = _BackgroundTask(kind, message, work, on_finished, on_failed)
+        task.signals.progress.connect(self._on_task_progress)
+        task.signals.finished.connect(self._on_task_finished)
+        task.signals.failed.connect(self._on_task_failed)
+        task.signals.cancelled.connect(self._on_task_cancelled)
+        self.tasks[kind] = task
+        self.running_tasks.add(task)
+        self._update_task_controls()
+        (self.export_pool if kind == "export" else self.task_pool).start(task)
+
+    def _cancel_task(self, kind: str) -> None:
+        task = self.tasks.pop(kind, None)
+        if task is not None:
+            task.cancel()
+            self._update_task_controls()
+
+    def cancel_tasks(self, kinds: Optional[Sequence[str]] = None) -> None:
+        """Cancel the running tasks of ``kinds``, or every task when it is ``None``."""
+        kinds = [kind for kind in self.tasks if kinds is None or kind in kinds]
+        if not kinds:
+            return
+        if "export" in kinds:
+            self.process_button.setEnabled(bool(self.selected_array_key))
+        if "fetch" in kinds:
+            # The cancelled read may still be advancing the row iterator.
+            self.preview_model.stop_fetching()
+        for kind in kinds:
+            self._cancel_task(kind)
+        self.status_label.setText("Cancelled")
+
+    def _is_current_task(self, task: _BackgroundTask) -> bool:
+        return self.tasks.get(task.kind) is task
+
+    def _finish_task(self, task: _BackgroundTask) -> bool:
+        """Forget a task that stopped; return whether its result is still wanted."""
+        self.running_tasks.discard(task)
+        if not self._is_current_task(task):
+            return False
+        del self.tasks[task.kind]
+        self._update_task_controls()
+        return True
+
+    def _on_task_progress(self, task: _BackgroundTask, message: str) -> None:
+        if self._is_current_task(task):
+            task.message = message
+            self.task_label.setText(message)
+
+    def _on_task_finished(self, task: _BackgroundTask, result: Any) -> None:
+        if self._finish_task(task):
+            task.on_finished(result)
+
+    def _on_task_failed(self, task: _BackgroundTask, error: BaseException) -> None:
+        if self._finish_task(task):
+            task.on_failed(error)
+
+    def _on_task_cancelled(self, task: _BackgroundTask) -> None:
+        self._finish_task(task)
+
+    def _update_task_controls(self) -> None:
+        busy = bool(self.tasks)
+        if busy:
+            self.task_label.setText(next(reversed(self.tasks.values())).message)
+        self.task_label.setVisible(busy)
+        self.task_progress_bar.setVisible(busy)
+        self.cancel_task_button.setVisible(busy)
+
     def browse_json_file(self) -> None:
         file_path, _ = QFileDialog.getOpenFileName(self, "Select JSON File", "", "JSON files (*.json);;All files (*.*)")
         if file_path:
@@ -543,64 +879,152 @@ class ArrayMateWindow(QMainWindow):
             self.browse_json_file()
             return
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as file:
-                json_text = file.read()
-            self.suppress_text_auto_parse = True
-            self.json_text.setPlainText(json_text)
-            self.suppress_text_auto_parse = False
-            self._load_json_from_text(show_errors=True, source_label="JSON file", clear_file_path=False)
-        except Exception as e:
-            QMessageBox.critical(self, "Error loading file", f"Error loading file: {e}")
-            self.status_label.setText("Error loading file")
+        self.json_parse_timer.stop()
+        self.json_settle_timer.stop()
+        self._cancel_task("parse")
+        file_name = os.path.basename(file_path)
+
+        def load(task: _BackgroundTask) -> tuple[str, int, ArrayMateService, Union[LoadResult, json.JSONDecodeError]]:
+            file_size = os.path.getsize(file_path)
+            editor_text = _read_editor_text(file_path, file_size, self.EDITOR_FULL_TEXT_BYTES, self.EDITOR_PREVIEW_BYTES)
+            task.report(f"Parsing {file_name}")
+            service = ArrayMateService()
+            try:
+                return editor_text, file_size, service, service.load_file(file_path, checkpoint=task.check_cancelled)
+            except json.JSONDecodeError as e:
+                return editor_text, file_size, service, e
+
+        self._start_task("load", f"Reading {file_name}", load, self._apply_loaded_file, self._show_file_load_error)
+
+    def _apply_loaded_file(
+        self,
+        loaded: tuple[str, int, ArrayMateService, Union[LoadResult, json.JSONDecodeError]],
+    ) -> None:
+        editor_text, file_size, service, load_result = loaded
+        self._show_file_text(editor_text, file_size)
+        if isinstance(load_result, json.JSONDecodeError):
+            self._show_load_error(load_result, show_errors=True)
+            return
+        self.service = service
+        self._show_load_result(load_result, "JSON file", show_errors=True)
+
+    def _show_file_text(self, editor_text: str, file_size: int) -> None:
+        """Show a loaded file in the editor; large files get a read-only view of their start."""
+        truncated = file_size > self.EDITOR_FULL_TEXT_BYTES
+        self.suppress_text_auto_parse = True
+        self.json_text.setPlainText(editor_text)
+        self.suppress_text_auto_parse = False
+        self.json_text.setReadOnly(truncated)
+        self.json_input_note.setText(
+            f"Read-only: first {_format_byte_size(self.EDITOR_PREVIEW_BYTES)} of {_format_byte_size(file_size)}"
+            if truncated
+            else ""
+        )
+
+    def _show_file_load_error(self, error: BaseException) -> None:
+        QMessageBox.critical(self, "Error loading file", f"Error loading file: {error}")
+        self.status_label.setText("Error loading file")
 
     def _schedule_json_auto_parse(self) -> None:
         if self.suppress_text_auto_parse:
             return
-        if not self.json_text.toPlainText().strip():
+        self._cancel_task("parse")
+        self.json_settle_timer.stop()
+        if self.json_text.document().isEmpty():
+            self.json_parse_timer.stop()
             return
         self.json_parse_timer.start()
 
     def _auto_load_json_from_text(self) -> None:
-        self._load_json_from_text(show_errors=False)
+        if self.json_text.isReadOnly():
+            return
+        json_text = self.json_text.toPlainText()
+        if len(json_text) > self.AUTO_PARSE_FULL_TEXT_CHARS:
+            self._check_json_text(json_text)
+        else:
+            self._parse_json_text(json_text, show_errors=False)
+
+    def _settled_load_json_from_text(self) -> None:
+        if not self.json_text.isReadOnly():
+            self._parse_json_text(self.json_text.toPlainText(), show_errors=False)
 
     def load_json_from_text(self) -> None:
-        self._load_json_from_text(show_errors=True)
+        if self.json_text.isReadOnly():
+            self.status_label.setText("Loaded file is shown read-only; clear the input to paste JSON")
+            return
+        self._parse_json_text(self.json_text.toPlainText(), show_errors=True)
 
-    def _load_json_from_text(
-        self,
-        show_errors: bool,
-        source_label: str = "JSON data",
-        clear_file_path: bool = True,
-    ) -> None:
-        json_text = self.json_text.toPlainText().strip()
-        if not json_text:
+    def _check_json_text(self, json_text: str) -> None:
+        """Check large pasted text for valid syntax only; discovery waits until the text settles."""
+        text_size = _format_byte_size(len(json_text.encode("utf-8")))
+
+        def show_valid(_: None) -> None:
+            self.warning_label.setText(
+                f"Valid JSON ({text_size}). The structure is loaded when editing pauses or on Load."
+            )
+            self.status_label.setText("Valid JSON input")
+            self.json_settle_timer.start()
+
+        self._start_task(
+            "parse",
+            f"Checking JSON syntax ({text_size})",
+            lambda task: check_json_syntax(json_text),
+            show_valid,
+            lambda error: self._show_load_error(error, show_errors=False),
+        )
+
+    def _parse_json_text(self, json_text: str, show_errors: bool) -> None:
+        self.json_parse_timer.stop()
+        self.json_settle_timer.stop()
+        if not json_text or json_text.isspace():
             return
 
-        try:
-            load_result = self.service.load_text(json_text)
-            if clear_file_path:
-                self.file_path_edit.setText("")
-            self._apply_load_result(load_result, source_label)
-            if not load_result.array_candidates:
-                self.warning_label.setText("No arrays found in the JSON data")
-                self.status_label.setText("No arrays found in JSON data")
-                if show_errors:
-                    QMessageBox.warning(self, "No arrays found", "No arrays found in the JSON data")
-        except json.JSONDecodeError as e:
-            self.warning_label.setText(f"Invalid JSON format: {e}")
-            self.status_label.setText("Waiting for valid JSON input")
+        def parse(task: _BackgroundTask) -> tuple[ArrayMateService, LoadResult]:
+            service = ArrayMateService()
+            return service, service.load_text(json_text, checkpoint=task.check_cancelled)
+
+        def show_parsed(parsed: tuple[ArrayMateService, LoadResult]) -> None:
+            self.service, load_result = parsed
+            self.file_path_edit.setText("")
+            self._show_load_result(load_result, "JSON data", show_errors)
+
+        self._cancel_task("load")
+        self._start_task(
+            "parse",
+            "Parsing JSON input",
+            parse,
+            show_parsed,
+            lambda error: self._show_load_error(error, show_errors),
+        )
+
+    def _show_load_result(self, load_result: LoadResult, source_label: str, show_errors: bool) -> None:
+        self._apply_load_result(load_result, source_label)
+        if not load_result.array_candidates:
+            self.warning_label.setText("No arrays found in the JSON data")
+            self.status_label.setText("No arrays found in JSON data")
             if show_errors:
-                QMessageBox.critical(self, "Invalid JSON", f"Invalid JSON format: {e}")
-        except Exception as e:
-            self.warning_label.setText(f"Error parsing JSON: {e}")
-            self.status_label.setText("Error parsing JSON")
+                QMessageBox.warning(self, "No arrays found", "No arrays found in the JSON data")
+
+    def _show_load_error(self, error: BaseException, show_errors: bool) -> None:
+        if isinstance(error, json.JSONDecodeError):
+            self.warning_label.setText(f"Invalid JSON format: {error}")
+            self.status_label.setText("Waiting for valid JSON input")
             if show_errors:
-                QMessageBox.critical(self, "Error parsing JSON", f"Error parsing JSON: {e}")
+                QMessageBox.critical(self, "Invalid JSON", f"Invalid JSON format: {error}")
+            return
+        self.warning_label.setText(f"Error parsing JSON: {error}")
+        self.status_label.setText("Error parsing JSON")
+        if show_errors:
+            QMessageBox.critical(self, "Error parsing JSON", f"Error parsing JSON: {error}")
 
     def clear_json_text(self) -> None:
+        self.json_parse_timer.stop()
+        self.json_settle_timer.stop()
+        self.cancel_tasks(self.DATA_TASK_KINDS)
         self.suppress_text_auto_parse = True
         self.json_text.clear()
+        self.json_text.setReadOnly(False)
+        self.json_input_note.setText("")
         self.suppress_text_auto_parse = False
         self.file_path_edit.clear()
         self.candidate_by_path = {}
@@ -649,6 +1073,8 @@ class ArrayMateWindow(QMainWindow):
         self.clear_json_text()
 
     def _apply_load_result(self, load_result: LoadResult, source_label: str) -> None:
+        self._cancel_task("preview")
+        self._cancel_task("validate")
         self.candidate_by_path = {candidate.display_path: candidate for candidate in load_result.array_candidates}
         self.column_transforms = {}
         self._reset_column_action_form()
@@ -707,6 +1133,7 @@ class ArrayMateWindow(QMainWindow):
     def _select_candidate(self, candidate: ArrayCandidate, reset_unfold: bool = True) -> None:
         previous_key = self.selected_array_key
         if previous_key and previous_key != candidate.display_path:
+            self._cancel_task("validate")
             self.column_transforms = {}
             self._reset_column_action_form()
         self.selected_array_key = candidate.display_path
@@ -724,30 +1151,75 @@ class ArrayMateWindow(QMainWindow):
         self._refresh_auto_filename(effective_candidate.display_path)
 
         if effective_candidate.exportable:
-            try:
-                array_data = self.service.get_table_data(
-                    candidate.display_path,
-                    unfold_key=unfold_key,
-                    include_parent_metadata=self._include_parent_metadata_for(candidate),
-                    transform_options=self._table_transform_options(),
-                )
-                if array_data is None:
-                    raise ArrayMateCoreError("Selected array is invalid")
-                preview = build_table_preview(array_data, effective_candidate.display_path)
-                self.array_info_label.setText(self._candidate_detail_text(candidate, effective_candidate, preview))
-                self.warning_label.setText(self._warning_text(effective_candidate, preview))
-                self._render_preview(preview)
-                self.process_button.setEnabled(True)
-            except ArrayMateCoreError as e:
-                self.warning_label.setText(str(e))
-                self._clear_preview(str(e))
-                self.process_button.setEnabled(False)
+            self.process_button.setEnabled(False)
+            self._start_preview(candidate, effective_candidate, unfold_key)
         else:
+            self._cancel_task("preview")
             self.array_info_label.setText(self._candidate_detail_text(candidate, effective_candidate))
             self.warning_label.setText(effective_candidate.warning or "This array is not exportable as a table.")
             self._clear_preview(effective_candidate.warning or "This array is not exportable as a table.")
             self.process_button.setEnabled(False)
 
+    def _start_preview(
+        self,
+        candidate: ArrayCandidate,
+        effective_candidate: ArrayCandidate,
+        unfold_key: Optional[str],
+    ) -> None:
+        service = self.service
+        include_parent_metadata = self._include_parent_metadata_for(candidate)
+        transform_options = self._table_transform_options()
+
+        def build_preview(task: _BackgroundTask) -> tuple[TablePreview, Sequence[Any], Optional[Iterator[Any]]]:
+            if not service.is_streaming:
+                # The cached table is shared with the model, so transform
+                # edits re-derive only the changed columns.
+                rows = service.get_table_data(
+                    candidate.display_path, unfold_key, include_parent_metadata, transform_options, task.check_cancelled
+                )
+                if rows is None:
+                    raise ArrayMateCoreError("Selected array is invalid")
+                preview = build_table_preview(
+                    iter_with_checkpoints(rows, task.check_cancelled), effective_candidate.display_path, max_rows=0
+                )
+                return preview, rows, None
+
+            preview = service.get_table_preview(
+                candidate.display_path,
+                unfold_key=unfold_key,
+                include_parent_metadata=include_parent_metadata,
+                transform_options=transform_options,
+                max_rows=TablePreviewModel.FETCH_ROWS,
+                checkpoint=task.check_cancelled,
+            )
+            if preview is None:
+                raise ArrayMateCoreError("Selected array is invalid")
+            more_rows = None
+            if preview.rows > len(preview.preview_rows):
+                rows = service.iter_table_rows(candidate.display_path, unfold_key, include_parent_metadata, transform_options)
+                more_rows = islice(rows, len(preview.preview_rows), None) if rows is not None else None
+            return preview, preview.preview_rows, more_rows
+
+        def show_preview(table: tuple[TablePreview, Sequence[Any], Optional[Iterator[Any]]]) -> None:
+            preview, rows, more_rows = table
+            self.array_info_label.setText(self._candidate_detail_text(candidate, effective_candidate, preview))
+            self.warning_label.setText(self._warning_text(effective_candidate, preview))
+            self._render_preview(preview, rows, more_rows)
+            self.process_button.setEnabled("export" not in self.tasks)
+
+        def show_preview_error(error: BaseException) -> None:
+            self.warning_label.setText(str(error))
+            self._clear_preview(str(error))
+            self.process_button.setEnabled(False)
+
+        self._start_task(
+            "preview",
+            f"Building preview of {effective_candidate.display_path}",
+            build_preview,
+            show_preview,
+            show_preview_error,
+        )
+
     def _candidate_detail_text(
         self,
         candidate: ArrayCandidate,
@@ -827,45 +1299,54 @@ class ArrayMateWindow(QMainWindow):
         self.nested_candidate_combo.setEnabled(False)
         self.nested_candidate_combo.blockSignals(False)
 
-    def _render_preview(self, preview: TablePreview) -> None:
-        columns = [column.name for column in preview.columns[: self.MAX_PREVIEW_COLUMNS]]
+    def _render_preview(
+        self,
+        preview: TablePreview,
+        rows: Sequence[Any],
+        more_rows: Optional[Iterator[Any]] = None,
+    ) -> None:
         self.current_preview_columns = [column.name for column in preview.columns]
         self._refresh_column_action_columns()
-        self.preview_table.clear()
-        self.preview_table.setColumnCount(len(columns))
-        self.preview_table.setHorizontalHeaderLabels(columns)
-        preview_rows = preview.preview_rows[:6]
-        self.preview_table.setRowCount(len(preview_rows))
-        for row_index, row in enumerate(preview_rows):
-            for column_index, column_name in enumerate(columns):
-                self.preview_table.setItem(row_index, column_index, QTableWidgetItem(self._format_preview_value(row.get(column_name))))
-        self._size_preview_columns(len(columns))
+        self.preview_model.set_table(rows, self.current_preview_columns, more_rows)
         self._update_cell_preview()
-        type_summary = ", ".join(sorted({column.inferred_type for column in preview.columns[: self.MAX_PREVIEW_COLUMNS]}))
+        type_summary = ", ".join(sorted({column.inferred_type for column in preview.columns}))
         warning_text = f" | {'; '.join(preview.warnings)}" if preview.warnings else ""
         summary = f"{preview.rows} rows | {len(preview.columns)} columns"
+        if more_rows is not None and preview.rows > TablePreviewModel.MAX_STREAMED_ROWS:
+            summary = f"{summary} | scrolling shows the first {TablePreviewModel.MAX_STREAMED_ROWS:,}"
         if type_summary:
             summary = f"{summary} | types: {type_summary}"
         self.preview_label.setText(f"{summary}{warning_text}")
         self.preview_label.setToolTip("\n".join(f"{column.name}: {column.inferred_type}" for column in preview.columns))
 
-    def _size_preview_columns(self, column_count: int) -> None:
-        for column_index in range(column_count):
-            self.preview_table.setColumnWidth(column_index, 150)
+    def _fetch_preview_rows(self, more_rows: Iterator[Any], count: int) -> None:
+        """Read the next ``count`` streamed preview rows on the worker pool."""
+
+        def fetch(task: _BackgroundTask) -> list[Any]:
+            return list(islice(more_rows, count))
+
+        def show_rows(batch: list[Any]) -> None:
+            self.preview_model.append_rows(more_rows, batch, exhausted=len(batch) < count)
+
+        def show_fetch_error(error: BaseException) -> None:
+            if more_rows is not self.preview_model.more_rows:
+                return
+            self.preview_model.stop_fetching()
+            self.warning_label.setText(f"Cannot read more rows: {error}")
+            self.status_label.setText(f"Cannot read more rows: {error}")
+
+        self._start_task("fetch", "Reading more preview rows", fetch, show_rows, show_fetch_error)
 
     def _update_cell_preview(self) -> None:
-        item = self.preview_table.currentItem()
-        if item is None:
+        index = self.preview_table.currentIndex()
+        if not index.isValid():
             self.cell_preview.clear()
             return
-        column_item = self.preview_table.horizontalHeaderItem(item.column())
-        column_name = column_item.text() if column_item is not None else f"Column {item.column() + 1}"
-        self.cell_preview.setPlainText(f"{column_name}: {item.text()}")
+        column_name = self.preview_model.columns[index.column()]
+        self.cell_preview.setPlainText(f"{column_name}: {self.preview_model.cell_text(index.row(), index.column())}")
 
     def _clear_preview(self, message: str = "Select an exportable array to preview rows.") -> None:
-        self.preview_table.clear()
-        self.preview_table.setRowCount(0)
-        self.preview_table.setColumnCount(0)
+        self.preview_model.clear()
         self.cell_preview.clear()
         self.current_preview_columns = []
         self._refresh_column_action_columns()
@@ -893,7 +1374,41 @@ class ArrayMateWindow(QMainWindow):
 
     def _load_column_action(self) -> None:
         column = self.advanced_column_combo.currentText() if self.advanced_column_combo is not None else ""
-        possible_types = self._possible_types_for_column(column)
+        candidate = self.candidate_by_path.get(self.selected_array_key)
+        if not column or candidate is None:
+            self._cancel_task("types")
+            self._show_column_action(column, ("Keep", "Text"))
+            return
+
+        service = self.service
+        unfold_key = self._unfold_key()
+        include_parent_metadata = self._include_parent_metadata_for(candidate)
+        transform_options = TableTransformOptions(
+            stringify_all=self.stringify_all_check.isChecked(),
+            stringify_formulas=self.stringify_formulas_check.isChecked(),
+        )
+
+        def possible_types(task: _BackgroundTask) -> tuple[str, ...]:
+            column_types = service.get_column_transform_types(
+                candidate.display_path,
+                unfold_key=unfold_key,
+                include_parent_metadata=include_parent_metadata,
+                transform_options=transform_options,
+                checkpoint=task.check_cancelled,
+            )
+            return column_types.get(column, ("Keep", "Text"))
+
+        self._show_column_action(column, ("Keep", "Text"))
+        self.advanced_status_label.setText(f"Checking possible types for {column}...")
+        self._start_task(
+            "types",
+            f"Checking possible types for {column}",
+            possible_types,
+            lambda types: self._show_column_action(column, types),
+            lambda error: self.advanced_status_label.setText(f"Cannot check {column}: {error}"),
+        )
+
+    def _show_column_action(self, column: str, possible_types: tuple[str, ...]) -> None:
         self.advanced_type_combo.blockSignals(True)
         self.advanced_type_combo.clear()
         self.advanced_type_combo.addItems(possible_types)
@@ -927,18 +1442,35 @@ class ArrayMateWindow(QMainWindow):
             next_transforms.pop(column, None)
         else:
             next_transforms[column] = transform
-        try:
-            self._validate_column_transforms(next_transforms)
-        except ArrayMateCoreError as e:
-            self.advanced_status_label.setText(f"Cannot apply: {e}")
-            self.status_label.setText(str(e))
-            return
-        self.column_transforms = next_transforms
+        validate = self._column_transform_validator(next_transforms, column)
+
+        def check(task: _BackgroundTask) -> None:
+            validate(TRANSFORM_VALIDATION_SAMPLE_SIZE, task.check_cancelled)
+            task.report(f"Checking column {column} in all rows")
+            validate(None, task.check_cancelled)
+
+        self.advanced_status_label.setText(f"Checking {column}...")
+        self._start_task(
+            "validate",
+            f"Checking column {column}",
+            check,
+            lambda _: self._apply_column_action(next_transforms, transform),
+            self._reject_column_action,
+        )
+
+    def _apply_column_action(self, column_transforms: dict[str, ColumnTransform], transform: ColumnTransform) -> None:
+        self.column_transforms = column_transforms
         self.advanced_status_label.setText(
-            f"No action set for {column}" if transform.data_type == "Keep" and not transform.find_text else self._column_action_status_text(transform)
+            f"No action set for {transform.column}"
+            if transform.data_type == "Keep" and not transform.find_text
+            else self._column_action_status_text(transform)
         )
         self.refresh_selected_candidate()
 
+    def _reject_column_action(self, error: BaseException) -> None:
+        self.advanced_status_label.setText(f"Cannot apply: {error}")
+        self.status_label.setText(str(error))
+
     def _clear_column_action(self) -> None:
         column = self.advanced_column_combo.currentText()
         if column:
@@ -966,57 +1498,50 @@ class ArrayMateWindow(QMainWindow):
             parts.append(f"replace '{transform.find_text}' with '{transform.replace_text}'")
         return " | ".join(parts)
 
-    def _possible_types_for_column(self, column: str) -> tuple[str, ...]:
-        if not column:
-            return ("Keep", "Text")
-        array_data = self._current_table_data_without_column_transforms()
-        return infer_column_transform_types(array_data, column)
-
     def _column_type_hint(self, column: str, possible_types: tuple[str, ...]) -> str:
         if not column:
             return "No column selected"
         return f"Possible types for {column}: {', '.join(possible_types)}"
 
-    def _current_table_data_without_column_transforms(self) -> Optional[list[Any]]:
-        candidate = self.candidate_by_path.get(self.selected_array_key)
-        if candidate is None:
-            return None
-        return self.service.get_table_data(
-            candidate.display_path,
-            unfold_key=self._unfold_key(),
-            include_parent_metadata=self._include_parent_metadata_for(candidate),
-            transform_options=TableTransformOptions(
-                stringify_all=self.stringify_all_check.isChecked(),
-                stringify_formulas=self.stringify_formulas_check.isChecked(),
-            ),
-        )
-
-    def _validate_column_transforms(self, column_transforms: dict[str, ColumnTransform]) -> None:
+    def _column_transform_validator(
+        self,
+        column_transforms: dict[str, ColumnTransform],
+        column: Optional[str] = None,
+    ) -> Callable[[Optional[int], Optional[Callable[[], None]]], None]:
+        """
+        Capture the selected table and options for validating column transforms.
+
+        The returned function raises ``ArrayMateCoreError`` for the first value
+        that cannot be converted. It reads no widgets, so it can run on the
+        worker thread.
+        """
+        service = self.service
         candidate = self.candidate_by_path.get(self.selected_array_key)
-        if candidate is None:
-            return
-        array_data = self.service.get_table_data(
-            candidate.display_path,
-            unfold_key=self._unfold_key(),
-            include_parent_metadata=self._include_parent_metadata_for(candidate),
-            transform_options=TableTransformOptions(
-                stringify_all=self.stringify_all_check.isChecked(),
-                stringify_formulas=self.stringify_formulas_check.isChecked(),
-                column_transforms=tuple(column_transforms.values()),
-            ),
+        unfold_key = self._unfold_key()
+        include_parent_metadata = bool(candidate and self._include_parent_metadata_for(candidate))
+        options = TableTransformOptions(
+            stringify_all=self.stringify_all_check.isChecked(),
+            stringify_formulas=self.stringify_formulas_check.isChecked(),
+            column_transforms=tuple(column_transforms.values()),
         )
-        if array_data is None:
-            raise ArrayMateCoreError("Selected array is invalid")
-        build_table_preview(array_data, self.effective_candidate_key or candidate.display_path)
+        columns = (column,) if column else None
+
+        def validate(sample_size: Optional[int] = None, checkpoint: Optional[Callable[[], None]] = None) -> None:
+            if candidate is None:
+                return
+            issue = service.check_column_transforms(
+                candidate.display_path,
+                options,
+                unfold_key=unfold_key,
+                include_parent_metadata=include_parent_metadata,
+                columns=columns,
+                sample_size=sample_size,
+                checkpoint=checkpoint,
+            )
+            if issue is not None:
+                raise ArrayMateCoreError(issue.message)
 
-    def _format_preview_value(self, value: Any) -> str:
-        if isinstance(value, dict):
-            return "[record]"
-        if isinstance(value, list):
-            return "[table]"
-        if value is None:
-            return ""
-        return str(value)
+        return validate
 
     def _suggest_filename(self, array_key: str) -> str:
         clean_name = "".join(char if char.isalnum() else "_" for char in array_key).strip("_")
@@ -1054,6 +1579,9 @@ class ArrayMateWindow(QMainWindow):
         if not self.output_filename_edit.text():
             QMessageBox.critical(self, "Missing filename", "Please enter a filename")
             return
+        if "export" in self.tasks:
+            self.status_label.setText("An export is already running")
+            return
         try:
             export_plan = self.service.create_export_plan(
                 self.output_folder_edit.text(),
@@ -1068,34 +1596,60 @@ class ArrayMateWindow(QMainWindow):
                 )
                 if result != QMessageBox.StandardButton.Yes:
                     return
-            selected_candidate = self.candidate_by_path.get(self.selected_array_key)
-            unfold_key = self._unfold_key() if selected_candidate else None
-            export_result = self.service.export_array(
-                self.selected_array_key,
+        except Exception as e:
+            self._show_export_error(e)
+            return
+
+        service = self.service
+        array_key = self.selected_array_key
+        selected_candidate = self.candidate_by_path.get(array_key)
+        unfold_key = self._unfold_key() if selected_candidate else None
+        include_parent_metadata = bool(
+            selected_candidate and not unfold_key and self._include_parent_metadata_for(selected_candidate)
+        )
+        transform_options = self._table_transform_options()
+
+        def export(task: _BackgroundTask) -> ExportResult:
+            return service.export_array(
+                array_key,
                 export_plan,
-                include_parent_metadata=bool(
-                    selected_candidate and not unfold_key and self._include_parent_metadata_for(selected_candidate)
-                ),
+                include_parent_metadata=include_parent_metadata,
                 unfold_key=unfold_key,
-                transform_options=self._table_transform_options(),
+                transform_options=transform_options,
+                progress=lambda rows: task.report(f"Writing {export_plan.filename}: {rows:,} rows"),
             )
-            QMessageBox.information(
-                self,
-                "Success",
-                f"{export_result.output_format.label} file saved successfully!\n"
-                f"File: {export_result.file_path}\n"
-                f"Rows: {export_result.rows}\n"
-                f"Columns: {export_result.columns}",
-            )
-            self.status_label.setText(f"{export_result.output_format.label} file saved: {export_result.filename}")
-            self._open_exported_file(export_result.output_format.label, export_result.file_path)
-        except ArrayMateCoreError as e:
-            QMessageBox.critical(self, "Error", str(e))
-            self.status_label.setText(str(e))
-        except Exception as e:
-            output_format = get_output_format(self.output_format_combo.currentText())
-            QMessageBox.critical(self, "Error", f"Error creating {output_format.label} file: {e}")
-            self.status_label.setText(f"Error creating {output_format.label} file")
+
+        self.process_button.setEnabled(False)
+        self._start_task(
+            "export",
+            f"Writing {export_plan.filename}",
+            export,
+            self._show_export_result,
+            self._show_export_error,
+        )
+
+    def _show_export_result(self, export_result: ExportResult) -> None:
+        self.process_button.setEnabled(bool(self.selected_array_key))
+        QMessageBox.information(
+            self,
+            "Success",
+            f"{export_result.output_format.label} file saved successfully!\n"
+            f"File: {export_result.file_path}\n"
+            f"Rows: {export_result.rows}\n"
+            f"Columns: {export_result.columns}",
+        )
+        self.status_label.setText(f"{export_result.output_format.label} file saved: {export_result.filename}")
+        self._open_exported_file(export_result.output_format.label, export_result.file_path)
+
+    def _show_export_error(self, error: BaseException) -> None:
+        self.process_button.setEnabled(bool(self.selected_array_key))
+        if isinstance(error, ArrayMateCoreError):
+            QMessageBox.critical(self, "Error", str(error))
+            self.status_label.setText(str(error))
+            return
+        output_format = get_output_format(self.output_format_combo.currentText())
+        QMessageBox.critical(self, "Error", f"Error creating {output_format.label} file: {error}")
+        self.status_label.setText(f"Error creating {output_format.label} file")
 
     def _open_exported_file(self, output_label: str, file_path: str) -> None:
         if output_label in ("Excel", "CSV", "JSON"):
@@ -2,41 +2,99 @@
 
 from __future__ import annotations
 
-import json
 import os
-from dataclasses import dataclass
-from decimal import Decimal
-from typing import Any, Optional
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from arraymate.core import (
+    EXPORT_ROW_BATCH_SIZE,
     ArrayCandidate,
+    ArrayMateCoreError,
+    ArrayPathIndex,
+    JsonAnalysis,
     JsonData,
     JsonNode,
     OutputFormat,
+    TablePreview,
     TableTransformOptions,
+    TransformIssue,
+    analyze_json,
+    analyze_json_file,
     apply_table_transform_options,
     build_output_path,
-    build_json_tree,
-    discover_array_candidates,
-    find_arrays,
+    build_table_preview,
+    changed_transform_columns,
+    discover_column_names,
     get_array_data,
     get_array_data_by_path,
     get_array_data_with_parent_metadata,
     get_unfolded_array_data,
     get_output_format,
+    infer_table_transform_types,
+    iter_array_data_by_path,
+    iter_array_data_with_parent_metadata,
+    iter_json_file_array_items,
+    iter_json_file_rows_with_parent_metadata,
+    iter_table_transform_options,
+    iter_unfolded_array_data,
+    iter_with_checkpoints,
+    parse_json_text,
+    reapply_column_transforms,
+    validate_column_transforms,
     write_array_to_file,
 )
 
 
+STREAMING_FILE_SIZE = 256 * 1024 * 1024
+TABLE_CACHE_BYTES = 512 * 1024 * 1024
+TABLE_SIZE_SAMPLE_ROWS = 32
+
+
 @dataclass(frozen=True)
 class LoadResult:
-    """Result of loading JSON into the app workflow."""
+    """
+    Result of loading JSON into the app workflow.
+
+    When ``estimated`` is set, the result comes from sampled discovery:
+    ``array_keys`` and ``array_candidates`` only cover the sampled items, and
+    candidate counts are estimates, until the exact analysis finishes and
+    ``on_exact`` receives the complete result.
+    """
 
     array_keys: list[str]
     selected_key: Optional[str]
     selected_array: Optional[list[Any]]
     json_tree: JsonNode
     array_candidates: list[ArrayCandidate]
+    estimated: bool = False
+
+
+@dataclass(frozen=True)
+class _LoadedArrays:
+    """Array analysis of the loaded data and its lookup indexes, replaced as one unit."""
+
+    array_keys: list[str] = field(default_factory=list)
+    array_paths: list[tuple[Any, ...]] = field(default_factory=list)
+    array_index: ArrayPathIndex = field(default_factory=ArrayPathIndex)
+    json_tree: Optional[JsonNode] = None
+    array_candidates: list[ArrayCandidate] = field(default_factory=list)
+    candidate_by_path: dict[str, ArrayCandidate] = field(default_factory=dict)
+    nested_candidates_by_path: dict[tuple[Any, ...], list[ArrayCandidate]] = field(default_factory=dict)
+
+    @classmethod
+    def from_analysis(cls, analysis: JsonAnalysis) -> "_LoadedArrays":
+        return cls(
+            array_keys=analysis.array_keys,
+            array_paths=analysis.array_paths,
+            array_index=analysis.array_index,
+            json_tree=analysis.json_tree,
+            array_candidates=analysis.array_candidates,
+            candidate_by_path=_index_candidates_by_path(analysis.array_candidates),
+            nested_candidates_by_path=_index_nested_candidates(analysis.array_candidates),
+        )
 
 
 @dataclass(frozen=True)
@@ -59,53 +117,267 @@ class ExportResult:
     columns: int
 
 
+@dataclass(frozen=True)
+class TableCacheStats:
+    """Counters of the materialized table cache."""
+
+    hits: int
+    misses: int
+    entries: int
+    size_bytes: int
+
+
+class _TableCache:
+    """
+    LRU cache of materialized tables, bounded by their estimated size.
+
+    Sizes are estimated from a sample of rows; a table larger than the whole
+    budget is not cached. Hit and miss counters survive ``clear``. The cache
+    is locked so a UI thread and a background worker can share it.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[tuple[Any, ...], tuple[list[Any], int]] = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.RLock()
+
+    def get(self, key: tuple[Any, ...]) -> Optional[list[Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def peek(self, key: tuple[Any, ...]) -> Optional[list[Any]]:
+        """Return a cached table without touching recency or counters."""
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry[0] if entry is not None else None
+
+    def put(self, key: tuple[Any, ...], rows: list[Any]) -> None:
+        size_bytes = _estimate_table_bytes(rows)
+        if size_bytes > self.max_bytes:
+            return
+        with self.lock:
+            self.discard(key)
+            self.entries[key] = (rows, size_bytes)
+            self.size_bytes += size_bytes
+            while self.size_bytes > self.max_bytes:
+                _, (_, evicted_bytes) = self.entries.popitem(last=False)
+                self.size_bytes -= evicted_bytes
+
+    def items(self) -> list[tuple[tuple[Any, ...], list[Any]]]:
+        """Return cached keys and tables without touching recency or counters."""
+        with self.lock:
+            return [(key, rows) for key, (rows, _) in self.entries.items()]
+
+    def discard(self, key: tuple[Any, ...]) -> None:
+        with self.lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                self.size_bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.size_bytes = 0
+
+    def stats(self) -> TableCacheStats:
+        with self.lock:
+            return TableCacheStats(hits=self.hits, misses=self.misses, entries=len(self.entries), size_bytes=self.size_bytes)
+
+
 class ArrayMateService:
     """Stateful application workflow, independent of any UI toolkit."""
 
-    def __init__(self) -> None:
+    def __init__(self, table_cache_bytes: int = TABLE_CACHE_BYTES) -> None:
         self.json_data: Optional[JsonData] = None
-        self.array_keys: list[str] = []
-        self.json_tree: Optional[JsonNode] = None
-        self.array_candidates: list[ArrayCandidate] = []
+        self.source_file_path: Optional[str] = None
+        self._arrays = _LoadedArrays()
+        self.table_columns: dict[tuple[str, Optional[str], bool], tuple[str, ...]] = {}
+        self.column_transform_types: dict[
+            tuple[str, Optional[str], bool, TableTransformOptions], dict[str, tuple[str, ...]]
+        ] = {}
+        self.table_cache = _TableCache(table_cache_bytes)
+        self.exact_analysis_thread: Optional[threading.Thread] = None
+        self._load_generation = 0
+        self._load_lock = threading.Lock()
 
     def clear(self) -> None:
         """Reset loaded JSON state."""
+        with self._load_lock:
+            # A pending exact analysis of the previous data must not be applied.
+            self._load_generation += 1
+            self._arrays = _LoadedArrays()
+        self.exact_analysis_thread = None
         self.json_data = None
-        self.array_keys = []
-        self.json_tree = None
-        self.array_candidates = []
-
-    def load_text(self, json_text: str) -> LoadResult:
-        """Parse JSON text and load it into the workflow."""
-        return self.load_data(json.loads(json_text, parse_float=Decimal))
-
-    def load_file(self, file_path: str) -> LoadResult:
-        """Read a JSON file and load it into the workflow."""
-        with open(file_path, "r", encoding="utf-8") as file:
-            return self.load_data(json.load(file, parse_float=Decimal))
-
-    def load_data(self, data: JsonData) -> LoadResult:
-        """Load parsed JSON data."""
+        self.source_file_path = None
+        self.table_columns = {}
+        self.column_transform_types = {}
+        self.table_cache.clear()
+
+    @property
+    def array_keys(self) -> list[str]:
+        return self._arrays.array_keys
+
+    @property
+    def array_paths(self) -> list[tuple[Any, ...]]:
+        return self._arrays.array_paths
+
+    @property
+    def array_index(self) -> ArrayPathIndex:
+        return self._arrays.array_index
+
+    @property
+    def json_tree(self) -> Optional[JsonNode]:
+        return self._arrays.json_tree
+
+    @property
+    def array_candidates(self) -> list[ArrayCandidate]:
+        return self._arrays.array_candidates
+
+    @property
+    def candidate_by_path(self) -> dict[str, ArrayCandidate]:
+        return self._arrays.candidate_by_path
+
+    @property
+    def nested_candidates_by_path(self) -> dict[tuple[Any, ...], list[ArrayCandidate]]:
+        return self._arrays.nested_candidates_by_path
+
+    @property
+    def table_cache_stats(self) -> TableCacheStats:
+        """Hit/miss counters and current size of the materialized table cache."""
+        return self.table_cache.stats()
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether rows are read from ``source_file_path`` instead of parsed data."""
+        return self.json_data is None and self.source_file_path is not None
+
+    def load_text(self, json_text: str, checkpoint: Optional[Callable[[], None]] = None) -> LoadResult:
+        """
+        Parse JSON text and load it into the workflow; ``checkpoint`` is passed to ``load_data``.
+
+        Text is parsed with ``parse_json_text``, so nesting depth is not limited
+        by the recursion limit.
+        """
+        return self.load_data(parse_json_text(json_text), checkpoint=checkpoint)
+
+    def load_file(
+        self, file_path: str, streaming: Optional[bool] = None, checkpoint: Optional[Callable[[], None]] = None
+    ) -> LoadResult:
+        """
+        Read a JSON file and load it into the workflow.
+
+        Streaming mode analyzes the file without parsing it into memory and
+        reads the selected table's rows back from the file on request. It is
+        used for files of at least ``STREAMING_FILE_SIZE`` bytes unless
+        ``streaming`` is given explicitly. ``LoadResult.selected_array`` is not
+        materialized for streamed files. ``checkpoint`` is called during the
+        analysis, as in ``analyze_json_file``; parsing a file below the
+        streaming size is not interrupted.
+        """
+        if streaming is None:
+            streaming = os.path.getsize(file_path) >= STREAMING_FILE_SIZE
+        if not streaming:
+            with open(file_path, "r", encoding="utf-8") as file:
+                json_text = file.read()
+            return self.load_data(parse_json_text(json_text), checkpoint=checkpoint)
+
+        analysis = analyze_json_file(file_path, checkpoint=checkpoint)
+        self.clear()
+        self.source_file_path = file_path
+        return self._apply_analysis(analysis, load_selected_array=False)
+
+    def load_data(
+        self,
+        data: JsonData,
+        sample_size: Optional[int] = None,
+        on_exact: Optional[Callable[[LoadResult], None]] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> LoadResult:
+        """
+        Load parsed JSON data.
+
+        With ``sample_size``, candidates are discovered from at most that many
+        items per array (see ``analyze_json``), so huge arrays are listed
+        quickly. When any candidate is ``estimated``, the returned result is
+        marked ``estimated`` and the exact analysis runs on
+        ``exact_analysis_thread``. Its keys, candidates and indexes are built
+        in full on that thread and then replace the estimated state in one
+        step, unless other data is loaded first. ``on_exact`` is then called
+        from that thread with the exact result. ``checkpoint`` is called
+        during the first analysis, as in ``analyze_json``; an exception raised
+        from it aborts the load and leaves the loaded data unchanged.
+        """
+        analysis = analyze_json(data, sample_size, checkpoint)
+        self.clear()
         self.json_data = data
-        self.array_keys = find_arrays(data)
-        self.json_tree = build_json_tree(data)
-        self.array_candidates = discover_array_candidates(data)
-        selected_key = self.array_keys[0] if self.array_keys else None
-        selected_array = self.get_array_data(selected_key) if selected_key else None
+        load_result = self._apply_analysis(analysis, load_selected_array=True)
+        if load_result.estimated:
+            self.exact_analysis_thread = threading.Thread(
+                target=self._apply_exact_analysis,
+                args=(data, self._load_generation, on_exact),
+                name="arraymate-exact-analysis",
+                daemon=True,
+            )
+            self.exact_analysis_thread.start()
+        return load_result
+
+    def wait_for_exact_analysis(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a pending exact analysis; return ``False`` if it is still running after ``timeout``."""
+        thread = self.exact_analysis_thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _apply_exact_analysis(
+        self, data: JsonData, generation: int, on_exact: Optional[Callable[[LoadResult], None]]
+    ) -> None:
+        arrays = _LoadedArrays.from_analysis(analyze_json(data))
+        with self._load_lock:
+            if generation != self._load_generation:
+                return
+            self._arrays = arrays
+            load_result = self._load_result(arrays, load_selected_array=True)
+        if on_exact is not None:
+            on_exact(load_result)
+
+    def _apply_analysis(self, analysis: JsonAnalysis, load_selected_array: bool) -> LoadResult:
+        arrays = _LoadedArrays.from_analysis(analysis)
+        with self._load_lock:
+            self._arrays = arrays
+        return self._load_result(arrays, load_selected_array)
+
+    def _load_result(self, arrays: _LoadedArrays, load_selected_array: bool) -> LoadResult:
+        selected_key = arrays.array_keys[0] if arrays.array_keys else None
+        selected_array = self.get_array_data(selected_key) if selected_key and load_selected_array else None
         return LoadResult(
-            array_keys=self.array_keys,
+            array_keys=arrays.array_keys,
             selected_key=selected_key,
             selected_array=selected_array,
-            json_tree=self.json_tree,
-            array_candidates=self.array_candidates,
+            json_tree=arrays.json_tree,
+            array_candidates=arrays.array_candidates,
+            estimated=any(candidate.estimated for candidate in arrays.array_candidates),
         )
 
     def get_array_data(self, array_key: Optional[str], include_parent_metadata: bool = False) -> Optional[list[Any]]:
         """Return the selected array from the loaded JSON."""
-        if not array_key or self.json_data is None:
+        if not array_key:
+            return None
+        if self.is_streaming:
+            return self._get_streamed_array_data(array_key, include_parent_metadata)
+        if self.json_data is None:
             return None
 
-        array_data = get_array_data(self.json_data, array_key)
+        array_data = get_array_data(self.json_data, array_key, self.array_index)
         if array_data is not None:
             return array_data
 
@@ -124,32 +396,294 @@ class ArrayMateService:
         unfold_key: Optional[str] = None,
         include_parent_metadata: bool = False,
         transform_options: Optional[TableTransformOptions] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> Optional[list[Any]]:
+        """
+        Return rows for the selected table, optionally unfolding a nested child table.
+
+        Tables are cached per (table, unfold, parent metadata, transform
+        options) until the next load; options that change nothing share the
+        untransformed table's entry. The returned list may be shared with
+        later calls and must not be modified. ``checkpoint`` is called every
+        ``CHECKPOINT_INTERVAL`` rows while a table is transformed; an exception
+        raised from it aborts the build and caches nothing.
+        """
+        if not array_key or (self.json_data is None and not self.is_streaming):
+            return None
+
+        if transform_options == TableTransformOptions():
+            transform_options = None
+        cache_key = (array_key, unfold_key or None, include_parent_metadata, transform_options)
+        table_data = self.table_cache.get(cache_key)
+        if table_data is not None:
+            return table_data
+
+        if transform_options is not None:
+            table_data = self._retransform_table_data(cache_key, checkpoint)
+        if table_data is None:
+            table_data = self._build_table_data(
+                array_key, unfold_key, include_parent_metadata, transform_options, checkpoint
+            )
+        if table_data is not None:
+            self.table_cache.put(cache_key, table_data)
+        return table_data
+
+    def _retransform_table_data(
+        self, cache_key: tuple[Any, ...], checkpoint: Optional[Callable[[], None]] = None
     ) -> Optional[list[Any]]:
-        """Return rows for the selected table, optionally unfolding a nested child table."""
-        if not array_key or self.json_data is None:
+        """
+        Derive a table from a cached variant that differs only in a few column transforms.
+
+        Only the changed columns are recomputed from the untransformed base
+        table; the other cells are copied from the cached variant.
+        """
+        table_key, transform_options = cache_key[:3], cache_key[3]
+        closest: Optional[tuple[list[Any], set[str]]] = None
+        for cached_key, cached_rows in self.table_cache.items():
+            if cached_key[:3] != table_key:
+                continue
+            changed_columns = changed_transform_columns(cached_key[3], transform_options)
+            if changed_columns is not None and (closest is None or len(changed_columns) < len(closest[1])):
+                closest = (cached_rows, changed_columns)
+        if closest is None:
+            return None
+
+        base_rows = self.get_table_data(*table_key, checkpoint=checkpoint)
+        if base_rows is None:
             return None
+        return reapply_column_transforms(base_rows, closest[0], transform_options, closest[1], checkpoint)
 
+    def _build_table_data(
+        self,
+        array_key: str,
+        unfold_key: Optional[str],
+        include_parent_metadata: bool,
+        transform_options: Optional[TableTransformOptions],
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> Optional[list[Any]]:
         if unfold_key:
             parent = self.get_array_candidate(array_key)
             nested = self.get_array_candidate(unfold_key)
             if parent is None or nested is None:
                 return None
-            return apply_table_transform_options(
-                get_unfolded_array_data(self.json_data, parent.path, nested.path),
-                transform_options,
-            )
+            if self.is_streaming:
+                unfolded_rows = self._get_streamed_unfolded_array_data(parent.path, nested.path)
+            else:
+                unfolded_rows = get_unfolded_array_data(self.json_data, parent.path, nested.path)
+            return apply_table_transform_options(unfolded_rows, transform_options, checkpoint)
 
         return apply_table_transform_options(
             self.get_array_data(array_key, include_parent_metadata=include_parent_metadata),
             transform_options,
+            checkpoint,
         )
 
+    def iter_table_rows(
+        self,
+        array_key: Optional[str],
+        unfold_key: Optional[str] = None,
+        include_parent_metadata: bool = False,
+        transform_options: Optional[TableTransformOptions] = None,
+    ) -> Optional[Iterator[Any]]:
+        """
+        Lazily yield the rows ``get_table_data`` would return.
+
+        Rows are resolved, unfolded and transformed one at a time, so exports
+        can stream a table without materializing it.
+        """
+        if not array_key or (self.json_data is None and not self.is_streaming):
+            return None
+
+        if unfold_key:
+            parent = self.get_array_candidate(array_key)
+            nested = self.get_array_candidate(unfold_key)
+            if parent is None or nested is None:
+                return None
+            if self.is_streaming:
+                rows = self._iter_streamed_unfolded_array_data(parent.path, nested.path)
+            else:
+                rows = iter_unfolded_array_data(self.json_data, parent.path, nested.path)
+        elif self.is_streaming:
+            rows = self._iter_streamed_array_data(array_key, include_parent_metadata)
+        else:
+            rows = self._iter_array_data(array_key, include_parent_metadata)
+
+        if rows is None:
+            return None
+        return iter_table_transform_options(rows, transform_options)
+
+    def get_table_preview(
+        self,
+        array_key: Optional[str],
+        unfold_key: Optional[str] = None,
+        include_parent_metadata: bool = False,
+        transform_options: Optional[TableTransformOptions] = None,
+        max_rows: int = 50,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> Optional[TablePreview]:
+        """
+        Return the preview of a table, keeping only its first ``max_rows`` rows.
+
+        Parsed tables are previewed from ``get_table_data``, so they are
+        cached and a transform edit re-derives only the changed columns.
+        Streamed files are read back through ``iter_table_rows``, so
+        previewing them does not materialize the table. ``checkpoint`` is
+        called every ``CHECKPOINT_INTERVAL`` rows; an exception raised from it
+        aborts the preview.
+        """
+        if self.is_streaming:
+            rows = self.iter_table_rows(array_key, unfold_key, include_parent_metadata, transform_options)
+        else:
+            rows = self.get_table_data(array_key, unfold_key, include_parent_metadata, transform_options, checkpoint)
+        if rows is None:
+            return None
+        if checkpoint is not None:
+            rows = iter_with_checkpoints(rows, checkpoint)
+        display_path = (unfold_key or array_key) or ""
+        return build_table_preview(rows, display_path, max_rows=max_rows)
+
+    def get_table_columns(
+        self,
+        array_key: Optional[str],
+        unfold_key: Optional[str] = None,
+        include_parent_metadata: bool = False,
+    ) -> tuple[str, ...]:
+        """
+        Return the header of a table, cached per table until the next load.
+
+        The header is discovered in a pre-pass over the untransformed rows,
+        read from the table cache when the table is already materialized;
+        transforms keep row keys, so it applies to every transform option.
+        """
+        cache_key = (array_key or "", unfold_key or None, include_parent_metadata)
+        columns = self.table_columns.get(cache_key)
+        if columns is None:
+            rows = self.table_cache.peek(cache_key + (None,))
+            if rows is None:
+                rows = self.iter_table_rows(array_key, unfold_key, include_parent_metadata)
+            columns = discover_column_names(rows) if rows is not None else ()
+            self.table_columns[cache_key] = columns
+        return columns
+
+    def get_column_transform_types(
+        self,
+        array_key: Optional[str],
+        unfold_key: Optional[str] = None,
+        include_parent_metadata: bool = False,
+        transform_options: Optional[TableTransformOptions] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> dict[str, tuple[str, ...]]:
+        """
+        Return the data type actions possible for every column of a table.
+
+        Types are inferred in one sweep over the table as shown before any
+        column transforms and cached per table and stringify options until the
+        next load. Column transforms in ``transform_options`` are ignored.
+        Streamed files are swept row by row instead of being materialized.
+        ``checkpoint`` is called every ``CHECKPOINT_INTERVAL`` rows; an
+        exception raised from it aborts the sweep and caches nothing.
+        """
+        options = replace(transform_options or TableTransformOptions(), column_transforms=())
+        cache_key = (array_key or "", unfold_key or None, include_parent_metadata, options)
+        column_types = self.column_transform_types.get(cache_key)
+        if column_types is None:
+            if self.is_streaming:
+                rows = self.iter_table_rows(array_key, unfold_key, include_parent_metadata, options)
+            else:
+                rows = self.get_table_data(array_key, unfold_key, include_parent_metadata, options, checkpoint)
+            columns = self.get_table_columns(array_key, unfold_key, include_parent_metadata) if rows else None
+            if columns is not None and checkpoint is not None:
+                rows = iter_with_checkpoints(rows, checkpoint)
+            column_types = infer_table_transform_types(rows, columns)
+            self.column_transform_types[cache_key] = column_types
+        return column_types
+
+    def check_column_transforms(
+        self,
+        array_key: Optional[str],
+        transform_options: Optional[TableTransformOptions],
+        unfold_key: Optional[str] = None,
+        include_parent_metadata: bool = False,
+        columns: Optional[Iterable[str]] = None,
+        sample_size: Optional[int] = None,
+        checkpoint: Optional[Callable[[], None]] = None,
+    ) -> Optional[TransformIssue]:
+        """
+        Return the first value the column transforms fail on in a table, or ``None``.
+
+        Parsed tables are checked from the table cache, sampling evenly spaced
+        rows when ``sample_size`` is given. Streamed files are read back one
+        row at a time, so ``sample_size`` covers their leading rows. Raises
+        ``ArrayMateCoreError`` when the table cannot be read. ``checkpoint`` is
+        called every ``CHECKPOINT_INTERVAL`` rows read in order; an exception
+        raised from it aborts the check.
+        """
+        if self.is_streaming:
+            rows = self.iter_table_rows(array_key, unfold_key, include_parent_metadata)
+        else:
+            rows = self.get_table_data(array_key, unfold_key, include_parent_metadata, checkpoint=checkpoint)
+        if rows is None:
+            raise ArrayMateCoreError("Selected array is invalid")
+        # Sampled parsed tables are checked at spread-out positions, which a
+        # row iterator cannot give, but the sample is small.
+        if checkpoint is not None and rows and (self.is_streaming or sample_size is None):
+            rows = iter_with_checkpoints(rows, checkpoint)
+        return validate_column_transforms(rows, transform_options, columns, sample_size=sample_size)
+
+    def _iter_array_data(self, array_key: str, include_parent_metadata: bool) -> Optional[Iterator[Any]]:
+        array_data = get_array_data(self.json_data, array_key, self.array_index)
+        if array_data is not None:
+            return iter(array_data)
+
+        candidate = self.get_array_candidate(array_key)
+        if candidate is None:
+            return None
+        if include_parent_metadata:
+            return iter_array_data_with_parent_metadata(self.json_data, candidate.path)
+        return iter_array_data_by_path(self.json_data, candidate.path)
+
+    def _get_streamed_array_data(self, array_key: str, include_parent_metadata: bool) -> Optional[list[Any]]:
+        rows = self._iter_streamed_array_data(array_key, include_parent_metadata)
+        if rows is None:
+            return None
+        candidate = self.get_array_candidate(array_key)
+        path = candidate.path if candidate is not None else self.array_index.paths.get(array_key)
+        array_data = list(rows)
+        if include_parent_metadata and Ellipsis in path and not array_data:
+            return None
+        return array_data
+
+    def _iter_streamed_array_data(self, array_key: str, include_parent_metadata: bool) -> Optional[Iterator[Any]]:
+        candidate = self.get_array_candidate(array_key)
+        path = candidate.path if candidate is not None else self.array_index.paths.get(array_key)
+        if path is None:
+            return None
+
+        if include_parent_metadata and Ellipsis in path:
+            return iter_json_file_rows_with_parent_metadata(self.source_file_path, path)
+        return iter_json_file_array_items(self.source_file_path, path)
+
+    def _get_streamed_unfolded_array_data(
+        self,
+        parent_path: tuple[Any, ...],
+        nested_path: tuple[Any, ...],
+    ) -> Optional[list[Any]]:
+        rows = self._iter_streamed_unfolded_array_data(parent_path, nested_path)
+        array_data = list(rows) if rows is not None else []
+        return array_data if array_data else None
+
+    def _iter_streamed_unfolded_array_data(
+        self,
+        parent_path: tuple[Any, ...],
+        nested_path: tuple[Any, ...],
+    ) -> Optional[Iterator[Any]]:
+        if not _is_descendant_candidate(parent_path, nested_path):
+            return None
+        return iter_json_file_rows_with_parent_metadata(self.source_file_path, nested_path, parent_columns_first=True)
+
     def get_array_candidate(self, array_key: str) -> Optional[ArrayCandidate]:
         """Return candidate metadata by display path."""
-        return next(
-            (candidate for candidate in self.array_candidates if candidate.display_path == array_key),
-            None,
-        )
+        return self.candidate_by_path.get(array_key)
 
     def get_nested_array_candidates(self, array_key: str, max_nested_levels: int = 3) -> list[ArrayCandidate]:
         """Return exportable child arrays nested under a parent array candidate."""
@@ -159,13 +693,7 @@ class ArrayMateService:
 
         parent_wildcard_count = parent.path.count(Ellipsis)
         nested_candidates = []
-        for candidate in self.array_candidates:
-            if candidate.display_path == parent.display_path:
-                continue
-            if not candidate.exportable:
-                continue
-            if not _is_descendant_candidate(parent.path, candidate.path):
-                continue
+        for candidate in self.nested_candidates_by_path.get(parent.path, ()):
             nested_level = candidate.path.count(Ellipsis) - parent_wildcard_count
             if 1 <= nested_level <= max_nested_levels:
                 nested_candidates.append(candidate)
@@ -189,15 +717,36 @@ class ArrayMateService:
         include_parent_metadata: bool = False,
         unfold_key: Optional[str] = None,
         transform_options: Optional[TableTransformOptions] = None,
+        excel_writer: str = "openpyxl",
+        json_style: str = "pretty",
+        progress: Optional[Callable[[int], None]] = None,
     ) -> ExportResult:
-        """Write the selected array to the planned output file."""
-        array_data = self.get_table_data(
+        """
+        Write the selected array to the planned output file.
+
+        Rows are streamed from the loaded data through the transforms into the
+        writer; the header comes from ``get_table_columns``. ``progress`` is
+        called with the number of rows written so far every
+        ``EXPORT_ROW_BATCH_SIZE`` rows and once at the end. An exception raised
+        from it aborts the export and leaves any existing file in place.
+        """
+        rows = self.iter_table_rows(
             array_key,
             unfold_key=unfold_key,
             include_parent_metadata=include_parent_metadata,
             transform_options=transform_options,
         )
-        dataframe = write_array_to_file(array_data, export_plan.file_path, export_plan.output_format)
+        if rows is not None and progress is not None:
+            rows = _iter_with_progress(rows, progress)
+        columns = self.get_table_columns(array_key, unfold_key, include_parent_metadata) if rows is not None else None
+        dataframe = write_array_to_file(
+            rows,
+            export_plan.file_path,
+            export_plan.output_format,
+            excel_writer=excel_writer,
+            json_style=json_style,
+            columns=columns,
+        )
         return ExportResult(
             output_format=export_plan.output_format,
             file_path=export_plan.file_path,
@@ -207,6 +756,50 @@ class ArrayMateService:
         )
 
 
+def _iter_with_progress(rows: Iterable[Any], progress: Callable[[int], None]) -> Iterator[Any]:
+    row_count = 0
+    for row_count, row in enumerate(rows, 1):
+        yield row
+        if row_count % EXPORT_ROW_BATCH_SIZE == 0:
+            progress(row_count)
+    progress(row_count)
+
+
+def _index_candidates_by_path(candidates: list[ArrayCandidate]) -> dict[str, ArrayCandidate]:
+    candidate_by_path: dict[str, ArrayCandidate] = {}
+    for candidate in candidates:
+        candidate_by_path.setdefault(candidate.display_path, candidate)
+    return candidate_by_path
+
+
+def _index_nested_candidates(candidates: list[ArrayCandidate]) -> dict[tuple[Any, ...], list[ArrayCandidate]]:
+    """Map each candidate path to the exportable candidates below its wildcard rows, in discovery order."""
+    candidate_paths = {candidate.path for candidate in candidates}
+    nested_candidates: dict[tuple[Any, ...], list[ArrayCandidate]] = {}
+    for candidate in candidates:
+        if not candidate.exportable:
+            continue
+        for index, segment in enumerate(candidate.path):
+            parent_path = candidate.path[:index]
+            if segment is Ellipsis and parent_path in candidate_paths:
+                nested_candidates.setdefault(parent_path, []).append(candidate)
+    return nested_candidates
+
+
 def _is_descendant_candidate(parent_path: tuple[Any, ...], candidate_path: tuple[Any, ...]) -> bool:
     expected_prefix = parent_path + (Ellipsis,)
     return candidate_path[: len(expected_prefix)] == expected_prefix
+
+
+def _estimate_table_bytes(rows: list[Any]) -> int:
+    """Estimate the memory held by rows from a shallow size of evenly spaced sample rows."""
+    if not rows:
+        return sys.getsizeof(rows)
+    step = max(1, len(rows) // TABLE_SIZE_SAMPLE_ROWS)
+    sample = rows[::step][:TABLE_SIZE_SAMPLE_ROWS]
+    sample_bytes = 0
+    for row in sample:
+        sample_bytes += sys.getsizeof(row)
+        if isinstance(row, dict):
+            sample_bytes += sum(sys.getsizeof(value) for value in row.values())
+    return sys.getsizeof(rows) + sample_bytes * len(rows) // len(sample)
@@ -0,0 +1,58 @@
+"""
+Compare candidate discovery over aggregate views with copying values at every wildcard level.
+
+Aggregate nodes read ``orders[*].items[*].lots[*]`` values through views of
+the source lists; previously every wildcard level and every column built a new
+list of references.
+
+Run from the repository root with ``python -m benchmarks.bench_aggregate_views [orders]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from arraymate.core import LazyJsonNode, _collect_array_candidates, discover_array_candidates
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+
+class CopyingJsonNode(LazyJsonNode):
+    """Lazy node that materializes aggregate items and column values as lists."""
+
+    @property
+    def _items(self) -> Any:
+        if self.kind != "array":
+            return ()
+        if not self._aggregate:
+            return self._values[0]
+        return self.__dict__.setdefault("_copied_items", [item for value in self._values for item in value])
+
+    def _child(self, key: str) -> LazyJsonNode:
+        child = self._child_nodes.get(key)
+        if child is None:
+            child = super()._child(key)
+            if child._aggregate:
+                child.__dict__["_values"] = list(child._values)
+        return child
+
+
+def copying_candidates(data: Any) -> list[Any]:
+    candidates: list[Any] = []
+    _collect_array_candidates(CopyingJsonNode((data,), (), "root"), candidates)
+    return candidates
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    data = orders_document(order_count, items_per_order=8, lots_per_item=4)
+    assert discover_array_candidates(data) == copying_candidates(data)
+    print(f"orders document with {order_count} orders, 8 items per order and 4 lots per item")
+    measure("discover_array_candidates (views)", lambda: discover_array_candidates(data))
+    measure("discover_array_candidates (copied lists)", lambda: copying_candidates(data))
+    measure_peak_memory("discover_array_candidates (views)", lambda: discover_array_candidates(data))
+    measure_peak_memory("discover_array_candidates (copied lists)", lambda: copying_candidates(data))
+
+
+if __name__ == "__main__":
+    main()
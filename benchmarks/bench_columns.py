@@ -0,0 +1,56 @@
+"""
+Compare column discovery on wide, irregular tables.
+
+Run from the repository root with ``python -m benchmarks.bench_columns``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from arraymate.core import _column_names
+from arraymate.service import ArrayMateService
+from benchmarks.synthetic import measure
+
+
+def list_membership_column_names(rows: list[Any]) -> list[str]:
+    """Column discovery as implemented before shape interning."""
+    columns: list[str] = []
+    for row in rows:
+        if isinstance(row, dict):
+            for key in row.keys():
+                if key not in columns:
+                    columns.append(key)
+    return [str(column) for column in columns]
+
+
+def irregular_rows(row_count: int, column_count: int, shape_count: int = 16) -> list[dict[str, Any]]:
+    """Rows drawn from ``shape_count`` overlapping subsets of ``column_count`` columns."""
+    shapes = [
+        [f"col_{index}" for index in range(column_count) if index % (shape + 1) == 0 or index >= column_count - shape]
+        for shape in range(shape_count)
+    ]
+    return [dict.fromkeys(shapes[row_index % shape_count], row_index) for row_index in range(row_count)]
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    column_count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    rows = irregular_rows(row_count, column_count)
+    print(f"{row_count} rows, {column_count} columns, 16 row shapes")
+
+    legacy_rows = rows[:200]
+    legacy = measure("list membership (first 200 rows)", lambda: list_membership_column_names(legacy_rows), repeat=1)
+    interned = measure("shape interning (all rows)", lambda: _column_names(rows))
+    service = ArrayMateService()
+    service.load_data({"rows": rows})
+    service.get_table_columns("rows")
+    cached = measure("get_table_columns (cached, x1000)", lambda: [service.get_table_columns("rows") for _ in range(1000)])
+    assert list_membership_column_names(rows[:32]) == _column_names(rows)
+    print(f"per row: list membership {legacy / len(legacy_rows) * 1e6:.1f} us, interned {interned / row_count * 1e6:.2f} us")
+    print(f"cached header lookup {cached / 1000 * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
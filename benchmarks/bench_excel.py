@@ -0,0 +1,61 @@
+"""
+Compare the Excel exporters: a regular in-memory workbook, openpyxl write-only
+mode and the native XLSX writer.
+
+Run from the repository root with ``python -m benchmarks.bench_excel [rows]``.
+Peak RSS is measured in a child process per writer, so it includes the rows.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from arraymate.core import OutputFormat, _spreadsheet_export_value, table_column_names, write_array_to_file
+from benchmarks.synthetic import flat_rows, measure_peak_rss
+
+EXCEL = OutputFormat(label="Excel", extension=".xlsx")
+
+
+def write_regular_workbook(rows: list, output_path: str) -> None:
+    """Excel export as implemented before write-only mode."""
+    columns = table_column_names(rows)
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Data"
+    worksheet.append(list(columns))
+    for row in rows:
+        worksheet.append([_spreadsheet_export_value(row.get(column)) for column in columns])
+    workbook.save(output_path)
+
+
+def run_writer(name: str, row_count: int, output_path: str) -> None:
+    rows = flat_rows(row_count)
+    started = time.perf_counter()
+    if name == "regular":
+        write_regular_workbook(rows, output_path)
+    elif name == "native":
+        write_array_to_file(rows, output_path, EXCEL, excel_writer="native")
+    else:
+        write_array_to_file(rows, output_path, EXCEL)
+    elapsed = time.perf_counter() - started
+    print(f"{name:<10} {elapsed:8.2f} s  {row_count / elapsed:12,.0f} rows/s")
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    with tempfile.TemporaryDirectory() as folder:
+        output_path = str(Path(folder) / "bench.xlsx")
+        measure_peak_rss("rows only (baseline)", lambda: flat_rows(row_count))
+        for name in ("regular", "write-only", "native"):
+            measure_peak_rss(name, lambda name=name: run_writer(name, row_count, output_path))
+            print(f"{'':<10} output size {os.path.getsize(output_path) / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare peak memory of a list-based export with the streamed row pipeline.
+
+Run from the repository root with ``python -m benchmarks.bench_export_pipeline [orders]``.
+The exported table is ``orders[*].items`` with parent metadata and formula
+escaping, so every row is a new dict built by the pipeline.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+from arraymate.core import TableTransformOptions, write_array_to_file
+from arraymate.service import ArrayMateService
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+OPTIONS = TableTransformOptions(stringify_formulas=True)
+
+
+def export_materialized(service: ArrayMateService, plan) -> None:
+    """Export as implemented before the row pipeline: build the table, then write it."""
+    rows = service.get_table_data("orders[*].items", include_parent_metadata=True, transform_options=OPTIONS)
+    write_array_to_file(rows, plan.file_path, plan.output_format)
+
+
+def export_streamed(service: ArrayMateService, plan) -> None:
+    service.table_columns = {}
+    service.export_array("orders[*].items", plan, include_parent_metadata=True, transform_options=OPTIONS)
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    service = ArrayMateService()
+    service.load_data(orders_document(order_count))
+    print(f"{order_count} orders, {order_count * 4} exported rows")
+    with tempfile.TemporaryDirectory() as folder:
+        plan = service.create_export_plan(folder, "bench", "CSV (.csv)")
+        measure_peak_memory("materialized rows", lambda: export_materialized(service, plan))
+        measure_peak_memory("streamed rows (incl. header pre-pass)", lambda: export_streamed(service, plan))
+        measure("materialized rows", lambda: export_materialized(service, plan), repeat=1)
+        measure("streamed rows (incl. header pre-pass)", lambda: export_streamed(service, plan), repeat=1)
+        print(f"output size {Path(plan.file_path).stat().st_size / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
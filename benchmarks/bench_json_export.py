@@ -0,0 +1,42 @@
+"""
+Compare peak memory of the streaming JSON exporter with a single ``json.dumps``.
+
+Run from the repository root with ``python -m benchmarks.bench_json_export [rows]``.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+from arraymate.core import JSON_STYLES, OutputFormat, write_array_to_file
+from benchmarks.synthetic import flat_rows, measure, measure_peak_memory
+
+JSON_FORMAT = OutputFormat(label="JSON", extension=".json")
+
+
+def write_single_dump(rows: list, output_path: Path) -> None:
+    """JSON export as implemented before streaming."""
+    output_path.write_text(json.dumps(rows, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = flat_rows(row_count)
+    print(f"{row_count} rows, 6 columns")
+    with tempfile.TemporaryDirectory() as folder:
+        output_path = Path(folder) / "bench.json"
+        measure_peak_memory("json.dumps (single string)", lambda: write_single_dump(rows, output_path))
+        measure("json.dumps (single string)", lambda: write_single_dump(rows, output_path), repeat=1)
+        print(f"{'':<48} {output_path.stat().st_size / 1024 / 1024:10.1f} MiB written")
+        for style in JSON_STYLES:
+            label = f"streaming ({style})"
+            measure_peak_memory(label, lambda style=style: write_array_to_file(rows, str(output_path), JSON_FORMAT, json_style=style))
+            measure(label, lambda style=style: write_array_to_file(rows, str(output_path), JSON_FORMAT, json_style=style), repeat=1)
+            print(f"{'':<48} {output_path.stat().st_size / 1024 / 1024:10.1f} MiB written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Compare candidate discovery on the lazy JSON tree with exploring the whole tree.
+
+Discovery only creates nodes for branches that can hold arrays; walking every
+``children`` tuple builds what the eager tree used to hold.
+
+Run from the repository root with ``python -m benchmarks.bench_json_tree [orders]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from arraymate.core import JsonNode, analyze_json
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+
+def settings_document(order_count: int) -> dict[str, Any]:
+    """Return orders next to a large block of nested scalar settings, as in config-heavy API dumps."""
+    document = orders_document(order_count)
+    document["settings"] = {
+        f"group_{group}": {f"option_{option}": option for option in range(200)} for group in range(order_count // 10)
+    }
+    return document
+
+
+def explore(node: JsonNode) -> int:
+    stack = [node]
+    count = 0
+    while stack:
+        current = stack.pop()
+        count += 1
+        stack.extend(current.children)
+    return count
+
+
+def discover_and_explore(data: Any) -> int:
+    return explore(analyze_json(data).json_tree)
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    data = settings_document(order_count)
+    print(f"orders document with {order_count} orders and {order_count // 10 * 200} scalar settings")
+    measure("analyze_json (lazy tree)", lambda: analyze_json(data))
+    measure("analyze_json + explore whole tree", lambda: discover_and_explore(data))
+    measure_peak_memory("analyze_json (lazy tree)", lambda: analyze_json(data))
+    measure_peak_memory("analyze_json + explore whole tree", lambda: discover_and_explore(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Compare the separate discovery passes with the single ``analyze_json`` pass.
+
+Run from the repository root with ``python -m benchmarks.bench_load``.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from arraymate.core import analyze_json, build_json_tree, discover_array_candidates, find_arrays
+from benchmarks.synthetic import measure, orders_document
+
+
+def separate_passes(data):
+    return find_arrays(data), build_json_tree(data), discover_array_candidates(data)
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    data = orders_document(order_count)
+    print(f"orders document with {order_count} orders")
+    separate = measure("find_arrays + build_json_tree + discover", lambda: separate_passes(data))
+    single = measure("analyze_json", lambda: analyze_json(data))
+    print(f"speedup: {separate / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare memoized nested-array detection with rescanning every array item.
+
+The lazy tree answers "does this subtree hold an array?" from the array path
+scan and reuses the answer for every ancestor; the previous check walked each
+item of every array node again, so deep object chains were scanned once per
+level.
+
+Run from the repository root with ``python -m benchmarks.bench_nested_arrays [rows] [depth]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any, Iterable
+
+from arraymate.core import (
+    JsonNode,
+    LazyJsonNode,
+    _ArrayPathCollector,
+    _collect_array_candidates,
+    _collect_array_paths,
+    analyze_json,
+)
+from benchmarks.synthetic import deep_rows_document, measure
+
+
+def contains_array(value: Any) -> bool:
+    if isinstance(value, list):
+        return True
+    if isinstance(value, dict):
+        return any(contains_array(child_value) for child_value in value.values())
+    return False
+
+
+class RescanJsonNode(LazyJsonNode):
+    """Lazy node with the previous per-item nested-array checks."""
+
+    @property
+    def has_nested_arrays(self) -> bool:  # type: ignore[override]
+        return any(contains_array(item) for item in self._items)
+
+    def _child(self, key: str) -> LazyJsonNode:
+        child = self._child_nodes.get(key)
+        if child is None:
+            child = super()._child(key)
+            child = RescanJsonNode(
+                child._values, child.path, child.label, aggregate=child._aggregate, branches=child._branch_trie
+            )
+            self._child_nodes[key] = child
+        return child
+
+    def _array_branches(self) -> Iterable[JsonNode]:
+        if self.kind == "object" and not self._aggregate:
+            value = self._values[0]
+            return [self._child(key) for key, child_value in value.items() if isinstance(child_value, (dict, list))]
+        return [child for child in self.children if child.kind in ("array", "object")]
+
+
+def rescan_candidates(data: Any) -> int:
+    """Run the same array path scan as ``analyze_json``, then discover candidates with rescans."""
+    collector = _ArrayPathCollector(keep_arrays=True)
+    branches = collector.branches if _collect_array_paths(data, collector) else None
+    candidates: list[Any] = []
+    _collect_array_candidates(RescanJsonNode((data,), (), "root", branches=branches), candidates)
+    return sum(candidate.has_nested_arrays for candidate in candidates)
+
+
+def memoized_candidates(data: Any) -> int:
+    return sum(candidate.has_nested_arrays for candidate in analyze_json(data).array_candidates)
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    data = deep_rows_document(row_count, depth)
+    print(f"deep rows document with {row_count} rows and {depth}-level object chains")
+    measure("analyze_json (memoized nested arrays)", lambda: memoized_candidates(data))
+    measure("candidate discovery with per-item rescans", lambda: rescan_candidates(data))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compare displayed-path array lookups with and without an array path index.
+
+Run from the repository root with ``python -m benchmarks.bench_path_index``.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from arraymate.core import build_array_path_index, get_array_data
+from benchmarks.synthetic import measure
+
+
+def nested_arrays_document(array_count: int) -> dict:
+    return {"rows": [{"id": index, "children": [{"value": index}]} for index in range(array_count)]}
+
+
+def main() -> None:
+    array_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = nested_arrays_document(array_count)
+    lookups = [f"rows[{index}].children" for index in range(0, array_count, max(1, array_count // 10))]
+    print(f"document with {array_count + 1} arrays, {len(lookups)} lookups")
+
+    index = build_array_path_index(data)
+    scan = measure("get_array_data (rediscover)", lambda: [get_array_data(data, path) for path in lookups], repeat=1)
+    build = measure("build_array_path_index", lambda: build_array_path_index(data), repeat=1)
+    indexed = measure(
+        "get_array_data (indexed, x1000 lookups)",
+        lambda: [get_array_data(data, path, index) for _ in range(1000) for path in lookups],
+    )
+    print(f"per lookup: rediscover {scan / len(lookups) * 1e3:.2f} ms, indexed {indexed / len(lookups) * 1e6 / 1000:.3f} us")
+    print(f"index pays for itself after {build / (scan / len(lookups)):.1f} lookups")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare a full table re-transform with re-deriving the one column whose transform changed.
+
+Run from the repository root with ``python -m benchmarks.bench_retransform [rows]``.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from arraymate.core import ColumnTransform, TableTransformOptions, apply_table_transform_options
+from arraymate.service import ArrayMateService
+from benchmarks.synthetic import measure
+
+COLUMN_COUNT = 300
+
+
+def wide_document(row_count: int) -> dict:
+    return {"rows": [{f"col_{column}": f"{row},{column}" for column in range(COLUMN_COUNT)} for row in range(row_count)]}
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    service = ArrayMateService()
+    service.load_data(wide_document(row_count))
+    print(f"{row_count} rows x {COLUMN_COUNT} columns, formula escaping on")
+
+    before = TableTransformOptions(
+        stringify_formulas=True,
+        column_transforms=(ColumnTransform(column="col_1", data_type="Number", find_text=",", replace_text="."),),
+    )
+    after = TableTransformOptions(
+        stringify_formulas=True,
+        column_transforms=before.column_transforms + (ColumnTransform(column="col_2", data_type="Number"),),
+    )
+    base_rows = service.get_table_data("rows")
+
+    full = measure("full re-transform", lambda: apply_table_transform_options(base_rows, after), repeat=1)
+
+    def incremental() -> None:
+        service.table_cache.discard(("rows", None, False, after))
+        service.get_table_data("rows", transform_options=after)
+
+    service.get_table_data("rows", transform_options=before)
+    partial = measure("re-derive changed column", incremental)
+    assert service.get_table_data("rows", transform_options=after) == apply_table_transform_options(base_rows, after)
+    print(f"speed-up {full / partial:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
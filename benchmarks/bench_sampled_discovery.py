@@ -0,0 +1,55 @@
+"""
+Compare exact candidate discovery with discovery from a bounded sample per array.
+
+Sampled discovery reads at most ``DISCOVERY_SAMPLE_SIZE`` items per array, so
+its cost stays flat as the document grows; ``ArrayMateService.load_data``
+shows those candidates first and finishes the exact analysis in the
+background.
+
+Run from the repository root with ``python -m benchmarks.bench_sampled_discovery [orders]``.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+from arraymate.core import DISCOVERY_SAMPLE_SIZE, analyze_json
+from arraymate.service import ArrayMateService
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+
+def timed_sampled_load(data: dict) -> None:
+    """Print how long ``load_data`` takes to return sampled candidates and to finish the exact ones."""
+    service = ArrayMateService()
+    started = time.perf_counter()
+    service.load_data(data, sample_size=DISCOVERY_SAMPLE_SIZE)
+    shown = time.perf_counter() - started
+    service.wait_for_exact_analysis()
+    finished = time.perf_counter() - started
+    print(f"{'load_data: candidates shown':<48} {shown * 1000:10.1f} ms")
+    print(f"{'load_data: exact candidates applied':<48} {finished * 1000:10.1f} ms")
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = orders_document(order_count)
+    print(f"orders document with {order_count} orders, sample of {DISCOVERY_SAMPLE_SIZE} items per array")
+    exact = measure("analyze_json (exact)", lambda: analyze_json(data).array_candidates, repeat=1)
+    sampled = measure("analyze_json (sampled)", lambda: analyze_json(data, DISCOVERY_SAMPLE_SIZE).array_candidates)
+    print(f"first candidates {exact / sampled:.0f}x sooner")
+    timed_sampled_load(data)
+    measure_peak_memory("analyze_json (exact)", lambda: analyze_json(data).array_candidates)
+    measure_peak_memory("analyze_json (sampled)", lambda: analyze_json(data, DISCOVERY_SAMPLE_SIZE).array_candidates)
+
+    exact_candidates = analyze_json(data).array_candidates
+    sampled_candidates = analyze_json(data, DISCOVERY_SAMPLE_SIZE).array_candidates
+    for exact_candidate, sampled_candidate in zip(exact_candidates, sampled_candidates):
+        print(
+            f"{exact_candidate.display_path:<28} {exact_candidate.item_count:>9} items,"
+            f" estimated {sampled_candidate.item_count:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare parsed and streamed file loading for peak memory and time.
+
+Run from the repository root with ``python -m benchmarks.bench_streaming``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+
+from arraymate.core import iter_json_file_array_items
+from arraymate.service import ArrayMateService
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False, encoding="utf-8") as file:
+        json.dump(orders_document(order_count), file, default=str)
+        file_path = file.name
+    try:
+        print(f"orders file with {order_count} orders, {os.path.getsize(file_path) / 1024 / 1024:.1f} MiB")
+        measure("load_file (parsed)", lambda: ArrayMateService().load_file(file_path, streaming=False), repeat=1)
+        measure("load_file (streaming)", lambda: ArrayMateService().load_file(file_path, streaming=True), repeat=1)
+        measure_peak_memory("load_file (parsed)", lambda: ArrayMateService().load_file(file_path, streaming=False))
+        measure_peak_memory("load_file (streaming)", lambda: ArrayMateService().load_file(file_path, streaming=True))
+        measure_peak_memory(
+            "stream orders[*].items rows",
+            lambda: sum(1 for _ in iter_json_file_array_items(file_path, ("orders", Ellipsis, "items"))),
+        )
+    finally:
+        os.unlink(file_path)
+
+
+if __name__ == "__main__":
+    main()
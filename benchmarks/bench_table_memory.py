@@ -0,0 +1,46 @@
+"""
+Compare the memory a 1M-row table costs with row-dict copies and with the row pipeline.
+
+Run from the repository root with ``python -m benchmarks.bench_table_memory [rows]``.
+Peaks are traced on top of the loaded rows, which are measured first. The
+copy mirrors ``records_to_dataframe`` before it shared the source rows; the
+exports and the preview read the loaded rows directly.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+from arraymate.core import OutputFormat, build_table_preview, records_to_dataframe, write_array_to_file
+from benchmarks.synthetic import flat_rows, measure_peak_memory
+
+CSV_FORMAT = OutputFormat(label="CSV", extension=".csv")
+JSON_FORMAT = OutputFormat(label="JSON", extension=".json")
+EXCEL_FORMAT = OutputFormat(label="Excel", extension=".xlsx")
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rows: list = []
+    measure_peak_memory("loaded rows", lambda: rows.extend(flat_rows(row_count)))
+    print(f"{row_count} rows, 6 columns")
+    measure_peak_memory("row-dict copy", lambda: tuple(dict(row) for row in rows))
+    measure_peak_memory("records_to_dataframe", lambda: records_to_dataframe(rows))
+    measure_peak_memory("preview (first 200 rows)", lambda: build_table_preview(rows, "rows", max_rows=200))
+    with tempfile.TemporaryDirectory() as folder:
+        output_path = Path(folder) / "bench"
+        measure_peak_memory("CSV export", lambda: write_array_to_file(rows, str(output_path), CSV_FORMAT))
+        measure_peak_memory(
+            "JSON export (compact)",
+            lambda: write_array_to_file(rows, str(output_path), JSON_FORMAT, json_style="compact"),
+        )
+        measure_peak_memory(
+            "native XLSX export",
+            lambda: write_array_to_file(rows, str(output_path), EXCEL_FORMAT, excel_writer="native"),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Compare the compiled transform plan with per-cell option checks.
+
+Run from the repository root with ``python -m benchmarks.bench_transforms [rows]``.
+The table has 30 columns; rows are drawn from a pool of 10,000 and every row
+is transformed afresh.
+"""
+
+from __future__ import annotations
+
+import sys
+from collections import deque
+from decimal import Decimal
+from itertools import cycle, islice
+from typing import Any, Optional
+
+from arraymate.core import (
+    ArrayMateCoreError,
+    ColumnTransform,
+    TableTransformOptions,
+    _coerce_boolean,
+    _coerce_number,
+    _is_integral_decimal,
+    _stringify_value,
+    iter_table_transform_options,
+)
+from benchmarks.synthetic import measure
+
+COLUMN_COUNT = 30
+OPTIONS = TableTransformOptions(
+    stringify_formulas=True,
+    column_transforms=(
+        ColumnTransform(column="col_0", data_type="Integer"),
+        ColumnTransform(column="col_1", data_type="Number", find_text=",", replace_text="."),
+        ColumnTransform(column="col_2", data_type="Boolean"),
+        ColumnTransform(column="col_3", data_type="Text"),
+        ColumnTransform(column="col_4", data_type="Keep", find_text="-", replace_text="_"),
+    ),
+)
+
+
+def legacy_escape_formula_text(value: str) -> str:
+    if value.startswith("'"):
+        return value
+    stripped_value = value.lstrip(" \t\r\n")
+    if stripped_value and stripped_value[0] in ("=", "+", "-", "@"):
+        return f"'{value}"
+    return value
+
+
+def legacy_transform_row(row: Any, options: TableTransformOptions) -> Any:
+    """Row transform as implemented before compiled plans."""
+    if isinstance(row, dict):
+        column_transforms = {transform.column: transform for transform in options.column_transforms}
+        return {key: legacy_transform_cell(value, options, column_transforms.get(str(key))) for key, value in row.items()}
+    return legacy_transform_value(row, options)
+
+
+def legacy_transform_cell(value: Any, options: TableTransformOptions, column_transform: Optional[ColumnTransform]) -> Any:
+    transformed_value = legacy_transform_value(value, options)
+    if column_transform is not None:
+        transformed_value = legacy_apply_column_transform(transformed_value, column_transform)
+    if isinstance(transformed_value, str) and (options.stringify_all or options.stringify_formulas):
+        return legacy_escape_formula_text(transformed_value)
+    return transformed_value
+
+
+def legacy_transform_value(value: Any, options: TableTransformOptions) -> Any:
+    if options.stringify_all:
+        return legacy_escape_formula_text(_stringify_value(value))
+    if isinstance(value, dict):
+        return {key: legacy_transform_value(item, options) for key, item in value.items()}
+    if isinstance(value, list):
+        return [legacy_transform_value(item, options) for item in value]
+    if options.stringify_formulas and isinstance(value, str):
+        return legacy_escape_formula_text(value)
+    return value
+
+
+def legacy_apply_column_transform(value: Any, transform: ColumnTransform) -> Any:
+    transformed_value = value
+    if transform.find_text:
+        transformed_value = _stringify_value(transformed_value).replace(transform.find_text, transform.replace_text)
+    data_type = transform.data_type.lower()
+    if data_type == "keep":
+        return transformed_value
+    if data_type == "text":
+        return legacy_escape_formula_text(_stringify_value(transformed_value))
+    if data_type == "number":
+        return _coerce_number(transformed_value)
+    if data_type == "integer":
+        number_value = _coerce_number(transformed_value)
+        if number_value is None:
+            return None
+        if not _is_integral_decimal(number_value):
+            raise ArrayMateCoreError(f"Cannot convert '{transformed_value}' to integer")
+        return int(number_value)
+    if data_type == "boolean":
+        return _coerce_boolean(transformed_value)
+    return transformed_value
+
+
+def mixed_rows(pool_size: int = 10_000) -> list[dict[str, Any]]:
+    rows = []
+    for index in range(pool_size):
+        row = {
+            "col_0": str(index),
+            "col_1": f"{index % 100},5",
+            "col_2": ("yes", "no", "1", "0")[index % 4],
+            "col_3": index * 3,
+            "col_4": f"A-{index}",
+        }
+        for column in range(5, COLUMN_COUNT):
+            row[f"col_{column}"] = (f"text {index}", index, Decimal("1.5"), None, "=SUM(A1)", True)[column % 6]
+        rows.append(row)
+    return rows
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    pool = mixed_rows()
+    print(f"{row_count} rows x {COLUMN_COUNT} columns, {len(OPTIONS.column_transforms)} column transforms + formula escaping")
+
+    legacy_count = min(row_count, 100_000)
+    assert [legacy_transform_row(row, OPTIONS) for row in pool] == list(iter_table_transform_options(pool, OPTIONS))
+    legacy = measure(
+        f"per-cell option checks ({legacy_count // 1000}k rows)",
+        lambda: deque((legacy_transform_row(row, OPTIONS) for row in islice(cycle(pool), legacy_count)), maxlen=0),
+        repeat=1,
+    )
+    compiled = measure(
+        f"compiled plan ({row_count // 1000}k rows)",
+        lambda: deque(iter_table_transform_options(islice(cycle(pool), row_count), OPTIONS), maxlen=0),
+        repeat=1,
+    )
+    print(f"per row: per-cell checks {legacy / legacy_count * 1e6:.2f} us, compiled {compiled / row_count * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Compare the explicit-stack JSON traversal with the previous recursive walk on wide and deep documents.
+
+The array path scan, path resolution and leaf copies keep a stack of child
+iterators with parent-linked paths, so concrete path tuples are only built for
+the arrays they report and nesting depth is not bound by the recursion limit.
+The recursive reference below is the previous ``iter_array_paths``; it fails
+on documents nested deeper than the recursion limit.
+
+Run from the repository root with ``python -m benchmarks.bench_traversal [orders] [depth]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import Any
+
+from arraymate.core import WILDCARD, analyze_json, get_array_data_by_path, iter_array_paths
+from benchmarks.synthetic import measure, measure_peak_memory, orders_document
+
+
+def recursive_array_paths(data: Any, path: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    paths: list[tuple[Any, ...]] = []
+    if isinstance(data, dict):
+        for key, value in data.items():
+            current_path = path + (key,)
+            if isinstance(value, list):
+                paths.append(current_path)
+                for index, item in enumerate(value):
+                    if isinstance(item, (dict, list)):
+                        paths.extend(recursive_array_paths(item, current_path + (index,)))
+            elif isinstance(value, dict):
+                paths.extend(recursive_array_paths(value, current_path))
+    elif isinstance(data, list):
+        if not path:
+            paths.append(())
+        for index, item in enumerate(data):
+            if isinstance(item, (dict, list)):
+                paths.extend(recursive_array_paths(item, path + (index,)))
+    return paths
+
+
+def deep_chain_document(depth: int, row_count: int = 100) -> dict[str, Any]:
+    """Return machine-generated style nesting: ``depth`` single-key objects around a rows array."""
+    data: dict[str, Any] = {"rows": [{"id": index, "tags": [{"tag": index}]} for index in range(row_count)]}
+    for level in range(depth):
+        data = {"child": data, "level": level}
+    return data
+
+
+def measure_recursive(label: str, data: Any) -> None:
+    try:
+        measure(label, lambda: recursive_array_paths(data))
+    except RecursionError:
+        print(f"{label:<48} {'RecursionError':>13}")
+
+
+def main() -> None:
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    depth = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+
+    wide = orders_document(order_count)
+    print(f"wide: orders document with {order_count} orders")
+    measure("iter_array_paths (explicit stack)", lambda: iter_array_paths(wide))
+    measure_recursive("iter_array_paths (recursive)", wide)
+    measure("analyze_json candidates", lambda: analyze_json(wide).array_candidates)
+
+    shallow_depth = sys.getrecursionlimit() // 2 - 50
+    for chain_depth in (shallow_depth, depth):
+        deep = deep_chain_document(chain_depth)
+        rows_path = ("child",) * chain_depth + ("rows",)
+        print(f"deep: {chain_depth} levels of nested objects")
+        measure("iter_array_paths (explicit stack)", lambda: iter_array_paths(deep))
+        measure_recursive("iter_array_paths (recursive)", deep)
+        measure("analyze_json candidates", lambda: analyze_json(deep).array_candidates)
+        measure("get_array_data_by_path (wildcard)", lambda: get_array_data_by_path(deep, rows_path + (WILDCARD, "tags")))
+        measure_peak_memory("analyze_json candidates", lambda: analyze_json(deep).array_candidates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Compare exception-based type probing with the single-pass classifier.
+
+Run from the repository root with ``python -m benchmarks.bench_type_probe [rows]``.
+"""
+
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from typing import Any
+
+from arraymate.core import (
+    ArrayMateCoreError,
+    _coerce_boolean,
+    _coerce_number,
+    _is_integral_decimal,
+    infer_column_transform_types,
+    infer_table_transform_types,
+    table_column_names,
+)
+from benchmarks.synthetic import measure
+
+
+def legacy_infer_column_transform_types(array_data: list[Any], column: str) -> tuple[str, ...]:
+    """Type probing as implemented before the classifier: coerce every value inside try/except."""
+
+    def can_coerce_number(value: Any) -> bool:
+        try:
+            _coerce_number(value)
+            return True
+        except ArrayMateCoreError:
+            return False
+
+    def can_coerce_integer(value: Any) -> bool:
+        try:
+            number_value = _coerce_number(value)
+        except ArrayMateCoreError:
+            return False
+        return number_value is None or _is_integral_decimal(number_value)
+
+    def can_coerce_boolean(value: Any) -> bool:
+        try:
+            _coerce_boolean(value)
+            return True
+        except ArrayMateCoreError:
+            return False
+
+    base_types = ["Keep", "Text"]
+    values = [row.get(column) for row in array_data if isinstance(row, dict) and column in row]
+    meaningful_values = [value for value in values if value not in (None, "")]
+    if not meaningful_values:
+        return tuple(base_types + ["Number", "Integer", "Boolean"])
+    if all(can_coerce_number(value) for value in meaningful_values):
+        base_types.append("Number")
+        if all(can_coerce_integer(value) for value in meaningful_values):
+            base_types.append("Integer")
+    if all(can_coerce_boolean(value) for value in meaningful_values):
+        base_types.append("Boolean")
+    return tuple(base_types)
+
+
+def mixed_rows(row_count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": str(index),
+            "amount": f"{index % 1000},{index % 100:02d}",
+            "price": Decimal(f"{index % 100}.5"),
+            "active": ("yes", "no")[index % 2],
+            "name": f"Customer {index}",
+            "city": ("Berlin", "Paris", "Rome")[index % 3],
+            "comment": f"order {index} shipped",
+            "quantity": index % 17,
+        }
+        for index in range(row_count)
+    ]
+
+
+def main() -> None:
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = mixed_rows(row_count)
+    columns = table_column_names(rows)
+    print(f"{row_count} rows, {len(columns)} columns (3 text-only)")
+
+    expected = {column: legacy_infer_column_transform_types(rows, column) for column in columns}
+    assert infer_table_transform_types(rows) == expected
+    measure("try/except coercion, per column", lambda: [legacy_infer_column_transform_types(rows, c) for c in columns], repeat=1)
+    measure("classifier, per column", lambda: [infer_column_transform_types(rows, c) for c in columns])
+    measure("classifier, all columns in one sweep", lambda: infer_table_transform_types(rows))
+
+
+if __name__ == "__main__":
+    main()
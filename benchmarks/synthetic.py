@@ -0,0 +1,125 @@
+"""Synthetic JSON documents and timing helpers shared by the benchmarks."""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable
+
+
+def orders_document(order_count: int, items_per_order: int = 4, lots_per_item: int = 2) -> dict[str, Any]:
+    """Return an API-dump style document with ``orders[*].items[*].lots`` nesting."""
+    return {
+        "meta": {"source": "benchmark", "generated": "2026-01-01"},
+        "orders": [
+            {
+                "order_id": f"ORD{order_index:08d}",
+                "status": ("Completed", "Pending", "Cancelled")[order_index % 3],
+                "customer": {"id": order_index % 997, "region": ("EU", "US", "APAC")[order_index % 3]},
+                "total": Decimal(f"{order_index % 1000}.{order_index % 100:02d}"),
+                "items": [
+                    {
+                        "sku": f"SKU{item_index:04d}",
+                        "quantity": item_index + 1,
+                        "price": Decimal(f"{item_index + 1}.99"),
+                        "lots": [{"lot": f"L{lot_index}", "qty": lot_index + 1} for lot_index in range(lots_per_item)],
+                    }
+                    for item_index in range(items_per_order)
+                ],
+            }
+            for order_index in range(order_count)
+        ],
+    }
+
+
+def deep_rows_document(row_count: int, depth: int = 8) -> dict[str, Any]:
+    """
+    Return ``sample_data_hell.json`` style rows, each with a ``nested.level1...`` object chain.
+
+    Every row carries a scalar-only chain of ``depth`` levels; every tenth row
+    ends its array chain in ``emptyArray``/``mixed`` arrays like the sample file.
+    """
+
+    def chain(level: int, leaf: dict[str, Any]) -> dict[str, Any]:
+        return leaf if level > depth else {f"level{level}": chain(level + 1, leaf), "note": f"level {level}"}
+
+    return {
+        "root": [
+            {
+                "id": row_index,
+                "user.name": f"User {row_index}",
+                "settings": chain(1, {"value": "deep value", "flags": {"a": True, "b": None}}),
+                "nested": chain(
+                    1,
+                    {"value": "deep value", "emptyArray": [], "mixed": [None, True, 123, "text", {"insideArray": [[], [{}]]}]}
+                    if row_index % 10 == 0
+                    else {"value": "deep value"},
+                ),
+            }
+            for row_index in range(row_count)
+        ],
+        "empty_things": {"empty_array": [], "empty_object": {}, "array_of_empty_arrays": [[], []]},
+    }
+
+
+def flat_rows(row_count: int) -> list[dict[str, Any]]:
+    """Return ``row_count`` flat rows with six columns of mixed scalar types."""
+    return [
+        {
+            "id": index,
+            "sku": f"SKU{index % 5000:05d}",
+            "quantity": index % 17,
+            "price": Decimal(f"{index % 100}.99"),
+            "ratio": index / 7,
+            "active": index % 2 == 0,
+        }
+        for index in range(row_count)
+    ]
+
+
+def measure(label: str, function: Callable[[], Any], repeat: int = 3) -> float:
+    """Print and return the best wall-clock time of ``function`` over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - started)
+    print(f"{label:<48} {best * 1000:10.1f} ms")
+    return best
+
+
+def measure_peak_memory(label: str, function: Callable[[], Any]) -> int:
+    """Print and return the peak traced Python allocation size of ``function``."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    print(f"{label:<48} {peak / 1024 / 1024:10.1f} MiB peak")
+    return peak
+
+
+def measure_peak_rss(label: str, function: Callable[[], Any]) -> int:
+    """
+    Print and return the peak resident set size of ``function`` run in a fresh child process.
+
+    Requires a platform with ``fork`` and the ``resource`` module.
+    """
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=_report_peak_rss, args=(function, queue))
+    process.start()
+    peak = queue.get()
+    process.join()
+    print(f"{label:<48} {peak / 1024 / 1024:10.1f} MiB peak RSS")
+    return peak
+
+
+def _report_peak_rss(function: Callable[[], Any], queue: Any) -> None:
+    import resource
+
+    function()
+    queue.put(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024)
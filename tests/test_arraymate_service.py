@@ -3,7 +3,13 @@ import unittest
 from decimal import Decimal
 from pathlib import Path
 
-from arraymate.core import ColumnTransform, TableTransformOptions
+from arraymate.core import (
+    ArrayMateCoreError,
+    ColumnTransform,
+    TableTransformOptions,
+    apply_table_transform_options,
+    table_column_names,
+)
 from arraymate.service import ArrayMateService
 
 
@@ -105,6 +111,39 @@ class ArrayMateServiceTests(unittest.TestCase):
         self.assertEqual(rows, [{"salary": Decimal("65.000")}, {"salary": Decimal("65.0123")}])
         self.assertEqual(str(rows[0]["salary"]), "65.000")
 
+    def test_documents_nested_5000_levels_deep_load_and_export(self):
+        depth = 5000
+        deep_text = '{"a": ' * depth + "1.5" + "}" * depth
+        json_text = '{"users": [{"id": 1, "deep": ' + deep_text + "}]}"
+        # Decimals are exported as JSON strings inside nested cells.
+        deep_cell = deep_text.replace("1.5", '"1.5"')
+        input_path = Path("test_arraymate_service_deep.json")
+        input_path.write_text(json_text, encoding="utf-8")
+        csv_path = Path("test_arraymate_service_deep.csv")
+        json_path = Path("test_arraymate_service_deep_export.json")
+        try:
+            for load in (
+                lambda service: service.load_text(json_text),
+                lambda service: service.load_file(str(input_path), streaming=False),
+            ):
+                service = ArrayMateService()
+                load(service)
+                self.assertEqual(service.array_keys, ["users"])
+                stringified = service.get_table_data("users", transform_options=TableTransformOptions(stringify_all=True))
+                self.assertEqual(stringified, [{"id": "1", "deep": deep_cell}])
+
+                service.export_array("users", service.create_export_plan(".", csv_path.stem, "CSV (.csv)"))
+                self.assertEqual(
+                    csv_path.read_text(encoding="utf-8").splitlines(), ["id,deep", '1,"' + deep_cell.replace('"', '""') + '"']
+                )
+                service.export_array("users", service.create_export_plan(".", json_path.stem, "JSON (.json)"))
+                exported = ArrayMateService()
+                exported.load_file(str(json_path), streaming=False)
+                self.assertEqual(exported.get_table_data("root", transform_options=TableTransformOptions(stringify_all=True)), stringified)
+        finally:
+            for path in (input_path, csv_path, json_path):
+                path.unlink(missing_ok=True)
+
     def test_grouped_nested_candidate_can_include_parent_metadata(self):
         service = ArrayMateService()
         service.load_text(
@@ -183,6 +222,388 @@ class ArrayMateServiceTests(unittest.TestCase):
 
         self.assertEqual([candidate.display_path for candidate in candidates], ["root_rows[*].a", "root_rows[*].a[*].b"])
 
+    def test_candidate_indexes_match_full_candidate_scan(self):
+        service = ArrayMateService()
+        service.load_text(
+            '{"orders": ['
+            '{"items": [{"sku": "A", "serials": [{"id": 1}], "tags": ["x"]}], "notes": [{"text": "n"}]},'
+            '{"items": [{"sku": "B", "serials": []}]}'
+            '], "archive": {"orders": [{"items": [{"sku": "C"}]}]}}'
+        )
+
+        for candidate in service.array_candidates:
+            self.assertIs(service.get_array_candidate(candidate.display_path), candidate)
+            expected = [
+                nested
+                for nested in service.array_candidates
+                if nested.exportable
+                and nested.path[: len(candidate.path) + 1] == candidate.path + (Ellipsis,)
+                and 1 <= nested.path.count(Ellipsis) - candidate.path.count(Ellipsis) <= 3
+            ]
+            self.assertEqual(service.get_nested_array_candidates(candidate.display_path), expected)
+        self.assertIsNone(service.get_array_candidate("missing"))
+
+        service.clear()
+
+        self.assertEqual(service.get_nested_array_candidates("orders"), [])
+
+    def test_streamed_file_returns_same_tables_as_parsed_file(self):
+        output_path = Path("test_arraymate_service_streaming.json")
+        output_path.write_text(
+            '{"orders": ['
+            '{"order_id": "ORD001", "total": 10.50, "items": [{"sku": "A"}, {"sku": "B"}]},'
+            '{"order_id": "ORD002", "total": 3, "items": [{"sku": "C"}]}'
+            ']}',
+            encoding="utf-8",
+        )
+        try:
+            parsed = ArrayMateService()
+            parsed_result = parsed.load_file(str(output_path), streaming=False)
+            streamed = ArrayMateService()
+            streamed_result = streamed.load_file(str(output_path), streaming=True)
+
+            self.assertTrue(streamed.is_streaming)
+            self.assertIsNone(streamed.json_data)
+            self.assertEqual(streamed_result.array_keys, parsed_result.array_keys)
+            self.assertEqual(streamed_result.array_candidates, parsed_result.array_candidates)
+            for array_key in ["orders", "orders[*].items", "orders[1].items"]:
+                for include_parent_metadata in (False, True):
+                    self.assertEqual(
+                        streamed.get_array_data(array_key, include_parent_metadata=include_parent_metadata),
+                        parsed.get_array_data(array_key, include_parent_metadata=include_parent_metadata),
+                    )
+            self.assertEqual(
+                streamed.get_table_data("orders", unfold_key="orders[*].items"),
+                parsed.get_table_data("orders", unfold_key="orders[*].items"),
+            )
+            self.assertEqual(streamed.get_table_data("orders")[0]["total"], Decimal("10.50"))
+            for array_key, unfold_key in [("orders", None), ("orders", "orders[*].items"), ("orders[*].items", None)]:
+                self.assertEqual(
+                    streamed.get_table_preview(array_key, unfold_key, max_rows=1),
+                    parsed.get_table_preview(array_key, unfold_key, max_rows=1),
+                )
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_lazy_table_rows_and_columns_match_table_data(self):
+        service = ArrayMateService()
+        service.load_text(
+            '{"orders": ['
+            '{"order_id": "=ORD001", "items": [{"sku": "A"}, {"sku": "B", "qty": 2}]},'
+            '{"order_id": "ORD002", "items": [{"sku": "C", "note": "x"}]}'
+            ']}'
+        )
+        options = TableTransformOptions(stringify_formulas=True)
+        cases = [
+            ("orders", None, False),
+            ("orders[*].items", None, False),
+            ("orders[*].items", None, True),
+            ("orders", "orders[*].items", False),
+        ]
+
+        for array_key, unfold_key, include_parent_metadata in cases:
+            with self.subTest(array_key=array_key, unfold_key=unfold_key, include_parent_metadata=include_parent_metadata):
+                table_data = service.get_table_data(array_key, unfold_key, include_parent_metadata, options)
+                rows = service.iter_table_rows(array_key, unfold_key, include_parent_metadata, options)
+
+                self.assertNotIsInstance(rows, list)
+                self.assertEqual(list(rows), table_data)
+                self.assertEqual(
+                    service.get_table_columns(array_key, unfold_key, include_parent_metadata),
+                    table_column_names(table_data),
+                )
+
+    def test_streamed_table_preview_keeps_only_the_first_rows(self):
+        output_path = Path("test_arraymate_service_preview.json")
+        output_path.write_text(json.dumps({"rows": [{"id": index, "name": f"=N{index}"} for index in range(5)]}), encoding="utf-8")
+        try:
+            service = ArrayMateService()
+            service.load_file(str(output_path), streaming=True)
+            preview = service.get_table_preview(
+                "rows",
+                transform_options=TableTransformOptions(stringify_formulas=True),
+                max_rows=2,
+            )
+
+            self.assertEqual(preview.rows, 5)
+            self.assertEqual(preview.preview_rows, ({"id": 0, "name": "'=N0"}, {"id": 1, "name": "'=N1"}))
+            self.assertEqual([column.name for column in preview.columns], ["id", "name"])
+            self.assertEqual(service.table_cache_stats.entries, 0)
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_table_headers_are_cached_per_service(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"id": 1}, {"id": 2, "name": "Ada"}]}')
+        other = ArrayMateService()
+        other.load_text('{"rows": [{"other": 1}]}')
+
+        columns = service.get_table_columns("rows")
+        other.clear()
+
+        self.assertEqual(columns, ("id", "name"))
+        self.assertIs(service.get_table_columns("rows"), columns)
+        self.assertEqual(service.get_column_transform_types("rows"), {"id": ("Keep", "Text", "Number", "Integer", "Boolean"), "name": ("Keep", "Text")})
+
+    def test_streamed_column_checks_do_not_materialize_the_table(self):
+        output_path = Path("test_arraymate_service_checks.json")
+        rows = [{"id": str(index), "ratio": "0.5"} for index in range(5)] + [{"id": "x", "ratio": "1"}]
+        output_path.write_text(json.dumps({"rows": rows}), encoding="utf-8")
+        options = TableTransformOptions(column_transforms=(ColumnTransform(column="id", data_type="Integer"),))
+        try:
+            parsed = ArrayMateService()
+            parsed.load_file(str(output_path), streaming=False)
+            streamed = ArrayMateService()
+            streamed.load_file(str(output_path), streaming=True)
+
+            self.assertEqual(streamed.get_column_transform_types("rows"), parsed.get_column_transform_types("rows"))
+            self.assertIsNone(streamed.check_column_transforms("rows", options, sample_size=5))
+            issue = streamed.check_column_transforms("rows", options)
+            self.assertEqual((issue.row_index, issue.column, issue.value), (5, "id", "x"))
+            self.assertEqual(parsed.check_column_transforms("rows", options), issue)
+            self.assertEqual(streamed.table_cache_stats.entries, 0)
+            with self.assertRaisesRegex(ArrayMateCoreError, "invalid"):
+                streamed.check_column_transforms("missing", options)
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_export_array_streams_rows_with_cached_header(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"id": 1}, {"id": 2, "name": "=Ada"}]}')
+        output_path = Path("test_arraymate_service_stream.csv")
+        try:
+            plan = service.create_export_plan(".", output_path.stem, "CSV (.csv)")
+            result = service.export_array("rows", plan, transform_options=TableTransformOptions(stringify_formulas=True))
+
+            self.assertEqual((result.rows, result.columns), (2, 2))
+            self.assertEqual(service.table_columns, {("rows", None, False): ("id", "name")})
+            self.assertEqual(output_path.read_text(encoding="utf-8").splitlines(), ["id,name", "1,", "2,'=Ada"])
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_export_array_reports_progress_and_aborts_from_callback(self):
+        service = ArrayMateService()
+        service.load_data({"rows": [{"id": index} for index in range(2500)]})
+        output_path = Path("test_arraymate_service_progress.csv")
+        plan = service.create_export_plan(".", output_path.stem, "CSV (.csv)")
+        reported: list[int] = []
+
+        try:
+            result = service.export_array("rows", plan, progress=reported.append)
+
+            self.assertEqual(result.rows, 2500)
+            self.assertEqual(reported, [1000, 2000, 2500])
+            exported = output_path.read_text(encoding="utf-8")
+
+            def cancel(row_count: int) -> None:
+                raise ArrayMateCoreError("cancelled")
+
+            with self.assertRaisesRegex(ArrayMateCoreError, "cancelled"):
+                service.export_array("rows", plan, progress=cancel)
+            self.assertEqual(output_path.read_text(encoding="utf-8"), exported)
+            output_path.unlink()
+            with self.assertRaisesRegex(ArrayMateCoreError, "cancelled"):
+                service.export_array("rows", plan, progress=cancel)
+            self.assertFalse(output_path.exists())
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_checkpoints_abort_loads_previews_and_column_checks(self):
+        json_text = json.dumps({"rows": [{"id": str(index), "tags": [index]} for index in range(2500)]})
+        output_path = Path("test_arraymate_service_checkpoints.json")
+        output_path.write_text(json_text, encoding="utf-8")
+        options = TableTransformOptions(column_transforms=(ColumnTransform(column="id", data_type="Integer"),))
+        checkpoints: list[None] = []
+
+        def cancel_after_two() -> None:
+            checkpoints.append(None)
+            if len(checkpoints) > 2:
+                raise ArrayMateCoreError("cancelled")
+
+        try:
+            for streaming in (False, True):
+                with self.subTest(streaming=streaming):
+                    service = ArrayMateService()
+                    with self.assertRaisesRegex(ArrayMateCoreError, "cancelled"):
+                        service.load_file(str(output_path), streaming=streaming, checkpoint=cancel_after_two)
+                    self.assertEqual(service.array_keys, [])
+                    service.load_file(str(output_path), streaming=streaming)
+
+                    operations = (
+                        lambda: service.get_table_preview("rows", checkpoint=cancel_after_two),
+                        lambda: service.get_table_data("rows", transform_options=options, checkpoint=cancel_after_two),
+                        lambda: service.get_column_transform_types("rows", checkpoint=cancel_after_two),
+                        lambda: service.check_column_transforms("rows", options, checkpoint=cancel_after_two),
+                    )
+                    for operation in operations:
+                        checkpoints.clear()
+                        with self.assertRaisesRegex(ArrayMateCoreError, "cancelled"):
+                            operation()
+                    self.assertEqual(service.column_transform_types, {})
+                    self.assertEqual(service.table_cache.peek(("rows", None, False, options)), None)
+
+            service = ArrayMateService()
+            checkpoints.clear()
+            with self.assertRaisesRegex(ArrayMateCoreError, "cancelled"):
+                service.load_text(json_text, checkpoint=cancel_after_two)
+            self.assertIsNone(service.json_data)
+            checkpoints.clear()
+            service.load_text(json_text, checkpoint=lambda: checkpoints.append(None))
+            self.assertEqual(service.array_keys[0], "rows")
+            self.assertGreater(len(checkpoints), 2)
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_column_transform_types_are_inferred_once_per_table_and_options(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"id": "1", "active": "yes", "name": "Ada"}, {"id": "2", "active": "no"}]}')
+
+        column_types = service.get_column_transform_types("rows")
+        with_column_transform = service.get_column_transform_types(
+            "rows",
+            transform_options=TableTransformOptions(column_transforms=(ColumnTransform(column="id", data_type="Text"),)),
+        )
+
+        self.assertEqual(
+            column_types,
+            {
+                "id": ("Keep", "Text", "Number", "Integer"),
+                "active": ("Keep", "Text", "Boolean"),
+                "name": ("Keep", "Text"),
+            },
+        )
+        self.assertIs(with_column_transform, column_types)
+        self.assertEqual(
+            service.get_column_transform_types("rows", transform_options=TableTransformOptions(stringify_all=True))["id"],
+            ("Keep", "Text", "Number", "Integer"),
+        )
+        self.assertEqual(len(service.column_transform_types), 2)
+
+        service.load_text('{"rows": [{"id": "x"}]}')
+
+        self.assertEqual(service.get_column_transform_types("rows"), {"id": ("Keep", "Text")})
+
+    def test_sampled_load_finishes_exact_candidates_in_the_background(self):
+        service = ArrayMateService()
+        data = {"rows": [{"id": index, "items": [{"sku": index}]} for index in range(50)]}
+        exact_results = []
+
+        result = service.load_data(data, sample_size=8, on_exact=exact_results.append)
+
+        self.assertTrue(result.estimated)
+        self.assertTrue(all(candidate.estimated for candidate in result.array_candidates))
+        self.assertEqual(result.selected_array, data["rows"])
+        self.assertTrue(service.wait_for_exact_analysis(timeout=10))
+        self.assertEqual(len(exact_results), 1)
+        self.assertFalse(exact_results[0].estimated)
+        self.assertFalse(any(candidate.estimated for candidate in exact_results[0].array_candidates))
+        self.assertEqual(service.array_candidates, exact_results[0].array_candidates)
+        self.assertEqual(len(service.array_keys), 51)
+        self.assertEqual(service.get_array_data("rows[49].items"), [{"sku": 49}])
+
+        service.load_data({"rows": [{"id": 1}]}, sample_size=8)
+
+        self.assertIsNone(service.exact_analysis_thread)
+        self.assertFalse(service.array_candidates[0].estimated)
+
+    def test_table_data_is_cached_until_next_load(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"id": 1, "name": "=Ada"}]}')
+        options = TableTransformOptions(stringify_formulas=True)
+
+        first = service.get_table_data("rows", transform_options=options)
+        second = service.get_table_data("rows", transform_options=TableTransformOptions(stringify_formulas=True))
+        service.get_table_data("rows")
+
+        self.assertIs(second, first)
+        stats = service.table_cache_stats
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 2, 2))
+        self.assertGreater(stats.size_bytes, 0)
+
+        service.load_text('{"rows": [{"id": 2}]}')
+
+        self.assertEqual(service.table_cache_stats.entries, 0)
+        self.assertEqual(service.get_table_data("rows", transform_options=options), [{"id": 2}])
+
+    def test_default_transform_options_share_the_untransformed_table_entry(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"id": 1, "name": "=Ada"}]}')
+
+        untransformed = service.get_table_data("rows")
+        defaulted = service.get_table_data("rows", transform_options=TableTransformOptions())
+
+        self.assertIs(defaulted, untransformed)
+        stats = service.table_cache_stats
+        self.assertEqual((stats.hits, stats.misses, stats.entries), (1, 1, 1))
+
+    def test_table_cache_evicts_least_recently_used_tables_by_size(self):
+        service = ArrayMateService(table_cache_bytes=4096)
+        service.load_text(json.dumps({"a": [{"value": "x" * 100}] * 5, "b": [{"value": "y" * 100}] * 5}))
+
+        service.get_table_data("a")
+        service.get_table_data("b")
+        service.get_table_data("a")
+
+        self.assertEqual(list(key[0] for key in service.table_cache.entries), ["b", "a"])
+        service.get_table_data("b", transform_options=TableTransformOptions(stringify_all=True))
+        self.assertLessEqual(service.table_cache_stats.size_bytes, 4096)
+        self.assertNotIn(("b", None, False, None), service.table_cache.entries)
+
+        big_service = ArrayMateService(table_cache_bytes=100)
+        big_service.load_text('{"rows": [{"id": 1}]}')
+        big_service.get_table_data("rows")
+        self.assertEqual(big_service.table_cache_stats.entries, 0)
+
+    def test_changed_column_transform_is_reapplied_to_that_column_only(self):
+        service = ArrayMateService()
+        service.load_text(
+            '{"rows": [{"cost": "1,5", "qty": "2", "name": "=A1"}, {"cost": "3", "qty": "4", "name": "Bo"}]}'
+        )
+        cost = ColumnTransform(column="cost", data_type="Number", find_text=",", replace_text=".")
+        qty = ColumnTransform(column="qty", data_type="Integer")
+        steps = [
+            TableTransformOptions(stringify_formulas=True),
+            TableTransformOptions(stringify_formulas=True, column_transforms=(cost,)),
+            TableTransformOptions(stringify_formulas=True, column_transforms=(cost, qty)),
+            TableTransformOptions(stringify_formulas=True, column_transforms=(cost, ColumnTransform(column="qty", data_type="Text"))),
+            TableTransformOptions(stringify_formulas=True, column_transforms=(qty,)),
+            TableTransformOptions(stringify_formulas=True),
+        ]
+
+        for options in steps:
+            rows = service.get_table_data("rows", transform_options=options)
+            self.assertEqual(rows, apply_table_transform_options(service.get_array_data("rows"), options))
+
+        base_rows = service.get_table_data("rows")
+        self.assertEqual(base_rows[0], {"cost": "1,5", "qty": "2", "name": "=A1"})
+
+    def test_preview_of_a_transform_edit_re_derives_only_the_changed_column(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"cost": "1,5", "qty": "2"}, {"cost": "3", "qty": "4"}]}')
+        cost = ColumnTransform(column="cost", data_type="Number", find_text=",", replace_text=".")
+        qty = ColumnTransform(column="qty", data_type="Integer")
+        with_cost = TableTransformOptions(column_transforms=(cost,))
+        with_both = TableTransformOptions(column_transforms=(cost, qty))
+
+        service.get_table_preview("rows", transform_options=with_cost)
+        preview = service.get_table_preview("rows", transform_options=with_both)
+
+        self.assertEqual(preview.preview_rows, ({"cost": Decimal("1.5"), "qty": 2}, {"cost": Decimal("3"), "qty": 4}))
+        cost_rows = service.table_cache.peek(("rows", None, False, with_cost))
+        both_rows = service.table_cache.peek(("rows", None, False, with_both))
+        self.assertIs(both_rows[0]["cost"], cost_rows[0]["cost"])
+
+    def test_reapplied_column_transform_reports_conversion_errors(self):
+        service = ArrayMateService()
+        service.load_text('{"rows": [{"cost": "1"}, {"cost": "x"}]}')
+        service.get_table_data("rows", transform_options=TableTransformOptions(column_transforms=(ColumnTransform(column="cost"),)))
+
+        with self.assertRaisesRegex(ArrayMateCoreError, "Cannot convert 'x' to number"):
+            service.get_table_data(
+                "rows",
+                transform_options=TableTransformOptions(column_transforms=(ColumnTransform(column="cost", data_type="Number"),)),
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
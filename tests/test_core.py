@@ -1,24 +1,48 @@
+import csv
+import io
 import json
+import sys
 import unittest
+import zipfile
 from decimal import Decimal
 from pathlib import Path
 
+from openpyxl import load_workbook
+
 from arraymate.core import (
     ArrayMateCoreError,
     ColumnTransform,
+    JSON_STYLES,
+    JsonNode,
+    LazyJsonNode,
     OutputFormat,
     TableTransformOptions,
+    WILDCARD,
+    analyze_json,
+    analyze_json_file,
     apply_table_transform_options,
+    build_array_path_index,
     build_json_tree,
     build_table_preview,
     build_output_path,
+    check_json_syntax,
     discover_array_candidates,
     find_arrays,
     get_array_data,
+    get_array_data_by_path,
     infer_column_transform_types,
+    infer_table_transform_types,
     is_spreadsheet_formula_text,
+    iter_array_data_with_parent_metadata,
+    iter_array_paths,
+    iter_json_events,
+    iter_json_file_array_items,
+    iter_table_transform_options,
+    parse_json_text,
     records_to_dataframe,
     summarize_array,
+    table_column_names,
+    validate_column_transforms,
     write_array_to_file,
 )
 
@@ -70,9 +94,38 @@ class JsonPathTests(unittest.TestCase):
         self.assertEqual(find_arrays(data), ["root"])
         self.assertEqual(get_array_data(data, "root"), [{"id": 1}])
 
+    def test_array_paths_are_found_beyond_the_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 100
+        data = {"rows": [{"id": 1, "tags": [{"name": "a"}]}, {"id": 2, "tags": []}]}
+        for level in range(depth):
+            data = {"next": data, "level": level}
+        rows_path = ("next",) * depth + ("rows",)
+
+        self.assertEqual(iter_array_paths(data), [rows_path, rows_path + (0, "tags"), rows_path + (1, "tags")])
+        self.assertEqual(find_arrays(data)[0], "next." * depth + "rows")
+        self.assertEqual(get_array_data(data, find_arrays(data)[2]), [])
+        self.assertEqual(get_array_data_by_path(data, rows_path + (WILDCARD, "tags")), [{"name": "a"}])
+        self.assertEqual(
+            list(iter_array_data_with_parent_metadata(data, rows_path + (WILDCARD, "tags"))),
+            [{"name": "a", "id": 1}],
+        )
+
     def test_get_array_data_returns_none_for_missing_path(self):
         self.assertIsNone(get_array_data({"users": []}, "orders"))
 
+    def test_array_path_index_resolves_every_discovered_array(self):
+        data = {
+            "orders": [{"items": [{"sku": "A"}]}, {"items": [], "notes": [[{"text": "x"}]]}],
+            "obj": {"line.items": [1, 2], "line": {"items": [{"id": 1}]}},
+        }
+
+        index = build_array_path_index(data)
+
+        self.assertEqual(list(index.paths), find_arrays(data))
+        self.assertIs(index.arrays["orders[1].items"], data["orders"][1]["items"])
+        for array_path in find_arrays(data) + ["missing", "root"]:
+            self.assertIs(get_array_data(data, array_path, index), get_array_data(data, array_path))
+
 
 class ConversionTests(unittest.TestCase):
     def test_summarize_array_describes_objects(self):
@@ -90,6 +143,24 @@ class ConversionTests(unittest.TestCase):
         with self.assertRaisesRegex(ArrayMateCoreError, "objects"):
             records_to_dataframe(["one", "two"])
 
+    def test_records_to_dataframe_shares_the_source_rows(self):
+        rows = [{"id": 1, "name": "Ada"}, {"email": "e", "id": 2}]
+
+        table = records_to_dataframe(rows)
+
+        self.assertIs(table.rows[0], rows[0])
+        self.assertEqual(table.columns, ("id", "name", "email"))
+        self.assertEqual(list(table.iter_rows()), [(1, "Ada", None), (2, None, "e")])
+
+    def test_table_column_names_merges_row_shapes_in_first_seen_order(self):
+        rows = [{"id": 1, "name": "Ada"}, {"id": 2, "name": "Grace"}, {"email": "e", "id": 3}, "skip", {"id": 4}]
+
+        columns = table_column_names(rows)
+
+        self.assertEqual(columns, ("id", "name", "email"))
+        rows[0] = {"role": "admin"}
+        self.assertEqual(table_column_names(rows), ("role", "id", "name", "email"))
+
     def test_build_output_path_appends_extension(self):
         output_path = build_output_path("out", "users", ".csv")
 
@@ -109,6 +180,128 @@ class ConversionTests(unittest.TestCase):
         finally:
             output_path.unlink(missing_ok=True)
 
+    def test_write_sparse_rows_to_csv_and_json(self):
+        rows = [{"id": 1, "name": "Ada"}, {"id": 2, "amount": Decimal("1.50")}]
+        csv_path = Path("test_core_sparse.csv")
+        json_path = Path("test_core_sparse.json")
+        try:
+            write_array_to_file(rows, str(csv_path), OutputFormat(label="CSV", extension=".csv"))
+            written = write_array_to_file(rows, str(json_path), OutputFormat(label="JSON", extension=".json"))
+
+            self.assertEqual((written.columns, len(written)), (("id", "name", "amount"), 2))
+            self.assertEqual(csv_path.read_text(encoding="utf-8").splitlines(), ["id,name,amount", "1,Ada,", "2,,1.50"])
+            self.assertEqual(
+                json.loads(json_path.read_text(encoding="utf-8")),
+                [{"id": 1, "name": "Ada"}, {"id": 2, "amount": "1.50"}],
+            )
+        finally:
+            csv_path.unlink(missing_ok=True)
+            json_path.unlink(missing_ok=True)
+
+    def test_write_array_to_excel_file(self):
+        output_path = Path("test_core_users.xlsx")
+        try:
+            write_array_to_file(
+                [{"id": 1, "name": "Ada"}, {"id": 2, "price": Decimal("1.50"), "tags": ["a"]}],
+                str(output_path),
+                OutputFormat(label="Excel", extension=".xlsx"),
+            )
+
+            worksheet = load_workbook(output_path)["Data"]
+            self.assertEqual(
+                [list(row) for row in worksheet.iter_rows(values_only=True)],
+                [["id", "name", "price", "tags"], [1, "Ada", None, None], [2, None, "1.50", '["a"]']],
+            )
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_native_excel_writer_round_trips_through_openpyxl(self):
+        output_path = Path("test_core_native.xlsx")
+        rows = [
+            {"status": "Open", "count": 3, "ratio": 0.25, "active": True, "note": " <padded> & "},
+            {"status": "Open", "count": 2**40, "price": Decimal("1.50"), "active": False, "tags": ["a"]},
+            {"status": "Closed", "ratio": float("nan")},
+        ]
+        try:
+            write_array_to_file(rows, str(output_path), OutputFormat(label="Excel", extension=".xlsx"), excel_writer="native")
+
+            worksheet = load_workbook(output_path)["Data"]
+            self.assertEqual(
+                [list(row) for row in worksheet.iter_rows(values_only=True)],
+                [
+                    ["status", "count", "ratio", "active", "note", "price", "tags"],
+                    ["Open", 3, 0.25, True, " <padded> & ", None, None],
+                    ["Open", 2**40, None, False, None, "1.50", '["a"]'],
+                    ["Closed", None, None, None, None, None, None],
+                ],
+            )
+            with zipfile.ZipFile(output_path) as archive:
+                self.assertEqual(archive.read("xl/sharedStrings.xml").count(b"<si>"), 12)
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_excel_writers_agree_on_non_finite_floats(self):
+        rows = [{"id": 1, "low": float("-inf"), "high": float("inf"), "ratio": float("nan")}, {"id": 2, "ratio": 0.5}]
+        written = {}
+        for excel_writer in ("openpyxl", "native"):
+            output_path = Path(f"test_core_non_finite_{excel_writer}.xlsx")
+            try:
+                write_array_to_file(rows, str(output_path), OutputFormat(label="Excel", extension=".xlsx"), excel_writer=excel_writer)
+                written[excel_writer] = [list(row) for row in load_workbook(output_path)["Data"].iter_rows(values_only=True)]
+            finally:
+                output_path.unlink(missing_ok=True)
+
+        self.assertEqual(written["native"], written["openpyxl"])
+        self.assertEqual(written["native"][1:], [[1, None, None, None], [2, None, None, 0.5]])
+
+    def test_native_excel_writer_rejects_control_characters(self):
+        output_path = Path("test_core_native_invalid.xlsx")
+        try:
+            with self.assertRaisesRegex(ArrayMateCoreError, "control characters"):
+                write_array_to_file(
+                    [{"name": "bad\x01"}], str(output_path), OutputFormat(label="Excel", extension=".xlsx"), excel_writer="native"
+                )
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_failed_export_keeps_existing_file(self):
+        output_path = Path("test_core_existing.csv")
+        output_path.write_text("id\n1\n", encoding="utf-8")
+        try:
+            for rows in ([], [{"id": 2}, "not an object"]):
+                with self.subTest(rows=rows), self.assertRaises(ArrayMateCoreError):
+                    write_array_to_file(rows, str(output_path), OutputFormat(label="CSV", extension=".csv"), columns=("id",))
+
+                self.assertEqual(output_path.read_text(encoding="utf-8"), "id\n1\n")
+            self.assertEqual(list(Path(".").glob(f".{output_path.name}.*")), [])
+        finally:
+            output_path.unlink(missing_ok=True)
+
+    def test_write_array_to_json_styles(self):
+        rows = [
+            {"id": 1, "price": Decimal("1.50"), "lines": [{"sku": "A", "qty": Decimal("2")}], "note": "a\nb"},
+            {"id": 2, "empty": {}, "tags": []},
+        ]
+        expected_rows = json.loads(json.dumps(rows, default=str))
+        output_path = Path("test_core_styles.json")
+        json_format = OutputFormat(label="JSON", extension=".json")
+        try:
+            write_array_to_file(rows, str(output_path), json_format)
+            self.assertEqual(
+                output_path.read_text(encoding="utf-8"),
+                json.dumps(expected_rows, ensure_ascii=False, indent=2),
+            )
+
+            write_array_to_file(rows, str(output_path), json_format, json_style="compact")
+            self.assertEqual(output_path.read_text(encoding="utf-8").count("\n"), 0)
+            self.assertEqual(json.loads(output_path.read_text(encoding="utf-8")), expected_rows)
+
+            write_array_to_file(rows, str(output_path), json_format, json_style="lines")
+            lines = output_path.read_text(encoding="utf-8").splitlines()
+            self.assertEqual([json.loads(line) for line in lines], expected_rows)
+        finally:
+            output_path.unlink(missing_ok=True)
+
     def test_stringify_everything_keeps_rows_but_turns_values_to_text(self):
         rows = [{"id": 1, "amount": -9.5, "active": True, "empty": None, "nested": {"sku": "A"}}]
 
@@ -161,6 +354,20 @@ class ConversionTests(unittest.TestCase):
 
         self.assertEqual(transformed, [{"cost": Decimal("12.50"), "name": "Widget"}, {"cost": Decimal("3.25"), "name": "Cable"}])
 
+    def test_compiled_transforms_escape_nested_values_and_reuse_plan(self):
+        options = TableTransformOptions(
+            stringify_formulas=True,
+            column_transforms=(ColumnTransform(column="code", data_type="Keep", find_text="x", replace_text="="),),
+        )
+        rows = [{"code": "x1", "nested": {"items": ["=A1", 2]}, "amount": Decimal("1.5"), "flag": None}]
+
+        first = apply_table_transform_options(rows, options)
+        second = list(iter_table_transform_options(rows, TableTransformOptions(**vars(options))))
+
+        self.assertEqual(first, [{"code": "'=1", "nested": {"items": ["'=A1", 2]}, "amount": Decimal("1.5"), "flag": None}])
+        self.assertEqual(second, first)
+        self.assertEqual(rows[0]["nested"], {"items": ["=A1", 2]})
+
     def test_column_transform_can_output_text_after_replace(self):
         rows = [{"cost": "12.50"}]
 
@@ -189,6 +396,33 @@ class ConversionTests(unittest.TestCase):
         finally:
             output_path.unlink(missing_ok=True)
 
+    def test_nested_cells_are_written_beyond_the_recursion_limit(self):
+        # Each level is an object and an array, 5000 containers in all.
+        depth = sys.getrecursionlimit() * 5 // 2
+        deep_value = Decimal("1.5")
+        for _ in range(depth):
+            deep_value = {"a": [deep_value]}
+        rows = [{"id": 1, "deep": deep_value}]
+        deep_text = '{"a": [' * depth + '"1.5"' + "]}" * depth
+        stringify_all = TableTransformOptions(stringify_all=True)
+
+        self.assertEqual(apply_table_transform_options(rows, stringify_all)[0]["deep"], deep_text)
+        csv_path = Path("test_core_deep.csv")
+        json_path = Path("test_core_deep.json")
+        try:
+            write_array_to_file(rows, str(csv_path), OutputFormat(label="CSV", extension=".csv"))
+            with csv_path.open(newline="", encoding="utf-8") as file:
+                self.assertEqual(list(csv.reader(file))[1], ["1", deep_text])
+            for json_style in JSON_STYLES:
+                with self.subTest(json_style=json_style):
+                    write_array_to_file(rows, str(json_path), OutputFormat(label="JSON", extension=".json"), json_style=json_style)
+                    text = json_path.read_text(encoding="utf-8")
+                    written = [parse_json_text(line) for line in text.splitlines()] if json_style == "lines" else parse_json_text(text)
+                    self.assertEqual(apply_table_transform_options(written, stringify_all)[0]["deep"], deep_text)
+        finally:
+            csv_path.unlink(missing_ok=True)
+            json_path.unlink(missing_ok=True)
+
     def test_column_transform_reports_invalid_number_conversion(self):
         rows = [{"cost": "not a number"}]
 
@@ -207,6 +441,46 @@ class ConversionTests(unittest.TestCase):
                 TableTransformOptions(column_transforms=(ColumnTransform(column="cost", data_type="Integer"),)),
             )
 
+    def test_validate_column_transforms_reports_first_failing_value(self):
+        rows = [{"cost": str(index), "flag": "yes"} for index in range(10)]
+        rows[3]["flag"] = "maybe"
+        rows[6]["cost"] = "n/a"
+        options = TableTransformOptions(
+            column_transforms=(
+                ColumnTransform(column="cost", data_type="Number"),
+                ColumnTransform(column="flag", data_type="Boolean"),
+            )
+        )
+
+        issue = validate_column_transforms(rows, options)
+
+        self.assertEqual((issue.row_index, issue.column, issue.value), (3, "flag", "maybe"))
+        self.assertEqual(issue.message, "Row 4, column 'flag': Cannot convert 'maybe' to boolean")
+        self.assertEqual(validate_column_transforms(rows, options, columns=["cost"]).row_index, 6)
+        self.assertIsNone(validate_column_transforms(rows, options, columns=["cost"], sample_size=2))
+        self.assertEqual(validate_column_transforms(rows, options, columns=["cost"], sample_size=5).row_index, 6)
+        self.assertIsNone(validate_column_transforms(rows, TableTransformOptions(stringify_all=True)))
+
+    def test_infer_table_transform_types_probes_all_columns_in_one_sweep(self):
+        rows = [
+            {"id": "1_000", "ratio": "1,5", "flag": "Y", "note": "n/a", "blank": "", "nan": Decimal("NaN")},
+            {"id": 2, "ratio": 0.25, "flag": 0, "note": "1e3", "nan": "sNaN"},
+            {"id": "+3", "ratio": "inf", "flag": "no", "extra": "  "},
+        ]
+
+        types = infer_table_transform_types(rows)
+
+        self.assertEqual(list(types), ["id", "ratio", "flag", "note", "blank", "nan", "extra"])
+        self.assertEqual(types["id"], ("Keep", "Text", "Number", "Integer"))
+        self.assertEqual(types["ratio"], ("Keep", "Text", "Number"))
+        self.assertEqual(types["flag"], ("Keep", "Text", "Boolean"))
+        self.assertEqual(types["note"], ("Keep", "Text"))
+        self.assertEqual(types["blank"], ("Keep", "Text", "Number", "Integer", "Boolean"))
+        self.assertEqual(types["nan"], ("Keep", "Text", "Number"))
+        self.assertEqual(types["extra"], ("Keep", "Text", "Number", "Integer"))
+        for column, column_types in types.items():
+            self.assertEqual(infer_column_transform_types(rows, column), column_types)
+
     def test_infer_column_transform_types_limits_impossible_choices(self):
         rows = [
             {"name": "John Doe", "enabled": "true", "amount": "12.5", "count": "3"},
@@ -238,6 +512,45 @@ class DiscoveryModelTests(unittest.TestCase):
         self.assertTrue(orders.exportable)
         self.assertEqual(child_paths, ["orders[*].id", "orders[*].items", "orders[*].warnings"])
 
+    def test_json_tree_is_built_on_first_access_and_equals_plain_nodes(self):
+        data = {"meta": {"source": "api"}, "rows": [{"id": 1}, {"id": 2, "tags": ["a"]}]}
+
+        tree = build_json_tree(data)
+        data["meta"]["version"] = 2
+        rows = tree.children[1]
+
+        self.assertIsInstance(tree, LazyJsonNode)
+        self.assertEqual([child.label for child in tree.children[0].children], ["source", "version"])
+        self.assertEqual((rows.item_count, rows.exportable, rows.has_nested_arrays), (2, True, True))
+        self.assertEqual(
+            rows.children[0],
+            JsonNode(path=("rows", Ellipsis, "id"), display_path="rows[*].id", label="id", kind="number", depth=3),
+        )
+        self.assertEqual(
+            JsonNode(path=("rows", Ellipsis, "id"), display_path="rows[*].id", label="id", kind="number", depth=3),
+            rows.children[0],
+        )
+        self.assertEqual(rows.children[1].source_count, 1)
+
+    def test_wildcard_children_skip_rows_missing_any_key_on_the_path(self):
+        data = {
+            "orders": [
+                {"customer": {"address": {"city": "Oslo"}}, "items": [{"lots": [{"qty": 1}, {"qty": 2}]}]},
+                {"customer": {"address": {"zip": 1}}, "items": [{"lots": []}, {"sku": "B"}]},
+                {"customer": {}, "items": [{"lots": [{"qty": 3}]}]},
+                {"customer": {"address": {"city": None}}, "items": []},
+            ]
+        }
+
+        tree = build_json_tree(data)
+        orders = tree.children[0]
+        city = orders.children[0].children[0].children[0]
+        lots = orders.children[1].children[0]
+
+        self.assertEqual((city.display_path, city.kind), ("orders[*].customer.address.city", "mixed"))
+        self.assertEqual((lots.display_path, lots.item_count, lots.source_count), ("orders[*].items[*].lots", 3, 3))
+        self.assertEqual([child.display_path for child in lots.children], ["orders[*].items[*].lots[*].qty"])
+
     def test_discover_array_candidates_classifies_exportability(self):
         data = {
             "users": [{"name": "Ada"}],
@@ -272,6 +585,104 @@ class DiscoveryModelTests(unittest.TestCase):
         self.assertEqual(candidates["orders[*].items"].item_count, 3)
         self.assertEqual(candidates["orders[*].items"].source_count, 2)
 
+    def test_analyze_json_matches_separate_discovery_passes(self):
+        for sample_path in sorted(Path(__file__).resolve().parent.parent.glob("sample_data_*.json")):
+            try:
+                data = json.loads(sample_path.read_text(encoding="utf-8"), parse_float=Decimal)
+            except json.JSONDecodeError:
+                continue
+            with self.subTest(sample=sample_path.name):
+                analysis = analyze_json(data)
+
+                self.assertEqual(analysis.array_keys, find_arrays(data))
+                self.assertEqual(analysis.json_tree, build_json_tree(data))
+                self.assertEqual(analysis.array_candidates, discover_array_candidates(data))
+
+    def test_analyze_json_collects_arrays_nested_in_arrays_and_mixed_values(self):
+        data = [[{"a": [1]}], {"b": {"c": []}, "d": [{"e": [{"f": 1}]}, 5]}]
+
+        analysis = analyze_json(data)
+
+        self.assertEqual(analysis.array_keys, find_arrays(data))
+        self.assertEqual(analysis.array_candidates, discover_array_candidates(data))
+        self.assertTrue(analysis.json_tree.has_nested_arrays)
+
+    def test_nested_arrays_are_detected_at_the_end_of_deep_object_chains(self):
+        def chain(depth, leaf):
+            return leaf if depth == 0 else {"level": chain(depth - 1, leaf), "note": depth}
+
+        data = {"rows": [{"id": 1, "deep": chain(12, {"value": 1})}, {"id": 2, "deep": chain(12, {"tags": [1]})}]}
+
+        analysis = analyze_json(data)
+        candidates = {candidate.display_path: candidate for candidate in analysis.array_candidates}
+
+        self.assertEqual(analysis.array_candidates, discover_array_candidates(data))
+        self.assertEqual(candidates["rows"].warning, "Contains nested arrays")
+        self.assertIn("rows[*].deep" + ".level" * 12 + ".tags", candidates)
+        self.assertTrue(build_json_tree(data).children[0].has_nested_arrays)
+        self.assertFalse(build_json_tree({"rows": [{"deep": chain(12, {"value": 1})}]}).children[0].has_nested_arrays)
+
+    def test_discovery_handles_nesting_beyond_the_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 100
+        data = {"rows": [{"id": 1, "tags": [1]}]}
+        for _ in range(depth):
+            data = {"next": data}
+        nested_lists = [{"id": 1}]
+        for _ in range(depth):
+            nested_lists = [nested_lists]
+
+        candidates = analyze_json(data).array_candidates
+
+        self.assertEqual([candidate.depth for candidate in candidates], [depth + 1, depth + 3])
+        self.assertEqual(candidates[0].path, ("next",) * depth + ("rows",))
+        self.assertTrue(candidates[0].has_nested_arrays)
+        self.assertEqual(candidates, discover_array_candidates(data))
+        self.assertEqual(analyze_json(nested_lists).array_keys, ["root"])
+        self.assertTrue(analyze_json(nested_lists).array_candidates[0].has_nested_arrays)
+
+    def test_copied_items_are_not_reported_as_estimated(self):
+        class CopyingJsonNode(LazyJsonNode):
+            @property
+            def _items(self):
+                return list(self._all_items)
+
+        data = {"orders": [{"items": [{"sku": "A"}, {"sku": "B"}]}, {"items": [{"sku": "C"}]}]}
+
+        candidates = discover_array_candidates(data)
+        tree = CopyingJsonNode((data,), (), "root")
+        orders = tree.children[0]
+        items = orders.children[0]
+
+        self.assertFalse(orders.estimated)
+        self.assertFalse(items.estimated)
+        self.assertEqual(items.item_count, 3)
+        self.assertEqual(items, build_json_tree(data).children[0].children[0])
+        self.assertFalse(any(candidate.estimated for candidate in candidates))
+
+    def test_sampled_discovery_reads_a_bounded_sample_per_array(self):
+        data = {
+            "rows": [{"id": index, "tags": [{"tag": index}] * 3} for index in range(100)]
+            + [{"id": 100, "late": True, "tags": []}],
+            "small": [{"id": 1}],
+        }
+
+        exact = analyze_json(data).array_candidates
+        sampled = analyze_json(data, sample_size=10)
+        candidates = {candidate.display_path: candidate for candidate in sampled.array_candidates}
+
+        self.assertEqual([candidate.display_path for candidate in exact], list(candidates))
+        self.assertEqual(candidates["rows"].item_count, 101)
+        self.assertIn(candidates["rows"].column_count, (2, 3))
+        self.assertTrue(candidates["rows"].estimated)
+        self.assertTrue(candidates["rows[*].tags"].estimated)
+        self.assertAlmostEqual(candidates["rows[*].tags"].item_count, 300, delta=30)
+        self.assertEqual(candidates["small"], exact[-1])
+        self.assertLess(len(sampled.array_keys), len(find_arrays(data)))
+        self.assertEqual(sampled.array_candidates, discover_array_candidates(data, sample_size=10))
+        self.assertEqual(analyze_json(data, sample_size=1000).array_candidates, exact)
+        with self.assertRaises(ArrayMateCoreError):
+            analyze_json(data, sample_size=0)
+
     def test_build_table_preview_reports_columns_and_nested_values(self):
         preview = build_table_preview(
             [
@@ -288,5 +699,95 @@ class DiscoveryModelTests(unittest.TestCase):
         self.assertEqual(preview.warnings, ("Some columns contain nested records or arrays",))
 
 
+class StreamingReaderTests(unittest.TestCase):
+    def test_iter_json_events_handles_tokens_split_across_chunks(self):
+        text = '{"name": "K\\u00f6ln \\ud83d\\ude80", "values": [1, -2.50, 3e2, true, null], "empty": {}}'
+
+        events = list(iter_json_events(io.StringIO(text), chunk_size=3))
+
+        self.assertEqual(
+            events,
+            [
+                ("start_map", None),
+                ("map_key", "name"),
+                ("value", "K\u00f6ln \U0001f680"),
+                ("map_key", "values"),
+                ("start_array", None),
+                ("value", 1),
+                ("value", Decimal("-2.50")),
+                ("value", Decimal("3e2")),
+                ("value", True),
+                ("value", None),
+                ("end_array", None),
+                ("map_key", "empty"),
+                ("start_map", None),
+                ("end_map", None),
+                ("end_map", None),
+            ],
+        )
+
+    def test_iter_json_events_rejects_invalid_json(self):
+        for text in ("[1,]", '{"a" 1}', "[1] x", "[", ""):
+            with self.subTest(text=text), self.assertRaises(json.JSONDecodeError):
+                list(iter_json_events(io.StringIO(text), chunk_size=2))
+
+    def test_check_json_syntax_matches_json_loads(self):
+        check_json_syntax('{"rows": [{"id": 1, "tags": ["a", {"b": null}]}], "ok": true}')
+        for text in ("[1,]", '{"a" 1}', "[1] x", "[", "", '{"a": [{"b": 1}'):
+            with self.subTest(text=text), self.assertRaises(json.JSONDecodeError) as raised:
+                check_json_syntax(text)
+            with self.assertRaises(json.JSONDecodeError) as expected:
+                json.loads(text)
+            self.assertEqual(raised.exception.pos, expected.exception.pos)
+
+    def test_json_text_nested_beyond_the_recursion_limit_is_parsed(self):
+        depth = sys.getrecursionlimit() * 5
+        json_text = '{"rows": [{"id": 1.50, "deep": ' + '{"a": [' * depth + "null" + "]}" * depth + "}]}"
+
+        check_json_syntax(json_text)
+        data = parse_json_text(json_text)
+        self.assertEqual(data["rows"][0]["id"], Decimal("1.50"))
+        deep_value = data["rows"][0]["deep"]
+        for _ in range(depth):
+            deep_value = deep_value["a"][0]
+        self.assertIsNone(deep_value)
+        self.assertEqual(parse_json_text('{"price": 1.50, "count": 2}'), json.loads('{"price": 1.50, "count": 2}', parse_float=Decimal))
+        for text in (json_text[:-1], json_text + " x", json_text.replace("null", "nul")):
+            with self.subTest(text=text[-8:]), self.assertRaises(json.JSONDecodeError):
+                parse_json_text(text)
+            with self.assertRaises(json.JSONDecodeError):
+                check_json_syntax(text)
+
+    def test_analyze_json_file_matches_in_memory_analysis(self):
+        data = {
+            "orders": [
+                {"id": 1, "items": [{"sku": "A", "lots": [{"lot": 1}]}], "total": 1.5},
+                {"id": 2, "items": [], "note": None},
+                {"id": 3, "items": [{"sku": "B", "extra": [1, 2]}]},
+            ],
+            "tags": ["a", "b"],
+            "meta": {"empty": [], "deep": {"rows": [{"x": 1}, 2]}},
+        }
+        output_path = Path("test_core_streaming_analysis.json")
+        try:
+            output_path.write_text(json.dumps(data), encoding="utf-8")
+
+            analysis = analyze_json_file(str(output_path), chunk_size=5)
+            expected = analyze_json(json.loads(output_path.read_text(encoding="utf-8"), parse_float=Decimal))
+
+            self.assertEqual(analysis.array_keys, expected.array_keys)
+            self.assertEqual(analysis.json_tree, expected.json_tree)
+            self.assertEqual(analysis.array_candidates, expected.array_candidates)
+            self.assertEqual(analysis.array_index.paths, expected.array_index.paths)
+            self.assertEqual(analysis.array_index.arrays, {})
+            self.assertEqual(
+                list(iter_json_file_array_items(str(output_path), ("orders", Ellipsis, "items"), chunk_size=5)),
+                [{"sku": "A", "lots": [{"lot": 1}]}, {"sku": "B", "extra": [1, 2]}],
+            )
+            self.assertEqual(list(iter_json_file_array_items(str(output_path), ("meta", "deep", "rows"))), [{"x": 1}, 2])
+        finally:
+            output_path.unlink(missing_ok=True)
+
+
 if __name__ == "__main__":
     unittest.main()